@@ -2,8 +2,25 @@ import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
 from scipy import optimize
+from scipy import linalg
+from scipy import sparse
+from scipy.sparse import linalg as sparse_linalg
+from scipy import signal
+from scipy.stats import qmc
+from scipy.interpolate import CubicSpline
 import sympy as sp
+import mpmath
 import pandas as pd
+import time
+import io
+from collections import deque
+import os
+import json
+import hashlib
+import tempfile
+import shutil
+import base64
+from PIL import Image
 
 # --- KONFIGURASI HALAMAN ---
 st.set_page_config(
@@ -43,7 +60,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # --- FUNGSI NUMERIK ---
-def parse_expression(expr_str):
+def parse_expression(expr_str, variables=("x",)):
     """Mengubah string input user menjadi fungsi python yang bisa dieksekusi"""
     try:
         # Deteksi kesalahan umum
@@ -65,15 +82,15 @@ def parse_expression(expr_str):
         }
         
         # Buat fungsi lambda yang benar
-        def f(x):
+        def f(*args):
             # Buat namespace baru untuk setiap evaluasi
             namespace = allowed_names.copy()
-            namespace['x'] = x
+            namespace.update(zip(variables, args))
             return eval(expr_str, {"__builtins__": None}, namespace)
         
         # Test dengan array untuk memastikan fungsi bekerja
         test_array = np.array([0.0, 1.0, 2.0])
-        test_result = f(test_array)
+        test_result = f(*[test_array] * len(variables))
         
         # Pastikan hasilnya adalah array
         if not isinstance(test_result, np.ndarray):
@@ -85,7 +102,8 @@ def parse_expression(expr_str):
         st.error(f"❌ **Syntax Error:** Periksa penulisan fungsi Anda. Detail: {e}")
         return None
     except NameError as e:
-        st.error(f"❌ **Name Error:** Variabel atau fungsi tidak dikenal. Gunakan 'x' sebagai variabel. Detail: {e}")
+        nama_var = ", ".join(f"'{v}'" for v in variables)
+        st.error(f"❌ **Name Error:** Variabel atau fungsi tidak dikenal. Gunakan {nama_var} sebagai variabel. Detail: {e}")
         return None
     except TypeError as e:
         st.error(f"❌ **Type Error:** {e}. Gunakan `**` untuk pangkat (x**2), bukan `^`.")
@@ -94,26 +112,74 @@ def parse_expression(expr_str):
         st.error(f"❌ **Error:** {e}")
         return None
 
-def bisection_method(f, a, b, tol, max_iter):
-    """Implementasi Algoritma Bisection"""
-    results = []
+def parse_sympy_expression(expr_str, variables=("x",)):
+    """Mengubah string input user menjadi ekspresi SymPy (untuk turunan dan Jacobian simbolik)"""
+    try:
+        if '^' in expr_str:
+            st.error("❌ Gunakan `**` untuk pangkat, bukan `^`. Contoh: x**2 bukan x^2")
+            return None
+        
+        symbols = {name: sp.Symbol(name) for name in variables}
+        allowed_names = {
+            "sin": sp.sin,
+            "cos": sp.cos,
+            "tan": sp.tan,
+            "exp": sp.exp,
+            "log": sp.log,
+            "sqrt": sp.sqrt,
+            "pi": sp.pi,
+            "e": sp.E,
+            "abs": sp.Abs,
+        }
+        
+        expr = sp.sympify(expr_str, locals={**allowed_names, **symbols})
+        
+        unknown = expr.free_symbols - set(symbols.values())
+        if unknown:
+            names = ", ".join(sorted(str(s) for s in unknown))
+            st.error(f"❌ **Name Error:** Variabel tidak dikenal: {names}. Gunakan {', '.join(variables)}.")
+            return None
+        
+        return expr
+    
+    except (sp.SympifyError, SyntaxError, TypeError) as e:
+        st.error(f"❌ **Syntax Error:** Periksa penulisan fungsi Anda. Detail: {e}")
+        return None
+
+def number_caster(number_type):
+    """Konversi ke tipe bilangan solver: float32 (np.float32), float64 (float bawaan Python),
+    atau mpmath (mpf, presisi mengikuti mpmath.mp.dps)"""
+    if number_type == "float32":
+        return np.float32
+    if number_type == "mpmath":
+        return mpmath.mpf
+    return float
+
+class SolverError(ValueError):
+    """Kegagalan solver iteratif (interval tidak valid, turunan nol, f tidak dapat dievaluasi)"""
+
+def iter_bisection(f, a, b, tol, max_iter, number_type="float64"):
+    """Generator Bisection: menghasilkan (iterasi, a, b, c, f(c)) per langkah dan mengembalikan
+    pesan status saat berhenti. Melempar SolverError jika interval tidak mengurung akar."""
+    num = number_caster(number_type)
+    a, b = num(a), num(b)
     
     try:
-        fa = float(f(a))
-        fb = float(f(b))
+        fa = num(f(a))
+        fb = num(f(b))
     except Exception as e:
-        return None, f"Error mengevaluasi fungsi: {e}"
+        raise SolverError(f"Error mengevaluasi fungsi: {e}") from e
     
     if fa * fb > 0:
-        return None, "⚠️ Akar tidak terdapat dalam interval ini (f(a) dan f(b) harus berlawanan tanda)"
+        raise SolverError("⚠️ Akar tidak terdapat dalam interval ini (f(a) dan f(b) harus berlawanan tanda)")
     
     for i in range(max_iter):
         c = (a + b) / 2
-        fc = float(f(c))
-        results.append((i+1, a, b, c, fc))
+        fc = num(f(c))
+        yield i+1, a, b, c, fc
         
         if abs(fc) < tol or (b - a)/2 < tol:
-            return results, "✅ Konvergen"
+            return "✅ Konvergen"
         
         if fc * fa < 0:
             b = c
@@ -122,762 +188,5174 @@ def bisection_method(f, a, b, tol, max_iter):
             a = c
             fa = fc
     
-    return results, "⚠️ Maksimum iterasi tercapai"
+    return "⚠️ Maksimum iterasi tercapai"
 
-def newton_raphson_method(f, df, x0, tol, max_iter):
-    """Implementasi Algoritma Newton-Raphson"""
-    results = []
-    x = x0
+def iter_newton_raphson(f, df, x0, tol, max_iter, number_type="float64"):
+    """Generator Newton-Raphson: menghasilkan (iterasi, xₙ, f(xₙ), xₙ₊₁, |xₙ₊₁ - xₙ|) per langkah
+    dan mengembalikan pesan status. Melempar SolverError jika turunan mendekati nol."""
+    num = number_caster(number_type)
+    x = num(x0)
     
     for i in range(max_iter):
         try:
-            fx = float(f(x))
-            dfx = float(df(x))
+            fx = num(f(x))
+            dfx = num(df(x))
         except Exception as e:
-            return None, f"Error mengevaluasi fungsi: {e}"
+            raise SolverError(f"Error mengevaluasi fungsi: {e}") from e
         
         if abs(dfx) < 1e-10:
-            return None, "⚠️ Turunan mendekati nol (pembagian dengan nol)"
+            raise SolverError("⚠️ Turunan mendekati nol (pembagian dengan nol)")
         
         x_new = x - fx / dfx
-        results.append((i+1, x, fx, x_new, abs(x_new - x)))
+        yield i+1, x, fx, x_new, abs(x_new - x)
         
         if abs(x_new - x) < tol:
-            return results, "✅ Konvergen"
+            return "✅ Konvergen"
         
         x = x_new
     
-    return results, "⚠️ Maksimum iterasi tercapai"
+    return "⚠️ Maksimum iterasi tercapai"
 
-def secant_method(f, x0, x1, tol, max_iter):
-    """Implementasi Algoritma Secant"""
-    results = []
+def iter_secant(f, x0, x1, tol, max_iter, number_type="float64"):
+    """Generator Secant: menghasilkan (iterasi, xₙ₋₁, xₙ, xₙ₊₁, f(xₙ₊₁)) per langkah dan
+    mengembalikan pesan status. f(xₙ₊₁) dipakai ulang sebagai f(xₙ) langkah berikutnya,
+    sehingga hanya satu evaluasi f baru per iterasi."""
+    num = number_caster(number_type)
+    x0, x1 = num(x0), num(x1)
+    
+    try:
+        f0 = num(f(x0))
+        f1 = num(f(x1))
+    except Exception as e:
+        raise SolverError(f"Error mengevaluasi fungsi: {e}") from e
     
     for i in range(max_iter):
-        try:
-            f0 = float(f(x0))
-            f1 = float(f(x1))
-        except Exception as e:
-            return None, f"Error mengevaluasi fungsi: {e}"
-        
         if abs(f1 - f0) < 1e-10:
-            return None, "⚠️ Pembagian dengan nol"
+            raise SolverError("⚠️ Pembagian dengan nol")
         
         x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
-        f2 = float(f(x2))
-        results.append((i+1, x0, x1, x2, f2))
+        try:
+            f2 = num(f(x2))
+        except Exception as e:
+            raise SolverError(f"Error mengevaluasi fungsi: {e}") from e
+        yield i+1, x0, x1, x2, f2
         
         if abs(x2 - x1) < tol:
-            return results, "✅ Konvergen"
+            return "✅ Konvergen"
         
         x0, x1 = x1, x2
+        f0, f1 = f1, f2
     
-    return results, "⚠️ Maksimum iterasi tercapai"
+    return "⚠️ Maksimum iterasi tercapai"
 
-# --- SIDEBAR NAVIGASI ---
-st.sidebar.title("📚 Menu Materi")
-menu = st.sidebar.radio(
-    "Navigasi Pembelajaran:",
-    ["🏠 Beranda", "🔍 Analisis Galat", "🎯 Akar Persamaan", "🧮 Sistem Linear", "📈 Interpolasi", "⚙️ Integral & PDB"]
-)
+def collect_iterations(iterations, max_records=None, on_record=None):
+    """Menjalankan generator solver sampai selesai dan mengembalikan (records, pesan) seperti API lama;
+    (None, pesan) jika solver gagal. max_records membatasi memori dengan hanya menyimpan record
+    terakhir (max_records=1: hanya keadaan akhir). on_record(record) dipanggil setiap iterasi; jika
+    mengembalikan pesan, generator ditutup dan pesan itu menjadi status (berhenti lebih awal)."""
+    records = deque(maxlen=max_records)
+    try:
+        while True:
+            record = next(iterations)
+            records.append(record)
+            if on_record is not None:
+                pesan_berhenti = on_record(record)
+                if pesan_berhenti:
+                    iterations.close()
+                    return list(records), pesan_berhenti
+    except StopIteration as stop:
+        return list(records), stop.value
+    except SolverError as e:
+        return None, str(e)
 
-# --- HALAMAN 1: BERANDA ---
-if menu == "🏠 Beranda":
-    st.markdown('<div class="main-header">Metode Numerik Companion</div>', unsafe_allow_html=True)
-    st.markdown("---")
+def bisection_method(f, a, b, tol, max_iter, number_type="float64"):
+    """Implementasi Algoritma Bisection (number_type: float32, float64, atau mpmath)"""
+    return collect_iterations(iter_bisection(f, a, b, tol, max_iter, number_type))
+
+def newton_raphson_method(f, df, x0, tol, max_iter, number_type="float64"):
+    """Implementasi Algoritma Newton-Raphson (number_type: float32, float64, atau mpmath)"""
+    return collect_iterations(iter_newton_raphson(f, df, x0, tol, max_iter, number_type))
+
+def secant_method(f, x0, x1, tol, max_iter, number_type="float64"):
+    """Implementasi Algoritma Secant (number_type: float32, float64, atau mpmath)"""
+    return collect_iterations(iter_secant(f, x0, x1, tol, max_iter, number_type))
+
+def stream_iterations(iterations, columns, time_budget=None, error_index=4, refresh=0.2, tail_rows=10, plot_points=2000):
+    """Menjalankan generator solver sambil menampilkan secara langsung (paling sering setiap `refresh`
+    detik) plot konvergensi |kolom error_index| per iterasi dan tabel iterasi terakhir. Iterasi
+    dihentikan lebih awal jika time_budget (detik) terlampaui. Mengembalikan (records, pesan)."""
+    live = st.empty()
+    ekor = deque(maxlen=tail_rows)
+    riwayat = deque(maxlen=plot_points)
+    t_start = time.perf_counter()
+    terakhir = [t_start]
     
-    st.markdown("""
-    ### Selamat Datang, Insinyur Muda! 👋
+    def tampilkan(record):
+        ekor.append(record)
+        riwayat.append((record[0], abs(float(record[error_index]))))
+        sekarang = time.perf_counter()
+        
+        if sekarang - terakhir[0] >= refresh:
+            terakhir[0] = sekarang
+            iterasi, galat = zip(*riwayat)
+            fig_live = go.Figure(go.Scatter(x=iterasi, y=galat, mode='lines+markers', name=columns[error_index]))
+            fig_live.update_layout(
+                title=f"⏳ Iterasi {record[0]:,} ({sekarang - t_start:.1f} s)",
+                xaxis_title='Iterasi',
+                yaxis_title=columns[error_index],
+                yaxis_type='log',
+                height=300
+            )
+            with live.container():
+                st.plotly_chart(fig_live, use_container_width=True)
+                st.dataframe(pd.DataFrame([tuple(map(float, r)) for r in ekor], columns=columns), use_container_width=True)
+        
+        if time_budget and sekarang - t_start > time_budget:
+            return f"⚠️ Dihentikan: batas waktu {time_budget:g} s tercapai setelah {record[0]:,} iterasi"
     
-    Ini adalah teman belajar interaktif untuk mata kuliah **Metode Numerik (ELT60214)**. 
-    Aplikasi ini dirancang untuk membantu Anda memahami bagaimana komputer menyelesaikan 
-    masalah matematika yang "terlalu sulit" diselesaikan dengan tangan.
-    """)
+    try:
+        return collect_iterations(iterations, on_record=tampilkan)
+    finally:
+        live.empty()
+
+def batch_solve(A, b, mem_budget_mb=64):
+    """Menyelesaikan k sistem n×n sekaligus (A: (k, n, n), b: (k, n)) dengan
+    broadcasting np.linalg.solve, diproses per chunk sesuai anggaran memori"""
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
     
-    st.markdown('<div class="concept-box">', unsafe_allow_html=True)
-    st.markdown("""
-    ### 💡 Konsep Feynman: Mengapa Kita Butuh Ini?
+    if A.ndim != 3 or A.shape[1] != A.shape[2]:
+        raise ValueError(f"Array koefisien harus berukuran (k, n, n), diterima {A.shape}")
+    if b.shape != A.shape[:2]:
+        raise ValueError(f"Array ruas kanan harus berukuran {A.shape[:2]}, diterima {b.shape}")
     
-    Bayangkan Anda ingin menghitung luas area kolam renang yang berbentuk sangat aneh, 
-    bukan lingkaran atau kotak biasa. Rumus Luas = panjang × lebar tidak bisa digunakan. 
+    k, n, _ = A.shape
     
-    Di sinilah **Metode Numerik** berperan. Alih-alih mencari satu jawaban "tepat" 
-    (yang mungkin tidak ada), kita mencari jawaban "cukup dekat" yang bisa diterima 
-    dalam dunia teknik.
+    # Perkiraan memori kerja per sistem: salinan LU, faktor SVD untuk cond, vektor kerja
+    bytes_per_system = 8 * (3 * n * n + 6 * n)
+    chunk_size = max(1, int(mem_budget_mb * 1024**2 // bytes_per_system))
     
-    **Prinsip Utama:** 
-    > Approximation (Pendekatan) + Iterasi (Pengulangan) = Solusi
-    """)
-    st.markdown('</div>', unsafe_allow_html=True)
+    x = np.full((k, n), np.nan)
+    det = np.empty(k)
+    cond = np.empty(k)
+    residual = np.full(k, np.nan)
     
-    col1, col2, col3 = st.columns(3)
+    for start in range(0, k, chunk_size):
+        sl = slice(start, min(start + chunk_size, k))
+        A_c, b_c = A[sl], b[sl]
+        
+        det[sl] = np.linalg.det(A_c)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cond_c = np.linalg.cond(A_c)
+        cond_c[~np.isfinite(cond_c)] = np.inf
+        cond[sl] = cond_c
+        
+        # Sistem singular dilewati agar tidak menggagalkan seluruh chunk
+        ok = cond_c < 1 / np.finfo(float).eps
+        if not np.any(ok):
+            continue
+        
+        x_c = np.linalg.solve(A_c[ok], b_c[ok][..., None])[..., 0]
+        r_c = np.einsum('kij,kj->ki', A_c[ok], x_c) - b_c[ok]
+        
+        idx = np.arange(sl.start, sl.stop)[ok]
+        x[idx] = x_c
+        residual[idx] = np.max(np.abs(r_c), axis=1)
     
-    with col1:
-        st.info("🔍 **Analisis Galat**\n\nBelajar mengukur seberapa akurat hasil perhitungan numerik")
+    n_chunks = -(-k // chunk_size)
+    return {
+        "x": x,
+        "det": det,
+        "cond": cond,
+        "residual": residual,
+        "chunk_size": chunk_size,
+        "n_chunks": n_chunks,
+    }
+
+# File server hanya boleh dibaca dari direktori data ini (pengunjung aplikasi tidak bebas memilih path)
+DATA_DIR = os.environ.get(
+    "NUMERIK_DATA_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+)
+
+def resolve_data_path(name):
+    """Path absolut file `name` di dalam DATA_DIR. Path absolut atau '..' yang keluar dari
+    direktori data (termasuk lewat symlink) ditolak dengan ValueError."""
+    base = os.path.realpath(DATA_DIR)
+    path = os.path.realpath(os.path.join(base, name))
+    if os.path.commonpath([base, path]) != base:
+        raise ValueError(f"Path harus berada di dalam direktori data ({DATA_DIR})")
+    return path
+
+def ooc_panel_width(n, mem_budget_mb):
+    """Lebar panel agar panel, satu blok kolom, dan hasil update-nya (masing-masing n × nb) muat dalam anggaran"""
+    nb = int(mem_budget_mb * 1024**2 // (3 * 8 * n))
+    return max(1, min(nb, n))
+
+def create_test_matrix_file(path, n, seed=0, mem_budget_mb=256):
+    """Membuat matriks padat n×n bergaya boundary-element di file .npy, ditulis per blok baris"""
+    A = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=(n, n))
+    rng = np.random.default_rng(seed)
+    rows = ooc_panel_width(n, mem_budget_mb)
+    j = np.arange(n)
     
-    with col2:
-        st.success("🎯 **Akar Persamaan**\n\nMencari nilai x dimana f(x) = 0")
+    for start in range(0, n, rows):
+        i = np.arange(start, min(start + rows, n))[:, None]
+        block = 1.0 / (1.0 + np.abs(i - j)) + 0.1 * rng.random((len(i), n))
+        block[np.arange(len(i)), i[:, 0]] += 1.0
+        A[start:start + len(i)] = block
     
-    with col3:
-        st.warning("🧮 **Sistem Linear**\n\nMenyelesaikan sistem persamaan linear")
+    A.flush()
+    del A
+
+def ooc_matvec(path_A, x, mem_budget_mb=256):
+    """Menghitung A @ x dengan membaca A dari disk per blok kolom"""
+    A = np.load(path_A, mmap_mode='r')
+    n = A.shape[0]
+    nb = ooc_panel_width(n, mem_budget_mb)
+    y = np.zeros(n)
     
-    st.markdown("---")
-    st.info("💡 **Tip:** Gunakan menu di sidebar untuk memulai eksperimen dengan metode-metode numerik!")
+    for j in range(0, n, nb):
+        y += np.asarray(A[:, j:j + nb]) @ x[j:j + nb]
+    
+    return y
 
-# --- HALAMAN 2: ANALISIS GALAT ---
-elif menu == "🔍 Analisis Galat":
-    st.header("🔍 Analisis Galat (Error Analysis)")
+def ooc_lu_factor(path_A, path_LU, mem_budget_mb=256):
+    """Faktorisasi LU terblok (right-looking) dengan partial pivoting untuk matriks .npy
+    di disk. Faktor L dan U ditulis ke path_LU; hanya satu panel dan satu blok kolom
+    yang berada di RAM pada satu waktu. Mengembalikan (perm, nb, log per panel)."""
+    A = np.load(path_A, mmap_mode='r')
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError(f"Matriks harus persegi, diterima {A.shape}")
     
-    st.markdown("""
-    Sebelum kita menghitung apapun, kita harus tahu: **Seberapa salah bolehnya jawaban kita?**
+    n = A.shape[0]
+    nb = ooc_panel_width(n, mem_budget_mb)
+    LU = np.lib.format.open_memmap(path_LU, mode='w+', dtype=np.float64, shape=(n, n))
     
-    Dalam komputasi numerik, kita tidak bisa mendapatkan jawaban yang 100% tepat. 
-    Yang penting adalah memahami dan mengontrol tingkat kesalahan.
-    """)
+    # Salin A ke file kerja agar file asli tetap utuh untuk cek residual
+    for j in range(0, n, nb):
+        LU[:, j:j + nb] = A[:, j:j + nb]
+    LU.flush()
     
-    col1, col2 = st.columns(2)
+    perm = np.arange(n)
+    panel_log = []
     
-    with col1:
-        st.markdown('<div class="formula-box"><h4>Absolute Error</h4></div>', unsafe_allow_html=True)
-        st.latex(r"E_{abs} = |x_{true} - x_{approx}|")
-        st.caption("""
-        **Absolute Error** adalah selisih murni antara nilai sebenarnya dan nilai pendekatan.
+    for k in range(0, n, nb):
+        kb = min(nb, n - k)
+        t_io = 0.0
+        t_compute = 0.0
         
-        **Contoh:** Jika nilai sebenarnya 100 dan hasil perhitungan 98, maka absolute error = 2.
+        t0 = time.perf_counter()
+        panel = np.array(LU[k:, k:k + kb])
+        t_io += time.perf_counter() - t0
         
-        **Kapan penting?** Ketika skala pengukuran konsisten (misal: semua dalam meter).
-        """)
-    
-    with col2:
-        st.markdown('<div class="formula-box"><h4>Relative Error</h4></div>', unsafe_allow_html=True)
-        st.latex(r"E_{rel} = \left| \frac{x_{true} - x_{approx}}{x_{true}} \right| \times 100\%")
-        st.caption("""
-        **Relative Error** memberi konteks skala pada kesalahan.
+        # Faktorisasi panel tinggi (n-k) × kb
+        t0 = time.perf_counter()
+        panel, piv = linalg.lu_factor(panel, overwrite_a=True, check_finite=False)
+        if np.any(np.abs(np.diag(panel[:kb])) < 1e-14):
+            raise np.linalg.LinAlgError(f"Pivot nol pada panel kolom {k}")
         
-        **Contoh:** Error 1mm pada mikrochip (besar!), tapi kecil pada jembatan.
+        local_perm = np.arange(n - k)
+        for i, p in enumerate(piv):
+            local_perm[[i, p]] = local_perm[[p, i]]
         
-        **Kapan penting?** Ketika membandingkan error pada skala yang berbeda.
-        """)
+        L11 = panel[:kb]
+        L21 = panel[kb:]
+        t_compute += time.perf_counter() - t0
+        
+        t0 = time.perf_counter()
+        LU[k:, k:k + kb] = panel
+        t_io += time.perf_counter() - t0
+        
+        # Alirkan blok kolom lain: tukar baris, lalu update trailing matrix
+        for j in range(0, n, nb):
+            if j == k:
+                continue
+            
+            t0 = time.perf_counter()
+            block = np.array(LU[k:, j:j + nb])
+            t_io += time.perf_counter() - t0
+            
+            t0 = time.perf_counter()
+            block = block[local_perm]
+            if j > k:
+                block[:kb] = linalg.solve_triangular(L11, block[:kb], lower=True,
+                                                     unit_diagonal=True, check_finite=False)
+                block[kb:] -= L21 @ block[:kb]
+            t_compute += time.perf_counter() - t0
+            
+            t0 = time.perf_counter()
+            LU[k:, j:j + nb] = block
+            t_io += time.perf_counter() - t0
+        
+        t0 = time.perf_counter()
+        LU.flush()
+        t_io += time.perf_counter() - t0
+        
+        perm[k:] = perm[k:][local_perm]
+        panel_log.append((k // nb + 1, k, kb, t_io, t_compute))
     
-    st.markdown("---")
-    st.subheader("🧪 Kalkulator Error")
+    del LU
+    return perm, nb, panel_log
+
+def ooc_lu_solve(path_LU, perm, b, nb):
+    """Substitusi maju (Ly = Pb) dan mundur (Ux = y) dengan membaca faktor per blok kolom"""
+    LU = np.load(path_LU, mmap_mode='r')
+    n = LU.shape[0]
+    y = np.asarray(b, dtype=float)[perm].copy()
     
-    col1, col2 = st.columns(2)
+    for j in range(0, n, nb):
+        block = np.asarray(LU[j:, j:j + nb])
+        jb = block.shape[1]
+        y[j:j + jb] = linalg.solve_triangular(block[:jb], y[j:j + jb], lower=True,
+                                              unit_diagonal=True, check_finite=False)
+        y[j + jb:] -= block[jb:] @ y[j:j + jb]
     
-    with col1:
-        true_val = st.number_input("Nilai Sebenarnya (True Value):", value=100.0, format="%.6f")
+    for j in reversed(range(0, n, nb)):
+        block = np.asarray(LU[:j + nb, j:j + nb])
+        jb = block.shape[1]
+        y[j:j + jb] = linalg.solve_triangular(block[j:j + jb], y[j:j + jb], lower=False,
+                                              check_finite=False)
+        y[:j] -= block[:j] @ y[j:j + jb]
     
-    with col2:
-        approx_val = st.number_input("Nilai Pendekatan (Approximate):", value=98.5, format="%.6f")
+    return y
+
+def gauss_elimination(A, b, pivoting="partial", record=True):
+    """Eliminasi Gauss + substitusi mundur dengan operasi baris in-place.
+    pivoting: "partial", "scaled", atau "none". Jika record=True, dikembalikan log ringkas
+    (indeks pivot + multiplier di segitiga bawah, seperti LAPACK) untuk replay langkah."""
+    A = np.asarray(A, dtype=float)
+    n = A.shape[0]
     
-    if true_val != 0:
-        abs_err = abs(true_val - approx_val)
-        rel_err = (abs_err / abs(true_val)) * 100
+    # Satu-satunya salinan: matriks augmented [A | b]
+    M = np.empty((n, n + 1))
+    M[:, :n] = A
+    M[:, n] = b
+    
+    # Buffer kerja update rank-1, dipakai ulang di setiap langkah
+    work = np.empty((n, n + 1))
+    pivots = np.arange(n)
+    
+    if pivoting == "scaled":
+        scale = np.max(np.abs(M[:, :n]), axis=1)
+        if np.any(scale == 0):
+            raise np.linalg.LinAlgError("Ada baris nol pada matriks")
+    
+    for k in range(n):
+        if pivoting == "partial":
+            p = k + int(np.argmax(np.abs(M[k:, k])))
+        elif pivoting == "scaled":
+            p = k + int(np.argmax(np.abs(M[k:, k]) / scale[k:]))
+        else:
+            p = k
         
-        col1, col2 = st.columns(2)
+        if p != k:
+            M[[k, p]] = M[[p, k]]
+            if pivoting == "scaled":
+                scale[[k, p]] = scale[[p, k]]
+        pivots[k] = p
         
-        with col1:
-            st.metric("Absolute Error", f"{abs_err:.6f}")
+        pivot = M[k, k]
+        if abs(pivot) < 1e-14:
+            raise np.linalg.LinAlgError(f"Pivot nol pada langkah {k+1}")
         
-        with col2:
-            st.metric("Relative Error", f"{rel_err:.6f}%")
+        if k == n - 1:
+            break
         
-        # Interpretasi
-        st.markdown("---")
-        st.subheader("📊 Interpretasi")
+        # Multiplier disimpan di tempat elemen yang dieliminasi
+        m = M[k+1:, k]
+        m /= pivot
         
-        if rel_err < 0.1:
-            st.success("✅ **Sangat Baik!** Relative error < 0.1%")
-        elif rel_err < 1:
-            st.info("✓ **Baik.** Relative error < 1%")
-        elif rel_err < 5:
-            st.warning("⚠️ **Cukup.** Relative error < 5%")
-        else:
-            st.error("❌ **Perlu Perbaikan.** Relative error > 5%")
-    else:
-        st.warning("⚠️ Nilai sebenarnya tidak boleh nol untuk menghitung relative error.")
-
-# --- HALAMAN 3: AKAR PERSAMAAN ---
-elif menu == "🎯 Akar Persamaan":
-    st.header("🎯 Mencari Akar (Root Finding)")
+        w = work[:n-k-1, :n-k]
+        np.multiply(m[:, None], M[k, k+1:], out=w)
+        np.subtract(M[k+1:, k+1:], w, out=M[k+1:, k+1:])
     
-    st.markdown("""
-    **Masalah klasik:** Kapan fungsi ini menyentuh sumbu X (nilai nol)?
+    # Substitusi mundur
+    x = np.empty(n)
+    for i in range(n - 1, -1, -1):
+        x[i] = (M[i, n] - M[i, i+1:n] @ x[i+1:]) / M[i, i]
     
-    **Aplikasi dalam teknik:**
-    - Kapan arus dalam rangkaian menjadi nol?
-    - Kapan tegangan drop menjadi nol?
-    - Mencari titik kesetimbangan sistem
-    """)
+    log = {"pivots": pivots, "factors": M, "pivoting": pivoting} if record else None
+    return x, log
+
+def replay_elimination(A, b, log, step):
+    """Merekonstruksi matriks augmented setelah `step` langkah eliminasi dari matriks asli
+    dan log pivot/multiplier, tanpa menyimpan snapshot per langkah"""
+    A = np.asarray(A, dtype=float)
+    n = A.shape[0]
+    pivots = log["pivots"]
+    F = log["factors"]
     
-    # Pilih Metode
-    method = st.selectbox(
-        "Pilih Metode:",
-        ["Bisection (Dikotomi)", "Newton-Raphson", "Secant"]
-    )
+    perm_step = np.arange(n)
+    for k in range(step):
+        perm_step[[k, pivots[k]]] = perm_step[[pivots[k], k]]
+    perm_final = perm_step.copy()
+    for k in range(step, n):
+        perm_final[[k, pivots[k]]] = perm_final[[pivots[k], k]]
     
-    # Input Fungsi
-    st.markdown("---")
-    st.subheader("📝 Input Fungsi")
+    A_aug = np.column_stack([A, b])
+    state = np.zeros((n, n + 1))
     
-    col1, col2 = st.columns([3, 1])
+    # Baris yang sudah menjadi pivot tidak berubah lagi: ambil langsung dari U
+    U_top = np.triu(F[:step], k=0)
+    state[:step] = U_top
     
-    with col1:
-        func_input = st.text_input(
-            "Masukkan fungsi f(x):",
-            value="x**2 - 4",
-            help="Gunakan `**` untuk pangkat. Contoh: x**2 - 4, x**3 - x - 1, sin(x) - 0.5"
-        )
+    # Sisa baris = komplemen Schur: (PA)[step:] - L[step:, :step] U[:step]
+    trailing = A_aug[perm_final[step:]] - F[step:, :step] @ U_top
+    trailing[:, :step] = 0.0
     
-    with col2:
-        st.markdown("**Contoh:**")
-        st.code("x**2 - 4")
-        st.code("x**3 - x - 1")
-        st.code("sin(x) - 0.5")
+    # Urutkan ulang dari urutan baris akhir ke urutan baris pada langkah tersebut
+    inv_final = np.empty(n, dtype=np.intp)
+    inv_final[perm_final] = np.arange(n)
+    state[step:] = trailing[inv_final[perm_step[step:]] - step]
     
-    # Parse fungsi
-    f = parse_expression(func_input)
+    return state, perm_step
+
+def random_test_system(n):
+    """Sistem acak n×n yang dapat direproduksi (seed = n), dipakai bersama beberapa mode"""
+    rng = np.random.default_rng(n)
+    return rng.uniform(-1, 1, (n, n)), rng.uniform(-1, 1, n)
+
+@st.cache_data(max_entries=8)
+def lu_factor_cached(A):
+    """Faktorisasi LU (LAPACK getrf) yang di-cache berdasarkan isi matriks"""
+    return linalg.lu_factor(A)
+
+def power_iteration(A, x0, tol, max_iter):
+    """Implementasi Power Iteration (nilai eigen dominan)"""
+    results = []
     
-    if f is None:
-        st.warning("⚠️ Mohon perbaiki rumus fungsi sebelum melanjutkan.")
-        st.info("""
-        **Tips Penulisan:**
-        - Gunakan `x` sebagai variabel
-        - Pangkat: `x**2` bukan `x^2`
-        - Fungsi trigonometri: `sin(x)`, `cos(x)`, `tan(x)`
-        - Eksponensial: `exp(x)`
-        - Logaritma natural: `log(x)`
-        - Akar kuadrat: `sqrt(x)`
-        """)
-        st.stop()
+    norm_x0 = np.linalg.norm(x0)
+    if norm_x0 == 0:
+        return None, "⚠️ Vektor awal tidak boleh nol"
     
-    # Plot fungsi
-    st.markdown("---")
-    st.subheader("📊 Visualisasi Fungsi")
+    x = x0 / norm_x0
+    y = A @ x
+    lam_old = 0.0
     
-    try:
-        x_range = st.slider("Range X untuk plot:", -20.0, 20.0, (-10.0, 10.0), 0.5)
-        x = np.linspace(x_range[0], x_range[1], 500)
-        y = f(x)
+    for i in range(max_iter):
+        lam = x @ y  # Rayleigh quotient
+        residual = np.linalg.norm(y - lam * x)
+        results.append((i+1, lam, abs(lam - lam_old), residual))
         
-        # Pastikan y adalah array
-        if not isinstance(y, np.ndarray):
-            y = np.array(y)
+        if residual < tol:
+            return results, "✅ Konvergen"
         
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name='f(x)', line=dict(color='blue', width=2)))
-        fig.add_hline(y=0, line_dash="dash", line_color="red", annotation_text="y=0")
-        fig.update_layout(
-            title="Grafik Fungsi f(x)",
-            xaxis_title='x',
-            yaxis_title='f(x)',
-            hovermode='x unified',
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        norm_y = np.linalg.norm(y)
+        if norm_y == 0:
+            return None, "⚠️ Vektor menjadi nol (x₀ berada di ruang nol A)"
         
-    except Exception as e:
-        st.error(f"❌ Error saat plotting: {e}")
-        st.info("Pastikan fungsi yang dimasukkan valid dan dapat dievaluasi untuk range x yang dipilih.")
-        st.stop()
+        x = y / norm_y
+        y = A @ x
+        lam_old = lam
     
-    # Metode Bisection
-    if method == "Bisection (Dikotomi)":
-        st.markdown("---")
-        st.markdown("""
-        <div class="concept-box">
-        <h4>🎲 Konsep: Permainan Tebak Angka</h4>
+    return results, "⚠️ Maksimum iterasi tercapai"
+
+def inverse_iteration(A, lu_piv, x0, tol, max_iter):
+    """Implementasi Shifted Inverse Iteration memakai faktorisasi LU dari (A - σI) yang sudah ada"""
+    results = []
+    
+    norm_x0 = np.linalg.norm(x0)
+    if norm_x0 == 0:
+        return None, "⚠️ Vektor awal tidak boleh nol"
+    
+    x = x0 / norm_x0
+    lam_old = 0.0
+    
+    for i in range(max_iter):
+        y = linalg.lu_solve(lu_piv, x, check_finite=False)
+        x = y / np.linalg.norm(y)
         
-        Bayangkan kita bermain tebak angka 1-100:
-        1. Pilih tengah (50): "Terlalu besar"
-        2. Pilih tengah baru (25): "Terlalu kecil"
-        3. Pilih tengah lagi (37): "Terlalu besar"
-        4. Dan seterusnya...
+        Ax = A @ x
+        lam = x @ Ax
+        residual = np.linalg.norm(Ax - lam * x)
+        results.append((i+1, lam, abs(lam - lam_old), residual))
         
-        **Metode Bisection** bekerja dengan cara yang sama:
-        - Kita punya interval [a, b] dimana f(a) dan f(b) berlawanan tanda
-        - Artinya ada akar di antara a dan b (berdasarkan Teorema Nilai Antara)
-        - Kita potong tengah-tengahnya, cek tandanya, buang setengah yang salah
-        - Ulangi sampai intervalnya sangat kecil
+        if residual < tol:
+            return results, "✅ Konvergen"
         
-        **Keunggulan:** Selalu konvergen jika ada akar dalam interval
-        **Kelemahan:** Lambat (mengurangi error 50% setiap iterasi)
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
+        lam_old = lam
+    
+    return results, "⚠️ Maksimum iterasi tercapai"
+
+def qr_algorithm(A, tol, max_iter):
+    """Implementasi Algoritma QR dengan reduksi Hessenberg, shift Wilkinson, dan deflasi.
+    Iterasi dilakukan dalam aritmetika kompleks agar pasangan eigen kompleks ikut konvergen."""
+    H = linalg.hessenberg(np.asarray(A, dtype=float)).astype(complex)
+    m = H.shape[0]
+    eigenvalues = []
+    results = []
+    since_deflation = 0
+    
+    for i in range(max_iter):
+        # Deflasi: elemen subdiagonal terbawah yang sudah cukup kecil
+        while m > 1 and abs(H[m-1, m-2]) < tol * (abs(H[m-1, m-1]) + abs(H[m-2, m-2])):
+            eigenvalues.append(H[m-1, m-1])
+            m -= 1
+            since_deflation = 0
         
-        with col1:
-            a = st.number_input("Batas Bawah (a):", value=-3.0, format="%.6f")
+        if m == 1:
+            eigenvalues.append(H[0, 0])
+            eigenvalues = np.array(eigenvalues)
+            if np.all(np.abs(eigenvalues.imag) <= tol * np.abs(eigenvalues)):
+                eigenvalues = eigenvalues.real
+            return eigenvalues, results, "✅ Konvergen"
         
-        with col2:
-            b = st.number_input("Batas Atas (b):", value=3.0, format="%.6f")
+        # Shift Wilkinson: nilai eigen blok 2×2 terbawah yang paling dekat ke h_mm
+        ev = np.linalg.eigvals(H[m-2:m, m-2:m])
+        mu = ev[np.argmin(np.abs(ev - H[m-1, m-1]))]
+        if since_deflation > 0 and since_deflation % 10 == 0:
+            mu += abs(H[m-1, m-2])  # shift darurat untuk memecah siklus
         
-        with col3:
-            tol = st.number_input("Toleransi:", value=0.0001, format="%.6f", min_value=1e-10)
+        Q, R = np.linalg.qr(H[:m, :m] - mu * np.eye(m))
+        H[:m, :m] = R @ Q + mu * np.eye(m)
+        since_deflation += 1
         
-        max_iter = st.slider("Maksimum Iterasi:", 5, 100, 20)
+        results.append((i+1, m, mu, abs(H[m-1, m-2])))
+    
+    return np.array(eigenvalues), results, "⚠️ Maksimum iterasi tercapai"
+
+def sparse_test_matrix(kind, size):
+    """Matriks Laplacian sparse (rantai RC 1-D atau grid 2-D) beserta seluruh nilai eigen eksaknya"""
+    m = size if kind == "1-D" else int(round(np.sqrt(size)))
+    lam_1d = 2 - 2 * np.cos(np.arange(1, m + 1) * np.pi / (m + 1))
+    T = sparse.diags([-np.ones(m - 1), 2 * np.ones(m), -np.ones(m - 1)], [-1, 0, 1], format='csr')
+    
+    if kind == "1-D":
+        return T, np.sort(lam_1d)
+    
+    I = sparse.identity(m, format='csr')
+    A = (sparse.kron(T, I) + sparse.kron(I, T)).tocsr()
+    return A, np.sort((lam_1d[:, None] + lam_1d[None, :]).ravel())
+
+def sparse_extreme_eigs(A, k, largest=True, sigma=None):
+    """k pasangan eigen ekstrem dengan Lanczos (eigsh, untuk A simetris) atau Arnoldi (eigs)
+    dari ARPACK. Jika sigma diberikan, dipakai mode shift-invert dengan faktorisasi LU sparse
+    sehingga yang dicari adalah nilai eigen terdekat ke sigma."""
+    n = A.shape[0]
+    symmetric = abs(A - A.T).max() == 0
+    counter = {"n": 0}
+    
+    if sigma is None:
+        def op(v):
+            counter["n"] += 1
+            return A @ v
+        which = ('LA' if symmetric else 'LR') if largest else ('SA' if symmetric else 'SR')
+    else:
+        lu_sparse = sparse_linalg.splu((A - sigma * sparse.identity(n)).tocsc())
+        def op(v):
+            counter["n"] += 1
+            return lu_sparse.solve(v)
+        # Nilai eigen (A - σI)⁻¹ terbesar ↔ nilai eigen A terdekat ke σ
+        which = 'LM'
+    
+    operator = sparse_linalg.LinearOperator((n, n), matvec=op, dtype=float)
+    ncv = min(n - 1, max(2 * k + 1, 20))
+    
+    if symmetric:
+        vals, vecs = sparse_linalg.eigsh(operator, k=k, which=which, ncv=ncv)
+    else:
+        vals, vecs = sparse_linalg.eigs(operator, k=k, which=which, ncv=ncv)
+    
+    if sigma is not None:
+        vals = sigma + 1 / vals
+    
+    order = np.argsort(np.real(vals))
+    vals, vecs = vals[order], vecs[:, order]
+    residuals = np.linalg.norm(A @ vecs - vecs * vals, axis=0)
+    
+    return vals, residuals, counter["n"], "Lanczos (eigsh)" if symmetric else "Arnoldi (eigs)"
+
+def build_nonlinear_system(exprs, variables):
+    """Membangun F(x) dan Jacobian simbolik J(x) dengan SymPy, lalu lambdify sekali saja"""
+    syms = sp.symbols(variables)
+    F_expr = sp.Matrix(exprs)
+    J_expr = F_expr.jacobian(syms)
+    
+    F_num = sp.lambdify(syms, list(F_expr), 'numpy')
+    J_num = sp.lambdify(syms, J_expr, 'numpy')
+    
+    def F(x):
+        return np.array(F_num(*x), dtype=float)
+    
+    def J(x):
+        return np.array(J_num(*x), dtype=float)
+    
+    return F, J, J_expr
+
+def newton_system_method(F, J, x0, tol, max_iter, damped=False):
+    """Implementasi Newton multivariat: J(x) Δx = -F(x) diselesaikan dengan engine eliminasi Gauss.
+    Jika damped=True, langkah dipotong setengah hingga ‖F‖ turun (penting untuk dioda/eksponensial)."""
+    results = []
+    x = np.asarray(x0, dtype=float)
+    
+    try:
+        Fx = F(x)
+        for i in range(max_iter):
+            dx, _ = gauss_elimination(J(x), -Fx, "partial", record=False)
+            
+            if damped:
+                alpha = 1.0
+                with np.errstate(over='ignore', invalid='ignore'):
+                    while alpha > 1e-8:
+                        F_trial = F(x + alpha * dx)
+                        if np.all(np.isfinite(F_trial)) and np.linalg.norm(F_trial) < np.linalg.norm(Fx):
+                            break
+                        alpha /= 2
+                dx = alpha * dx
+            
+            x = x + dx
+            Fx = F(x)
+            if not np.all(np.isfinite(Fx)):
+                return None, "⚠️ Iterasi divergen (F(x) tidak berhingga). Coba tebakan awal lain."
+            results.append((i+1, *x, np.linalg.norm(Fx), np.linalg.norm(dx), i+1))
+            
+            if np.linalg.norm(dx) < tol and np.linalg.norm(Fx) < tol:
+                return results, "✅ Konvergen"
+    except np.linalg.LinAlgError:
+        return None, "⚠️ Jacobian singular (pembagian dengan nol)"
+    except Exception as e:
+        return None, f"Error mengevaluasi fungsi: {e}"
+    
+    return results, "⚠️ Maksimum iterasi tercapai"
+
+def broyden_method(F, J, x0, tol, max_iter):
+    """Implementasi Broyden (good): Jacobian dihitung sekali lalu diperbarui rank-1,
+    dan hanya dihitung ulang bila langkah gagal menurunkan ‖F‖"""
+    results = []
+    x = np.asarray(x0, dtype=float)
+    
+    try:
+        Fx = F(x)
+        B = J(x)
+        n_jac = 1
         
-        if st.button("🚀 Hitung Akar (Bisection)", type="primary"):
-            with st.spinner("Menghitung..."):
-                results, msg = bisection_method(f, a, b, tol, max_iter)
+        for i in range(max_iter):
+            dx, _ = gauss_elimination(B, -Fx, "partial", record=False)
+            x_new = x + dx
+            F_new = F(x_new)
+            if not np.all(np.isfinite(F_new)):
+                return None, "⚠️ Iterasi divergen (F(x) tidak berhingga). Coba tebakan awal lain."
             
-            if results is None:
-                st.error(msg)
+            if np.linalg.norm(F_new) > np.linalg.norm(Fx):
+                # Aproksimasi sudah buruk: segarkan dengan Jacobian eksak di titik baru
+                B = J(x_new)
+                n_jac += 1
             else:
-                st.success(msg)
-                
-                # Tampilkan tabel
-                st.subheader("📋 Tabel Iterasi")
-                df = pd.DataFrame(results, columns=["Iterasi", "a", "b", "c (Akar)", "f(c)"])
-                df['|b - a|'] = df['b'] - df['a']
-                st.dataframe(df.style.format({
-                    'a': '{:.6f}',
-                    'b': '{:.6f}',
-                    'c (Akar)': '{:.6f}',
-                    'f(c)': '{:.6e}',
-                    '|b - a|': '{:.6e}'
-                }), use_container_width=True)
-                
-                # Hasil akhir
-                final_root = results[-1][3]
-                final_error = abs(results[-1][4])
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Akar yang ditemukan", f"{final_root:.8f}")
-                with col2:
-                    st.metric("f(akar)", f"{final_error:.2e}")
-                with col3:
-                    st.metric("Jumlah Iterasi", len(results))
-                
-                # Plot hasil
-                fig_result = go.Figure()
-                fig_result.add_trace(go.Scatter(x=x, y=y, mode='lines', name='f(x)', line=dict(color='blue', width=2)))
-                fig_result.add_hline(y=0, line_dash="dash", line_color="gray")
-                fig_result.add_trace(go.Scatter(
-                    x=[final_root], y=[0],
-                    mode='markers',
-                    marker=dict(size=15, color='red', symbol='star'),
-                    name=f'Akar ≈ {final_root:.6f}'
-                ))
-                fig_result.update_layout(
-                    title="Hasil: Akar yang Ditemukan",
-                    xaxis_title='x',
-                    yaxis_title='f(x)',
-                    height=400
-                )
-                st.plotly_chart(fig_result, use_container_width=True)
+                B += np.outer(F_new - Fx - B @ dx, dx) / (dx @ dx)
+            
+            x, Fx = x_new, F_new
+            results.append((i+1, *x, np.linalg.norm(Fx), np.linalg.norm(dx), n_jac))
+            
+            if np.linalg.norm(dx) < tol and np.linalg.norm(Fx) < tol:
+                return results, "✅ Konvergen"
+    except np.linalg.LinAlgError:
+        return None, "⚠️ Jacobian singular (pembagian dengan nol)"
+    except Exception as e:
+        return None, f"Error mengevaluasi fungsi: {e}"
     
-    # Metode Newton-Raphson
-    elif method == "Newton-Raphson":
-        st.markdown("---")
-        st.markdown("""
-        <div class="concept-box">
-        <h4>🎿 Konsep: Meluncur di Lereng</h4>
-        
-        Bayangkan Anda berdiri di lereng bukit dan ingin cepat turun ke lembah (akar):
-        1. Lihat kemiringan di bawah kaki Anda (turunan)
-        2. Meluncur mengikuti kemiringan itu
-        3. Sampai di titik baru, lihat kemiringan lagi
-        4. Ulangi sampai sampai di lembah
+    return results, "⚠️ Maksimum iterasi tercapai"
+
+def evaluate_array(f, x):
+    """Evaluasi f pada array x; hasil konstan (misal f(x) = 5) diperluas ke bentuk x"""
+    y = np.asarray(f(x), dtype=float)
+    if y.shape != np.shape(x):
+        y = np.broadcast_to(y, np.shape(x)).copy()
+    return y
+
+def simpson_rule(f, a, b, n):
+    """Implementasi Simpson 1/3 komposit (n genap). Estimasi error dari selisih dengan
+    Simpson n/2 yang memakai titik genap yang sama (tanpa evaluasi tambahan)."""
+    if n % 2:
+        n += 1
+    x = np.linspace(a, b, n + 1)
+    y = evaluate_array(f, x)
+    h = (b - a) / n
+    
+    S_n = h / 3 * (y[0] + 4 * np.sum(y[1:-1:2]) + 2 * np.sum(y[2:-1:2]) + y[-1])
+    
+    if n % 4 == 0:
+        y2 = y[::2]
+        S_half = 2 * h / 3 * (y2[0] + 4 * np.sum(y2[1:-1:2]) + 2 * np.sum(y2[2:-1:2]) + y2[-1])
+        err_est = abs(S_n - S_half) / 15
+    else:
+        err_est = np.nan
+    
+    return S_n, err_est, n + 1
+
+def iter_nested_trapezoid(f, a, b, n0=1):
+    """Generator trapesium pada grid bersarang n0, 2n0, 4n0, ...: setiap level hanya
+    mengevaluasi titik tengah baru. Menghasilkan (n, T_n, total evaluasi)."""
+    n = n0
+    x = np.linspace(a, b, n + 1)
+    y = evaluate_array(f, x)
+    h = (b - a) / n
+    T = h * (np.sum(y) - (y[0] + y[-1]) / 2)
+    n_evals = n + 1
+    yield n, T, n_evals
+    
+    while True:
+        h /= 2
+        midpoints = a + h * np.arange(1, 2 * n, 2)
+        T = T / 2 + h * np.sum(evaluate_array(f, midpoints))
+        n *= 2
+        n_evals += len(midpoints)
+        yield n, T, n_evals
+
+def romberg_method(f, a, b, tol, max_level=20):
+    """Implementasi Romberg: trapesium bersarang (hanya titik tengah baru yang dievaluasi)
+    + ekstrapolasi Richardson. Mengembalikan (nilai, estimasi error, jumlah evaluasi, tabel)."""
+    R = []
+    
+    for i, (n, T, n_evals) in enumerate(iter_nested_trapezoid(f, a, b)):
+        row = [T]
+        for j in range(1, i + 1):
+            row.append(row[j-1] + (row[j-1] - R[i-1][j-1]) / (4**j - 1))
+        R.append(row)
         
-        **Metode Newton-Raphson:**
-        - Mulai dari tebakan awal x₀
-        - Tarik garis singgung di titik (x₀, f(x₀))
-        - Garis singgung memotong sumbu X di x₁
-        - x₁ biasanya lebih dekat ke akar daripada x₀
-        - Rumus: x_{n+1} = x_n - f(x_n)/f'(x_n)
+        if i == 0:
+            continue
         
-        **Keunggulan:** Sangat cepat (konvergensi kuadratik)
-        **Kelemahan:** Butuh turunan, bisa gagal jika f'(x) ≈ 0
-        </div>
-        """, unsafe_allow_html=True)
+        err_est = abs(R[i][i] - R[i-1][i-1])
+        if err_est < tol or i == max_level:
+            return R[i][i], err_est, n_evals, R
+
+def convergence_study(f, a, b, n0, levels, reference=None):
+    """Studi konvergensi trapesium pada grid n0, 2n0, ..., 2^(levels-1) n0 dengan titik yang
+    dipakai ulang, ekstrapolasi Richardson, dan orde konvergensi teramati"""
+    rows = []
+    for n, T, n_evals in iter_nested_trapezoid(f, a, b, n0):
+        rows.append((n, (b - a) / n, T, n_evals))
+        if len(rows) == levels:
+            break
+    
+    df = pd.DataFrame(rows, columns=["n", "h", "T(n)", "Evaluasi Kumulatif"])
+    
+    # Richardson: R(2n) = (4 T(2n) - T(n)) / 3 menghapus suku error O(h²)
+    df["Richardson"] = (4 * df["T(n)"] - df["T(n)"].shift(1)) / 3
+    
+    if reference is None:
+        # Tanpa referensi: estimasi error dari ekstrapolasi level berikutnya
+        df["Error"] = (df["T(n)"].shift(-1) - df["T(n)"]).abs() * 4 / 3
+        df["Error Richardson"] = (df["Richardson"].shift(-1) - df["Richardson"]).abs()
+    else:
+        df["Error"] = (df["T(n)"] - reference).abs()
+        df["Error Richardson"] = (df["Richardson"] - reference).abs()
+    
+    df["Orde Teramati"] = np.log2(df["Error"].shift(1) / df["Error"])
+    
+    # Kemiringan log-log hanya dari error yang masih di atas round-off
+    valid = df["Error"] > 1e-13 * max(1.0, abs(df["T(n)"].iloc[-1]))
+    slope = np.polyfit(np.log10(df.loc[valid, "n"]), np.log10(df.loc[valid, "Error"]), 1)[0] if valid.sum() >= 2 else np.nan
+    
+    return df, slope
+
+def gauss_legendre_rule(f, a, b, n):
+    """Implementasi Gauss-Legendre orde n pada [a, b]. Estimasi error dari selisih dengan orde n+1."""
+    def rule(order):
+        t, w = np.polynomial.legendre.leggauss(order)
+        x = (b - a) / 2 * t + (a + b) / 2
+        return (b - a) / 2 * np.sum(w * evaluate_array(f, x)), x
+    
+    G_n, nodes = rule(n)
+    G_n1, _ = rule(n + 1)
+    return G_n, abs(G_n1 - G_n), 2 * n + 1, nodes
+
+def adaptive_simpson(f, a, b, tol, max_depth=50):
+    """Implementasi Simpson adaptif: hanya subinterval dengan estimasi error lokal besar yang
+    dibagi lagi. Semua subinterval aktif pada satu level dievaluasi dalam satu panggilan vektor."""
+    m = (a + b) / 2
+    fa, fm, fb = evaluate_array(f, np.array([a, m, b]))
+    n_evals = 3
+    
+    lo, hi = np.array([a]), np.array([b])
+    f_lo, f_mid, f_hi = np.array([fa]), np.array([fm]), np.array([fb])
+    whole = (b - a) / 6 * (f_lo + 4 * f_mid + f_hi)
+    tol_i = np.array([tol])
+    
+    total = 0.0
+    err_total = 0.0
+    accepted = []
+    forced = np.zeros(1, dtype=bool)
+    
+    for depth in range(max_depth):
+        mid = (lo + hi) / 2
+        x_new = np.concatenate([(lo + mid) / 2, (mid + hi) / 2])
+        y_new = evaluate_array(f, x_new)
+        n_evals += len(x_new)
+        f_l, f_r = np.split(y_new, 2)
         
-        col1, col2, col3 = st.columns(3)
+        left = (mid - lo) / 6 * (f_lo + 4 * f_l + f_mid)
+        right = (hi - mid) / 6 * (f_mid + 4 * f_r + f_hi)
+        delta = left + right - whole
         
-        with col1:
-            x0 = st.number_input("Tebakan Awal (x₀):", value=3.0, format="%.6f")
+        done = np.abs(delta) <= 15 * tol_i
+        if depth == max_depth - 1:
+            # Subinterval yang diterima paksa pada kedalaman maksimum (toleransi tidak terpenuhi)
+            forced = ~done
+            done[:] = True
         
-        with col2:
-            tol = st.number_input("Toleransi:", value=0.0001, format="%.6f", min_value=1e-10)
+        total += np.sum((left + right + delta / 15)[done])
+        err_total += np.sum(np.abs(delta[done]) / 15)
+        accepted.append(np.column_stack([lo[done], hi[done]]))
         
-        with col3:
-            max_iter = st.slider("Maksimum Iterasi:", 5, 50, 15)
+        keep = ~done
+        if not np.any(keep):
+            break
         
-        if st.button("🚀 Hitung Akar (Newton-Raphson)", type="primary"):
-            with st.spinner("Menghitung..."):
-                # Numerical derivative
-                h = 1e-7
-                def df(x_val):
-                    return (f(x_val + h) - f(x_val - h)) / (2 * h)
-                
-                results, msg = newton_raphson_method(f, df, x0, tol, max_iter)
-            
-            if results is None:
-                st.error(msg)
-            else:
-                st.success(msg)
-                
-                # Tampilkan tabel
-                st.subheader("📋 Tabel Iterasi")
-                df_results = pd.DataFrame(results, columns=["Iterasi", "xₙ", "f(xₙ)", "xₙ₊₁", "|xₙ₊₁ - xₙ|"])
-                st.dataframe(df_results.style.format({
-                    'xₙ': '{:.8f}',
-                    'f(xₙ)': '{:.6e}',
-                    'xₙ₊₁': '{:.8f}',
-                    '|xₙ₊₁ - xₙ|': '{:.6e}'
-                }), use_container_width=True)
-                
-                # Hasil akhir
-                final_root = results[-1][3]
-                final_error = abs(float(f(final_root)))
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Akar yang ditemukan", f"{final_root:.8f}")
-                with col2:
-                    st.metric("f(akar)", f"{final_error:.2e}")
-                with col3:
-                    st.metric("Jumlah Iterasi", len(results))
-                
-                # Plot hasil dengan garis singgung
-                fig_result = go.Figure()
-                fig_result.add_trace(go.Scatter(x=x, y=y, mode='lines', name='f(x)', line=dict(color='blue', width=2)))
-                fig_result.add_hline(y=0, line_dash="dash", line_color="gray")
-                
-                # Tambahkan garis singgung iterasi terakhir
-                if len(results) > 0:
-                    x_last = results[-1][2]
-                    f_last = float(f(x_last))
-                    h = 1e-7
-                    df_last = (float(f(x_last + h)) - float(f(x_last - h))) / (2 * h)
-                    
-                    # Buat garis singgung
-                    x_tangent = np.linspace(x_last - 2, x_last + 2, 50)
-                    y_tangent = f_last + df_last * (x_tangent - x_last)
-                    
-                    fig_result.add_trace(go.Scatter(
-                        x=x_tangent, y=y_tangent,
-                        mode='lines',
-                        name='Garis Singgung',
-                        line=dict(color='orange', dash='dot')
-                    ))
-                
-                fig_result.add_trace(go.Scatter(
-                    x=[final_root], y=[0],
-                    mode='markers',
-                    marker=dict(size=15, color='green', symbol='star'),
-                    name=f'Akar ≈ {final_root:.6f}'
-                ))
-                fig_result.update_layout(
-                    title="Hasil: Akar yang Ditemukan",
-                    xaxis_title='x',
-                    yaxis_title='f(x)',
-                    height=400
-                )
-                st.plotly_chart(fig_result, use_container_width=True)
+        # Bagi dua subinterval yang belum memenuhi toleransi
+        lo, hi = np.concatenate([lo[keep], mid[keep]]), np.concatenate([mid[keep], hi[keep]])
+        f_lo, f_hi = np.concatenate([f_lo[keep], f_mid[keep]]), np.concatenate([f_mid[keep], f_hi[keep]])
+        f_mid = np.concatenate([f_l[keep], f_r[keep]])
+        whole = np.concatenate([left[keep], right[keep]])
+        tol_i = np.concatenate([tol_i[keep], tol_i[keep]]) / 2
     
-    # Metode Secant
-    elif method == "Secant":
-        st.markdown("---")
-        st.markdown("""
-        <div class="concept-box">
-        <h4>📐 Konsep: Newton-Raphson Tanpa Turunan</h4>
+    converged = not forced.any()
+    return total, err_total, n_evals, np.vstack(accepted), converged
+
+# Node dan bobot Gauss-Kronrod 15 titik (Gauss 7 titik tertanam), dari QUADPACK
+_GK15_X = np.array([
+    0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.0
+])
+_GK15_WK = np.array([
+    0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714
+])
+_GK15_WG = np.array([
+    0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975, 0.417959183673469387755102040816327
+])
+GK15_NODES = np.concatenate([-_GK15_X[:-1], _GK15_X[::-1]])
+GK15_WEIGHTS = np.concatenate([_GK15_WK[:-1], _GK15_WK[::-1]])
+G7_WEIGHTS = np.zeros(15)
+G7_WEIGHTS[1:7:2] = _GK15_WG[:3]
+G7_WEIGHTS[7] = _GK15_WG[3]
+G7_WEIGHTS[9:15:2] = _GK15_WG[:3][::-1]
+
+def gauss_kronrod_adaptive(f, a, b, epsabs=1e-13, epsrel=1e-12, max_evals=2_000_000):
+    """Integrasi adaptif Gauss-Kronrod 7-15 yang tervektorisasi: 15 node dari semua panel aktif
+    dievaluasi dalam satu panggilan f, lalu panel dengan |K15 - G7| besar dibagi dua.
+    Berhenti jika total estimasi error ≤ max(epsabs, epsrel·|integral|); jika anggaran evaluasi
+    max_evals habis, panel sisa diterima apa adanya dan converged = False.
+    Mengembalikan (integral, estimasi error, jumlah evaluasi, converged)."""
+    if a == b:
+        return 0.0, 0.0, 0, True
+    
+    lo, hi = np.array([a], dtype=float), np.array([b], dtype=float)
+    total = 0.0
+    err_total = 0.0
+    n_evals = 0
+    
+    while True:
+        center = (lo + hi) / 2
+        half = (hi - lo) / 2
+        x = center[:, None] + half[:, None] * GK15_NODES[None, :]
+        y = evaluate_array(f, x.ravel()).reshape(x.shape)
+        n_evals += y.size
         
-        **Metode Secant** adalah modifikasi Newton-Raphson yang tidak memerlukan turunan:
-        - Gunakan 2 titik awal: x₀ dan x₁
-        - Tarik garis lurus (secant) melalui kedua titik
-        - Garis secant memotong sumbu X di x₂
-        - Geser: gunakan x₁ dan x₂ untuk iterasi berikutnya
+        kronrod = half * (y @ GK15_WEIGHTS)
+        gauss = half * (y @ G7_WEIGHTS)
+        err = np.abs(kronrod - gauss)
         
-        **Rumus:**
-        x_{n+1} = x_n - f(x_n) × (x_n - x_{n-1}) / (f(x_n) - f(x_{n-1}))
+        tol = max(epsabs, epsrel * abs(total + np.sum(kronrod)))
         
-        **Keunggulan:** Tidak butuh turunan, lebih cepat dari Bisection
-        **Kelemahan:** Lebih lambat dari Newton-Raphson, bisa divergen
-        </div>
-        """, unsafe_allow_html=True)
+        # Uji global: semua panel aktif diterima jika total error sudah cukup kecil
+        if err_total + np.sum(err) <= tol or not np.all(np.isfinite(err)):
+            done = np.ones(len(err), dtype=bool)
+        else:
+            # Toleransi dibagi proporsional terhadap lebar panel
+            done = err <= tol * (hi - lo) / (b - a)
         
-        col1, col2, col3 = st.columns(3)
+        # Level berikutnya membagi dua panel sisa: 2 × 15 evaluasi per panel
+        kehabisan = n_evals + 30 * np.count_nonzero(~done) > max_evals
+        if kehabisan:
+            done[:] = True
         
-        with col1:
-            x0 = st.number_input("Tebakan Awal 1 (x₀):", value=0.0, format="%.6f")
+        total += np.sum(kronrod[done])
+        err_total += np.sum(err[done])
         
-        with col2:
-            x1 = st.number_input("Tebakan Awal 2 (x₁):", value=1.0, format="%.6f")
+        if np.all(done):
+            converged = not kehabisan and err_total <= max(epsabs, epsrel * abs(total))
+            return total, err_total, n_evals, converged
         
-        with col3:
-            tol = st.number_input("Toleransi:", value=0.0001, format="%.6f", min_value=1e-10)
+        lo, hi, center = lo[~done], hi[~done], center[~done]
+        lo, hi = np.concatenate([lo, center]), np.concatenate([center, hi])
+
+@st.cache_data(max_entries=64)
+def integral_reference(expr_str, a, b):
+    """Nilai referensi integral (Gauss-Kronrod adaptif tervektorisasi), di-cache per (ekspresi, a, b)"""
+    f = parse_expression(expr_str)
+    return gauss_kronrod_adaptive(f, a, b)
+
+def tensor_gauss_integral(f, bounds, n):
+    """Integral f(x, y[, z]) pada kotak dengan aturan Gauss-Legendre tensor-product orde n per
+    dimensi. Estimasi error dari selisih dengan orde n+1."""
+    def rule(order):
+        t, w = np.polynomial.legendre.leggauss(order)
+        axes, weights = [], []
+        for lo, hi in bounds:
+            axes.append((hi - lo) / 2 * t + (hi + lo) / 2)
+            weights.append((hi - lo) / 2 * w)
         
-        max_iter = st.slider("Maksimum Iterasi:", 5, 50, 15)
+        grids = np.meshgrid(*axes, indexing='ij')
+        W = weights[0]
+        for w_k in weights[1:]:
+            W = np.multiply.outer(W, w_k)
         
-        if st.button("🚀 Hitung Akar (Secant)", type="primary"):
-            with st.spinner("Menghitung..."):
-                results, msg = secant_method(f, x0, x1, tol, max_iter)
-            
-            if results is None:
-                st.error(msg)
-            else:
-                st.success(msg)
-                
-                # Tampilkan tabel
-                st.subheader("📋 Tabel Iterasi")
-                df_results = pd.DataFrame(results, columns=["Iterasi", "xₙ₋₁", "xₙ", "xₙ₊₁", "f(xₙ₊₁)"])
-                st.dataframe(df_results.style.format({
-                    'xₙ₋₁': '{:.8f}',
-                    'xₙ': '{:.8f}',
-                    'xₙ₊₁': '{:.8f}',
-                    'f(xₙ₊₁)': '{:.6e}'
-                }), use_container_width=True)
-                
-                # Hasil akhir
-                final_root = results[-1][3]
-                final_error = abs(float(f(final_root)))
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Akar yang ditemukan", f"{final_root:.8f}")
-                with col2:
-                    st.metric("f(akar)", f"{final_error:.2e}")
-                with col3:
-                    st.metric("Jumlah Iterasi", len(results))
-                
-                # Plot hasil
-                fig_result = go.Figure()
-                fig_result.add_trace(go.Scatter(x=x, y=y, mode='lines', name='f(x)', line=dict(color='blue', width=2)))
-                fig_result.add_hline(y=0, line_dash="dash", line_color="gray")
-                fig_result.add_trace(go.Scatter(
-                    x=[final_root], y=[0],
-                    mode='markers',
-                    marker=dict(size=15, color='purple', symbol='star'),
-                    name=f'Akar ≈ {final_root:.6f}'
-                ))
-                fig_result.update_layout(
-                    title="Hasil: Akar yang Ditemukan",
-                    xaxis_title='x',
-                    yaxis_title='f(x)',
-                    height=400
-                )
-                st.plotly_chart(fig_result, use_container_width=True)
+        y = np.asarray(f(*grids), dtype=float)
+        y = np.broadcast_to(y, grids[0].shape)
+        return np.sum(W * y)
+    
+    Q_n = rule(n)
+    Q_n1 = rule(n + 1)
+    dim = len(bounds)
+    return Q_n, abs(Q_n1 - Q_n), n**dim + (n + 1)**dim
 
-# --- HALAMAN 4: SISTEM LINEAR ---
-elif menu == "🧮 Sistem Linear":
-    st.header("🧮 Sistem Persamaan Linear")
+def merge_running_stats(stats, values):
+    """Menggabungkan statistik berjalan (n, mean, M2) dengan satu chunk sampel (rumus Chan)
+    sehingga mean dan varians bisa dihitung tanpa menyimpan seluruh sampel"""
+    n_a, mean_a, M2_a = stats
+    n_b = values.size
+    if n_b == 0:
+        return stats
+    mean_b = np.mean(values)
+    M2_b = np.sum((values - mean_b) ** 2)
     
-    st.markdown("""
-    **Memecahkan masalah seperti:**
-    - Berapa arus di setiap cabang rangkaian? (Hukum Kirchhoff)
-    - Berapa gaya pada setiap tumpuan jembatan?
-    - Bagaimana distribusi suhu dalam sistem?
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    mean = mean_a + delta * n_b / n
+    M2 = M2_a + M2_b + delta**2 * n_a * n_b / n
+    return n, mean, M2
+
+def iter_monte_carlo_integral(f, bounds, n_samples, chunk_size, sampler="sobol", seed=0, replicates=8):
+    """Generator integrasi (quasi-)Monte Carlo per chunk berukuran tetap. Setelah setiap chunk
+    menghasilkan (jumlah sampel, estimasi integral, standard error) dari statistik berjalan.
+    Jumlah sampel dibulatkan ke atas ke kelipatan chunk_size (pangkat 2 untuk Sobol).
     
-    Semua masalah ini dapat dinyatakan dalam bentuk matriks: **Ax = b**
-    """)
+    Untuk Sobol/Halton, rumus iid σ/√N tidak mengukur galat QMC; sampel dibagi ke `replicates`
+    scrambling independen (masing-masing chunk_size/replicates titik per chunk) dan standard error
+    dihitung dari sebaran estimasi antar replikasi (randomized QMC)."""
+    dim = len(bounds)
+    lo = np.array([b[0] for b in bounds], dtype=float)
+    hi = np.array([b[1] for b in bounds], dtype=float)
+    volume = np.prod(hi - lo)
     
-    st.markdown('<div class="concept-box">', unsafe_allow_html=True)
-    st.markdown("""
-    ### 🎯 Konsep Sistem Linear
+    if sampler in ("sobol", "halton"):
+        # Sobol 64 bit: resolusi bawaan 30 bit memberi bias ~1e-9 yang sama di semua replikasi
+        engines = [
+            qmc.Sobol(d=dim, scramble=True, bits=64, seed=np.random.default_rng(seed_r)) if sampler == "sobol"
+            else qmc.Halton(d=dim, scramble=True, seed=np.random.default_rng(seed_r))
+            for seed_r in np.random.SeedSequence(seed).spawn(replicates)
+        ]
+        m = max(1, chunk_size // replicates)
+    else:
+        rng = np.random.default_rng(seed)
+        engines = [None]
+        m = chunk_size
     
-    Sistem persamaan linear adalah kumpulan persamaan seperti:
-```
-    3x + 2y - z = 1
-    2x - 2y + 4z = -2
-    -x + 0.5y - z = 0
-```
+    stats = [(0, 0.0, 0.0)] * len(engines)
     
-    Dalam bentuk matriks:
+    n_chunks = max(1, -(-n_samples // chunk_size))
     
-    **A** (Koefisien) × **x** (Unknown) = **b** (Konstanta)
-    """)
-    st.markdown('</div>', unsafe_allow_html=True)
+    for _ in range(n_chunks):
+        if engines[0] is None:
+            u = rng.random((m, dim))
+        else:
+            u = np.concatenate([engine.random(m) for engine in engines])
+        x = lo + u * (hi - lo)
+        y = np.asarray(f(*x.T), dtype=float)
+        y = np.broadcast_to(y, (len(engines) * m,)).reshape(len(engines), m)
+        
+        stats = [merge_running_stats(stats_r, y_r) for stats_r, y_r in zip(stats, y)]
+        
+        if engines[0] is None:
+            n, mean, M2 = stats[0]
+            std_err = volume * np.sqrt(M2 / (n - 1) / n) if n > 1 else np.nan
+        else:
+            means = np.array([mean_r for _, mean_r, _ in stats])
+            n = sum(n_r for n_r, _, _ in stats)
+            mean = np.mean(means)
+            std_err = volume * np.std(means, ddof=1) / np.sqrt(len(means))
+        yield n, volume * mean, std_err
+
+def create_sample_capture(path, n, seed=0, chunk_size=1_000_000):
+    """Membuat data osiloskop sintetis (t, v) dengan timestamp tidak seragam di file .npy,
+    ditulis per chunk. Sinyal v = 0.5 + sin(2π·50·t) sehingga integral eksaknya diketahui."""
+    data = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=(n, 2))
+    rng = np.random.default_rng(seed)
+    t_last = 0.0
     
-    st.markdown("---")
-    st.subheader("📝 Input Sistem 3×3")
+    for start in range(0, n, chunk_size):
+        m = min(chunk_size, n - start)
+        dt = 1e-5 * rng.uniform(0.2, 1.8, m)
+        if start == 0:
+            dt[0] = 0.0
+        t = t_last + np.cumsum(dt)
+        data[start:start + m, 0] = t
+        data[start:start + m, 1] = 0.5 + np.sin(2 * np.pi * 50 * t)
+        t_last = t[-1]
     
-    st.info("💡 Masukkan koefisien untuk sistem 3 persamaan dengan 3 variabel (x₁, x₂, x₃)")
+    data.flush()
+    del data
     
-    # Input Matrix A
-    st.markdown("**Matriks Koefisien A:**")
-    col1, col2, col3, col4 = st.columns([2, 2, 2, 2])
+    t0 = 0.0
+    exact = 0.5 * (t_last - t0) + (np.cos(2 * np.pi * 50 * t0) - np.cos(2 * np.pi * 50 * t_last)) / (2 * np.pi * 50)
+    return exact
+
+def open_tabulated_file(path, work_dir, chunk_size=1_000_000):
+    """Membuka file data (x, y) tanpa memuat seluruh isi ke memori. File .npy di-memmap langsung;
+    CSV/TXT dikonversi per chunk ke file biner di work_dir (bukan di sebelah file sumber) lalu di-memmap."""
+    if path.endswith(".npy"):
+        data = np.load(path, mmap_mode='r')
+    else:
+        with open(path) as fh:
+            first = fh.readline().replace(";", ",").split(",")[0].strip()
+        try:
+            float(first)
+            header = None
+        except ValueError:
+            header = 0
+        
+        bin_path = os.path.join(work_dir, os.path.basename(path) + ".bin")
+        with open(bin_path, "wb") as out:
+            for chunk in pd.read_csv(path, header=header, sep=None, engine="python",
+                                     chunksize=chunk_size):
+                np.ascontiguousarray(chunk.iloc[:, :2].to_numpy(dtype=np.float64)).tofile(out)
+        data = np.memmap(bin_path, dtype=np.float64, mode='r').reshape(-1, 2)
     
-    with col1:
-        st.markdown("**Persamaan 1:**")
-        a11 = st.number_input("a₁₁", value=3.0, format="%.4f", key="a11")
-        a12 = st.number_input("a₁₂", value=2.0, format="%.4f", key="a12")
-        a13 = st.number_input("a₁₃", value=-1.0, format="%.4f", key="a13")
+    if data.ndim != 2 or 2 not in data.shape:
+        raise ValueError(f"Data harus berbentuk (N, 2) atau (2, N), bukan {data.shape}")
+    if data.shape[1] == 2:
+        return data[:, 0], data[:, 1]
+    return data[0], data[1]
+
+def simpson_nonuniform(x, y):
+    """Simpson 1/3 komposit untuk grid tidak seragam. Jumlah interval ganjil ditangani dengan
+    koreksi parabola pada interval terakhir (seperti scipy.integrate.simpson)."""
+    n_int = len(x) - 1
+    if n_int < 2:
+        raise ValueError("Simpson membutuhkan minimal 3 titik data")
     
-    with col2:
-        st.markdown("**Persamaan 2:**")
-        a21 = st.number_input("a₂₁", value=2.0, format="%.4f", key="a21")
-        a22 = st.number_input("a₂₂", value=-2.0, format="%.4f", key="a22")
-        a23 = st.number_input("a₂₃", value=4.0, format="%.4f", key="a23")
+    h = np.diff(x)
+    m = n_int - n_int % 2
+    h0, h1 = h[0:m:2], h[1:m:2]
+    y0, y1, y2 = y[0:m:2], y[1:m + 1:2], y[2:m + 1:2]
+    total = np.sum((h0 + h1) / 6 * ((2 - h1 / h0) * y0 + (h0 + h1)**2 / (h0 * h1) * y1 + (2 - h0 / h1) * y2))
     
-    with col3:
-        st.markdown("**Persamaan 3:**")
-        a31 = st.number_input("a₃₁", value=-1.0, format="%.4f", key="a31")
-        a32 = st.number_input("a₃₂", value=0.5, format="%.4f", key="a32")
-        a33 = st.number_input("a₃₃", value=-1.0, format="%.4f", key="a33")
+    if n_int % 2:
+        h0, h1 = h[-2], h[-1]
+        alpha = (2 * h1**2 + 3 * h0 * h1) / (6 * (h0 + h1))
+        beta = (h1**2 + 3 * h0 * h1) / (6 * h0)
+        eta = h1**3 / (6 * h0 * (h0 + h1))
+        total += alpha * y[-1] + beta * y[-2] - eta * y[-3]
     
-    with col4:
-        st.markdown("**Vektor b:**")
-        b1 = st.number_input("b₁", value=1.0, format="%.4f", key="b1")
-        b2 = st.number_input("b₂", value=-2.0, format="%.4f", key="b2")
-        b3 = st.number_input("b₃", value=0.0, format="%.4f", key="b3")
+    return total
+
+def integrate_tabulated(x, y, method="trapezoid", chunk_size=1_000_000, cumulative_points=2000, spline_pad=16):
+    """Integral data tabulasi (x naik, spasi bebas) yang diproses per chunk sehingga x dan y boleh
+    berupa memmap berukuran GB. Chunk berbagi satu titik batas; Simpson memakai chunk dengan jumlah
+    interval genap, spline memakai spline kubik lokal dengan titik tambahan di kedua sisi.
     
-    # Tampilkan sistem dalam bentuk LaTeX
-    st.markdown("---")
-    st.subheader("📐 Sistem Persamaan:")
+    Mengembalikan (integral, jumlah chunk, x kumulatif, integral kumulatif) dengan kurva kumulatif
+    (trapesium) yang sudah di-decimate menjadi sekitar cumulative_points titik."""
+    n = len(x)
+    if n < 2:
+        raise ValueError("Minimal 2 titik data dibutuhkan")
     
-    col1, col2 = st.columns([2, 1])
+    step = max(2, chunk_size - chunk_size % 2)
+    stride = max(1, (n - 1) // cumulative_points)
+    cum_x, cum_y = [float(x[0])], [0.0]
+    running = 0.0
+    total = 0.0
+    n_chunks = 0
+    s = 0
     
-    with col1:
-        st.latex(fr"""
-        \begin{{cases}}
-        {a11}x_1 + {a12}x_2 + {a13}x_3 = {b1} \\
-        {a21}x_1 + {a22}x_2 + {a23}x_3 = {b2} \\
-        {a31}x_1 + {a32}x_2 + {a33}x_3 = {b3}
-        \end{{cases}}
-        """)
+    while s < n - 1:
+        e = min(s + step, n - 1)
+        if n - 1 - e == 1:
+            e = n - 1  # hindari chunk terakhir dengan satu interval (Simpson butuh 3 titik)
+        
+        xs = np.asarray(x[s:e + 1], dtype=float)
+        ys = np.asarray(y[s:e + 1], dtype=float)
+        dx = np.diff(xs)
+        if np.any(dx <= 0):
+            bad = s + int(np.argmax(dx <= 0))
+            raise ValueError(f"Nilai x harus naik tegas; pelanggaran di baris {bad}–{bad + 1}")
+        
+        segment = 0.5 * dx * (ys[1:] + ys[:-1])
+        cum = running + np.cumsum(segment)
+        idx = np.arange(s + 1, e + 1)
+        keep = (idx % stride == 0) | (idx == n - 1)
+        cum_x.extend(xs[1:][keep])
+        cum_y.extend(cum[keep])
+        running = cum[-1]
+        
+        if method == "trapezoid":
+            total += segment.sum()
+        elif method == "simpson":
+            total += simpson_nonuniform(xs, ys)
+        elif method == "spline":
+            lo, hi = max(0, s - spline_pad), min(n - 1, e + spline_pad)
+            xp = np.asarray(x[lo:hi + 1], dtype=float)
+            yp = np.asarray(y[lo:hi + 1], dtype=float)
+            total += CubicSpline(xp, yp).integrate(xs[0], xs[-1])
+        else:
+            raise ValueError(f"Metode tidak dikenal: {method}")
+        
+        n_chunks += 1
+        s = e
     
-    with col2:
-        st.markdown("**Bentuk Matriks:**")
-        st.latex(r"""
-        \begin{bmatrix} A \end{bmatrix} 
-        \begin{bmatrix} x \end{bmatrix} = 
-        \begin{bmatrix} b \end{bmatrix}
-        """)
+    return total, n_chunks, np.array(cum_x), np.array(cum_y)
+
+def linear_euler_trajectory(A, b, x0, h, steps):
+    """Trajektori Euler eksplisit untuk model linear koefisien konstan dx/dt = A·x + b tanpa loop.
+    Rekurensi x_{k+1} = (I + hA)·x_k + h·b bersifat geometrik, sehingga dengan x* = −A⁻¹b dan
+    A = VΛV⁻¹ berlaku x_k = x* + V·(1 + hΛ)^k·V⁻¹(x0 − x*). Solusi analitik
+    x(t) = x* + V·exp(Λt)·V⁻¹(x0 − x*) dihitung di setiap langkah untuk perbandingan.
+    
+    Mengembalikan (t, x_euler, x_analitik, error maksimum per langkah)."""
+    scalar = np.ndim(x0) == 0
+    A = np.atleast_2d(np.asarray(A, dtype=float))
+    b = np.atleast_1d(np.asarray(b, dtype=float))
+    x0 = np.atleast_1d(np.asarray(x0, dtype=float))
+    
+    if np.linalg.cond(A) > 1e12:
+        raise ValueError("Matriks A harus nonsingular agar titik setimbang x* = −A⁻¹b ada")
+    
+    x_star = -np.linalg.solve(A, b)
+    lam, V = np.linalg.eig(A)
+    if np.all(np.isreal(lam)):
+        lam, V = lam.real, V.real
+    c = np.linalg.solve(V, (x0 - x_star).astype(V.dtype))
+    
+    k = np.arange(steps + 1)
+    t = k * h
+    growth_euler = np.power(1 + h * lam[None, :], k[:, None])
+    growth_exact = np.exp(lam[None, :] * t[:, None])
+    
+    x_euler = x_star + np.real((growth_euler * c) @ V.T)
+    x_exact = x_star + np.real((growth_exact * c) @ V.T)
+    error = np.max(np.abs(x_euler - x_exact), axis=1)
+    
+    if scalar:
+        return t, x_euler[:, 0], x_exact[:, 0], error
+    return t, x_euler, x_exact, error
+
+def build_ode_system(exprs, states):
+    """Membangun f(t, y) dan Jacobian ∂f/∂y untuk sistem PDB orde satu dy/dt = f(t, y) dengan SymPy"""
+    t_sym = sp.Symbol("t")
+    y_syms = sp.symbols(states)
+    F_expr = sp.Matrix(exprs)
+    J_expr = F_expr.jacobian(y_syms)
+    
+    F_num = sp.lambdify((t_sym, *y_syms), list(F_expr), 'numpy')
+    J_num = sp.lambdify((t_sym, *y_syms), J_expr, 'numpy')
+    
+    def f(t, y):
+        return np.array(F_num(t, *y), dtype=float)
+    
+    def J(t, y):
+        return np.array(J_num(t, *y), dtype=float)
+    
+    return f, J
+
+# Koefisien Dormand-Prince 5(4): node c, matriks a, bobot orde 5 (b) dan selisih b - b* untuk estimasi error
+DOPRI_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+DOPRI_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84],
+]
+DOPRI_B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+DOPRI_E = np.array([71/57600, 0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40])
+# Koefisien dense output orde 4 (Shampine): y(t + s·h) = y + h·Kᵀ·P·[s, s², s³, s⁴]
+DOPRI_P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423],
+])
+
+ODE_METHODS = {
+    "Euler": "euler",
+    "Heun (RK2)": "heun",
+    "Runge-Kutta 4": "rk4",
+    "Dormand-Prince RK45 (Adaptif)": "dopri5",
+    "Backward Euler (Implisit)": "backward_euler",
+    "BDF2 (Implisit)": "bdf2",
+}
+
+def implicit_ode_step(f, J, t_new, y_guess, rhs, gamma, max_newton=10):
+    """Menyelesaikan z - γ·f(t_new, z) = rhs dengan Newton termodifikasi (Jacobian dievaluasi sekali
+    per langkah). Mengembalikan (z, jumlah evaluasi f, konvergen?)."""
+    n = len(y_guess)
+    M = np.eye(n) - gamma * J(t_new, y_guess)
+    z = y_guess.copy()
+    
+    for k in range(max_newton):
+        G = z - gamma * f(t_new, z) - rhs
+        dz, _ = gauss_elimination(M, -G, "partial", record=False)
+        z = z + dz
+        if np.linalg.norm(dz) <= 1e-10 * (1 + np.linalg.norm(z)):
+            return z, k + 1, True
+    
+    return z, max_newton, False
+
+def hermite_dense_output(t0, y0, f0, t1, y1, f1):
+    """Interpolan Hermite kubik di dalam satu langkah (dense output) dari nilai dan turunan di kedua
+    ujung langkah; error O(h⁴) sehingga waktu event tidak terikat ke grid langkah"""
+    h = t1 - t0
+    
+    def y_at(t):
+        s = (t - t0) / h
+        return ((2 * s**3 - 3 * s**2 + 1) * y0 + (s**3 - 2 * s**2 + s) * h * f0
+                + (3 * s**2 - 2 * s**3) * y1 + (s**3 - s**2) * h * f1)
+    
+    return y_at
+
+def dopri_dense_output(t0, y0, K, h):
+    """Dense output orde 4 Dormand-Prince dari tahap-tahap K satu langkah, tanpa evaluasi f tambahan"""
+    Q = np.array(K).T @ DOPRI_P
+    
+    def y_at(t):
+        s = (t - t0) / h
+        return y0 + h * Q @ np.array([s, s**2, s**3, s**4])
     
-    # Tombol solve
-    if st.button("🚀 Selesaikan Sistem", type="primary"):
-        A = np.array([
-            [a11, a12, a13],
-            [a21, a22, a23],
-            [a31, a32, a33]
-        ])
-        b = np.array([b1, b2, b3])
+    return y_at
+
+def solve_ode(f, J, t_span, y0, method="rk4", h=0.01, rtol=1e-6, atol=1e-9, max_steps=200000, events=None):
+    """Integrasi sistem PDB dy/dt = f(t, y) pada t_span = (t0, t1).
+    
+    Metode langkah tetap (euler, heun, rk4, backward_euler, bdf2) memakai N = ⌈(t1 − t0)/h⌉ langkah
+    seragam; dopri5 memilih langkah sendiri dari estimasi error orde 4/5 dengan toleransi rtol/atol.
+    
+    events adalah daftar (g, terminal) dengan g(t, y) fungsi skalar. Pergantian tanda g diperiksa
+    setiap langkah, lalu waktunya diperhalus dengan brentq pada dense output; event terminal
+    menghentikan integrasi di titik event.
+    Mengembalikan (sol, msg) dengan sol berisi t, y, h, t_events, y_events, dan statistik langkah."""
+    t0, t1 = float(t_span[0]), float(t_span[1])
+    y = np.asarray(y0, dtype=float)
+    stats = {"n_steps": 0, "n_rejected": 0, "n_fev": 0, "n_jev": 0}
+    t_list, y_list, h_list = [t0], [y.copy()], []
+    events = events or []
+    t_events = [[] for _ in events]
+    y_events = [[] for _ in events]
+    msg = "✅ Integrasi selesai"
+    
+    def pack():
+        return {
+            "t": np.array(t_list),
+            "y": np.array(y_list),
+            "h": np.array(h_list),
+            "t_events": [np.array(te) for te in t_events],
+            "y_events": [np.array(ye).reshape(-1, len(y)) for ye in y_events],
+            **stats,
+        }
+    
+    def step_events(t_a, t_b, y_b, dense):
+        """Mencatat event di dalam langkah [t_a, t_b]; mengembalikan (t, y) event terminal pertama atau None"""
+        hits = []
         
-        try:
-            # Hitung determinan
-            det_A = np.linalg.det(A)
-            
-            st.markdown("---")
-            st.subheader("📊 Analisis Matriks")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.metric("Determinan", f"{det_A:.6f}")
-                if abs(det_A) < 1e-10:
-                    st.error("⚠️ Matriks singular! (det ≈ 0)")
-                    st.info("Sistem tidak memiliki solusi unik atau tidak memiliki solusi.")
-                else:
-                    st.success("✅ Matriks non-singular (det ≠ 0)")
+        for i, (g, terminal) in enumerate(events):
+            g_b = float(g(t_b, y_b))
+            if g_prev[i] != 0 and g_prev[i] * g_b <= 0:
+                t_ev = optimize.brentq(lambda s: g(s, dense(s)), t_a, t_b, xtol=1e-12 * (t_b - t_a))
+                hits.append((t_ev, i, terminal))
+            g_prev[i] = g_b
+        
+        for t_ev, i, terminal in sorted(hits):
+            y_ev = dense(t_ev)
+            t_events[i].append(t_ev)
+            y_events[i].append(y_ev)
+            if terminal:
+                return t_ev, y_ev
+        return None
+    
+    try:
+        if t1 <= t0:
+            return None, "❌ Error: t akhir harus lebih besar dari t awal"
+        
+        g_prev = [float(g(t0, y)) for g, _ in events]
+        
+        if method == "dopri5":
+            t = t0
+            k1 = f(t, y)
+            stats["n_fev"] += 1
             
-            with col2:
-                condition_number = np.linalg.cond(A)
-                st.metric("Condition Number", f"{condition_number:.2f}")
-                if condition_number > 1000:
-                    st.warning("⚠️ Matriks ill-conditioned (sensitif terhadap error)")
-                else:
-                    st.success("✅ Matriks well-conditioned")
+            # Tebakan langkah awal (Hairer, Nørsett & Wanner)
+            scale = atol + rtol * np.abs(y)
+            d0 = np.sqrt(np.mean((y / scale)**2))
+            d1 = np.sqrt(np.mean((k1 / scale)**2))
+            h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+            k_trial = f(t + h0, y + h0 * k1)
+            stats["n_fev"] += 1
+            d2 = np.sqrt(np.mean(((k_trial - k1) / scale)**2)) / h0
+            h1 = max(1e-6, h0 * 1e-3) if max(d1, d2) <= 1e-15 else (0.01 / max(d1, d2))**0.2
+            h_step = min(100 * h0, h1, t1 - t0)
             
-            # Solve
-            if abs(det_A) >= 1e-10:
-                sol = np.linalg.solve(A, b)
-                
-                st.markdown("---")
-                st.subheader("✅ Solusi")
-                
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    st.metric("x₁", f"{sol[0]:.6f}")
-                
-                with col2:
-                    st.metric("x₂", f"{sol[1]:.6f}")
-                
-                with col3:
-                    st.metric("x₃", f"{sol[2]:.6f}")
-                
-                # Verifikasi
-                st.markdown("---")
-                st.subheader("🔍 Verifikasi: A × x = b")
+            while t < t1:
+                if stats["n_steps"] + stats["n_rejected"] >= max_steps:
+                    msg = "⚠️ Maksimum langkah tercapai"
+                    break
                 
-                result = A @ sol
+                h_step = min(h_step, t1 - t)
+                K = [k1]
+                for s in range(1, 7):
+                    y_stage = y + h_step * sum(a * k for a, k in zip(DOPRI_A[s], K))
+                    K.append(f(t + DOPRI_C[s] * h_step, y_stage))
+                stats["n_fev"] += 6
                 
-                verification_df = pd.DataFrame({
-                    'Persamaan': ['Persamaan 1', 'Persamaan 2', 'Persamaan 3'],
-                    'A×x (Hasil)': result,
-                    'b (Target)': b,
-                    'Error': np.abs(result - b)
-                })
+                y_new = y + h_step * np.dot(DOPRI_B, K)
+                err_vec = h_step * np.dot(DOPRI_E, K)
+                scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+                err = np.sqrt(np.mean((err_vec / scale)**2))
                 
-                st.dataframe(verification_df.style.format({
-                    'A×x (Hasil)': '{:.6f}',
-                    'b (Target)': '{:.6f}',
-                    'Error': '{:.2e}'
-                }), use_container_width=True)
+                if not np.isfinite(err):
+                    msg = f"⚠️ Solusi divergen pada t = {t:.6g}"
+                    break
                 
-                max_error = np.max(np.abs(result - b))
-                if max_error < 1e-6:
-                    st.success(f"✅ Verifikasi berhasil! Max error: {max_error:.2e}")
+                if err <= 1.0:
+                    hit = None
+                    if events:
+                        hit = step_events(t, t + h_step, y_new, dopri_dense_output(t, y, K, h_step))
+                    t = t + h_step
+                    y = y_new
+                    k1 = K[6]  # FSAL: tahap terakhir = f di titik baru
+                    stats["n_steps"] += 1
+                    
+                    if hit is not None:
+                        t_list.append(hit[0])
+                        y_list.append(hit[1])
+                        h_list.append(hit[0] - t_list[-2])
+                        msg = f"✅ Dihentikan oleh event terminal pada t = {hit[0]:.6g}"
+                        break
+                    
+                    t_list.append(t)
+                    y_list.append(y.copy())
+                    h_list.append(h_step)
+                    factor = min(10.0, 0.9 * err**-0.2) if err > 0 else 10.0
                 else:
-                    st.warning(f"⚠️ Error verifikasi: {max_error:.2e}")
+                    stats["n_rejected"] += 1
+                    factor = max(0.2, 0.9 * err**-0.2)
                 
-                # Visualisasi (untuk sistem 2D)
-                st.markdown("---")
-                st.info("""
-                💡 **Metode yang Digunakan:**
+                h_step *= factor
+            
+            return pack(), msg
+        
+        n_steps = int(np.ceil((t1 - t0) / h - 1e-9))
+        if n_steps > max_steps:
+            return None, f"❌ Error: {n_steps:,} langkah melebihi batas {max_steps:,}. Perbesar h."
+        h_step = (t1 - t0) / n_steps
+        y_prev = None
+        
+        if events:
+            f_cur = f(t0, y)
+            stats["n_fev"] += 1
+        
+        for i in range(n_steps):
+            t = t0 + i * h_step
+            
+            if method == "euler":
+                y_new = y + h_step * f(t, y)
+                stats["n_fev"] += 1
+            elif method == "heun":
+                k1 = f(t, y)
+                k2 = f(t + h_step, y + h_step * k1)
+                y_new = y + h_step / 2 * (k1 + k2)
+                stats["n_fev"] += 2
+            elif method == "rk4":
+                k1 = f(t, y)
+                k2 = f(t + h_step / 2, y + h_step / 2 * k1)
+                k3 = f(t + h_step / 2, y + h_step / 2 * k2)
+                k4 = f(t + h_step, y + h_step * k3)
+                y_new = y + h_step / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+                stats["n_fev"] += 4
+            elif method in ("backward_euler", "bdf2"):
+                if method == "bdf2" and y_prev is not None:
+                    rhs, gamma = 4 / 3 * y - 1 / 3 * y_prev, 2 / 3 * h_step
+                else:
+                    rhs, gamma = y, h_step  # BDF2 dimulai dengan satu langkah Backward Euler
+                y_new, n_newton, ok = implicit_ode_step(f, J, t + h_step, y, rhs, gamma)
+                stats["n_fev"] += n_newton
+                stats["n_jev"] += 1
+                if not ok:
+                    msg = f"⚠️ Newton tidak konvergen pada t = {t + h_step:.6g}"
+                    break
+            else:
+                return None, f"❌ Error: metode tidak dikenal: {method}"
+            
+            if not np.all(np.isfinite(y_new)) or np.max(np.abs(y_new)) > 1e100:
+                msg = f"⚠️ Solusi divergen pada t = {t + h_step:.6g}"
+                break
+            
+            if events:
+                f_new = f(t + h_step, y_new)
+                stats["n_fev"] += 1
+                hit = step_events(t, t + h_step, y_new,
+                                  hermite_dense_output(t, y, f_cur, t + h_step, y_new, f_new))
+                f_cur = f_new
                 
-                NumPy menggunakan algoritma LAPACK yang didasarkan pada:
-                - **LU Decomposition** untuk matriks umum
-                - **Gaussian Elimination** dengan partial pivoting
-                - Sangat efisien dan stabil secara numerik
-                """)
+                if hit is not None:
+                    stats["n_steps"] += 1
+                    t_list.append(hit[0])
+                    y_list.append(hit[1])
+                    h_list.append(hit[0] - t)
+                    msg = f"✅ Dihentikan oleh event terminal pada t = {hit[0]:.6g}"
+                    break
+            
+            y_prev, y = y, y_new
+            stats["n_steps"] += 1
+            t_list.append(t0 + (i + 1) * h_step)
+            y_list.append(y.copy())
+            h_list.append(h_step)
         
-        except np.linalg.LinAlgError as e:
-            st.error(f"❌ Error: Singular Matrix! {e}")
-            st.info("""
-            **Penyebab:**
-            - Determinan = 0
-            - Ada persamaan yang redundan
-            - Tidak ada solusi unik
-            """)
+        return pack(), msg
+    
+    except Exception as e:
+        return None, f"❌ Error: {e}"
 
-# --- HALAMAN 5: INTERPOLASI ---
-elif menu == "📈 Interpolasi":
-    st.header("📈 Interpolasi & Regresi")
+def rc_parameter_sweep(R_vals, C_vals, h_vals, Vin, t_max_factor, milestones=(0.63, 0.99), block=512):
+    """Sweep Euler rangkaian RC untuk semua kombinasi R × C × h sekaligus. Vektor state berisi satu
+    Vc per kombinasi; semua kombinasi dimajukan bersama per blok langkah dengan bentuk tertutup
+    rekurensi Euler, Vc_{k+m} = Vin + (Vc_k − Vin)·(1 − h/τ)^m. Kombinasi yang sudah mencapai
+    t_max (t_max_factor·τ) dikeluarkan dari batch.
     
-    st.markdown("""
-    <div class="concept-box">
-    <h4>🎯 Perbedaan Interpolasi vs Regresi</h4>
+    Mengembalikan dict berisi grid (nR, nC, nh) untuk error maksimum, waktu milestone, dan Vc akhir."""
+    Rg, Cg, hg = np.meshgrid(R_vals, C_vals, h_vals, indexing='ij')
+    shape = Rg.shape
+    tau = (Rg * Cg).ravel()
+    h = hg.ravel()
+    n_steps = np.maximum(1, (t_max_factor * tau / h).astype(np.int64))
+    r = 1 - h / tau
+    n_combo = tau.size
     
-    **Interpolasi:**
-    - "Hubungkan titik-titik dengan kurva yang MELEWATI semua titik"
-    - Digunakan ketika data akurat dan sedikit
-    - Contoh: Menghitung suhu di jam 14:30 dari data jam 14:00 dan 15:00
+    vc = np.zeros(n_combo)
+    max_error = np.zeros(n_combo)
+    t_milestone = np.full((len(milestones), n_combo), np.nan)
+    targets = np.asarray(milestones)[:, None] * Vin
     
-    **Regresi:**
-    - "Cari pola/tren UMUM dari data yang berantakan"
-    - Digunakan ketika data banyak dan ada noise/error
-    - Contoh: Memprediksi harga rumah dari data historis yang bervariasi
-    </div>
-    """, unsafe_allow_html=True)
+    active = np.arange(n_combo)
+    k0 = 0
+    m = np.arange(1, block + 1)
     
-    st.markdown("---")
+    with np.errstate(over='ignore', invalid='ignore'):
+        while active.size:
+            # Trajektori blok untuk semua kombinasi aktif: (n_aktif, block)
+            k = k0 + m
+            traj = Vin + (vc[active, None] - Vin) * np.power(r[active, None], m)
+            exact = Vin * (1 - np.exp(-k * h[active, None] / tau[active, None]))
+            valid = k <= n_steps[active, None]
+            
+            err = np.where(valid, np.abs(traj - exact), 0.0)
+            max_error[active] = np.maximum(max_error[active], np.max(err, axis=1))
+            
+            # Milestone: langkah pertama yang melewati target, diinterpolasi linear di dalam langkah
+            for j in range(len(milestones)):
+                pending = np.flatnonzero(np.isnan(t_milestone[j, active]))
+                if pending.size == 0:
+                    continue
+                crossed = valid[pending] & (traj[pending] >= targets[j])
+                hit = np.any(crossed, axis=1)
+                rows = pending[hit]
+                if rows.size:
+                    idx = np.argmax(crossed[hit], axis=1)
+                    v1 = traj[rows, idx]
+                    v0 = np.where(idx > 0, traj[rows, np.maximum(idx - 1, 0)], vc[active[rows]])
+                    frac = np.clip((targets[j] - v0) / (v1 - v0), 0, 1)
+                    t_milestone[j, active[rows]] = (k0 + idx + frac) * h[active[rows]]
+            
+            last = np.minimum(n_steps[active] - k0, block) - 1
+            vc[active] = traj[np.arange(active.size), last]
+            
+            k0 += block
+            active = active[n_steps[active] > k0]
     
-    tab1, tab2 = st.tabs(["📍 Interpolasi", "📊 Regresi"])
+    return {
+        "max_error": max_error.reshape(shape),
+        "t_milestone": t_milestone.reshape((len(milestones),) + shape),
+        "vc_final": vc.reshape(shape),
+        "tau": tau.reshape(shape),
+        "total_steps": int(n_steps.sum()),
+        "n_combo": n_combo,
+    }
+
+def waveform_template(kind, period, steps_per_period, v_high=5.0, v_low=0.0, duty=0.5, pwl_points=None):
+    """Grid satu periode sumber tegangan dengan breakpoint (tepi PWM, sudut PWL) tepat di titik grid.
+    Mengembalikan (t_grid, uL, uR): waktu titik grid dalam satu periode, serta nilai input di awal
+    (limit kanan) dan akhir (limit kiri) setiap langkah sehingga lompatan tidak pernah berada di dalam langkah."""
+    if kind in ("square", "pwm"):
+        d = 0.5 if kind == "square" else duty
+        knots = np.array([0.0, d, 1.0])
+        levels = [(v_high, v_high), (v_low, v_low)]
+    elif kind == "sine":
+        knots = np.array([0.0, 1.0])
+        levels = None
+    elif kind == "pwl":
+        pts = np.asarray(pwl_points, dtype=float)
+        knots = pts[:, 0]
+        levels = list(zip(pts[:-1, 1], pts[1:, 1]))
+    else:
+        raise ValueError(f"Bentuk gelombang tidak dikenal: {kind}")
     
-    with tab1:
-        st.subheader("📍 Interpolasi Polinomial")
+    t_parts, uL_parts, uR_parts = [], [], []
+    for i in range(len(knots) - 1):
+        seg = knots[i + 1] - knots[i]
+        if seg <= 0:
+            continue
+        n_seg = max(1, int(round(steps_per_period * seg)))
+        s = np.linspace(knots[i], knots[i + 1], n_seg + 1)
         
-        st.markdown("""
-        **Prinsip:** Cari polinomial derajat n-1 yang melewati n titik data.
+        if levels is None:
+            u = (v_high + v_low) / 2 + (v_high - v_low) / 2 * np.sin(2 * np.pi * s)
+        else:
+            u = np.interp(s, [knots[i], knots[i + 1]], levels[i])
         
-        Jika ada 4 titik data, kita cari polinomial derajat 3: P(x) = ax³ + bx² + cx + d
-        """)
+        t_parts.append(s[:-1])
+        uL_parts.append(u[:-1])
+        uR_parts.append(u[1:])
+    
+    t_grid = np.append(np.concatenate(t_parts), 1.0) * period
+    return t_grid, np.concatenate(uL_parts), np.concatenate(uR_parts)
+
+def iter_waveform_simulation(t_grid, uL, uR, tau, n_periods, v0=0.0, chunk_steps=1_000_000, n_trace=2000):
+    """Generator simulasi RC dVc/dt = (u(t) − Vc)/τ untuk sumber periodik, diproses per chunk periode.
+    
+    Setiap langkah memakai diskretisasi eksak first-order hold (tepat untuk input linear per langkah):
+    V_{j+1} = a_j·V_j + c_j. Dalam satu periode V_j = α_j·V_awal + β_j, dan awal periode ke-m mengikuti
+    peta afin V_awal[m] = V* + A^m·(V_awal[0] − V*), sehingga satu chunk berisi M periode dihitung sebagai
+    satu outer product (M, N). Setiap chunk menghasilkan statistik ringkas dan envelope min/max
+    yang sudah di-downsample; hanya satu chunk yang ada di memori."""
+    h = np.diff(t_grid)
+    period = t_grid[-1]
+    n_step = len(h)
+    
+    one_minus_a = -np.expm1(-h / tau)
+    a = 1 - one_minus_a
+    c = uL * one_minus_a + (uR - uL) * (1 - tau * one_minus_a / h)
+    
+    alpha = np.concatenate([[1.0], np.cumprod(a)])
+    beta = np.zeros(n_step + 1)
+    for j in range(n_step):
+        beta[j + 1] = a[j] * beta[j] + c[j]
+    
+    A, B = alpha[-1], beta[-1]
+    v_star = B / -np.expm1(-period / tau)  # titik tetap awal periode
+    w = np.concatenate([[h[0] / 2], (h[:-1] + h[1:]) / 2, [h[-1] / 2]]) / period  # bobot rata-rata trapesium
+    
+    periods_per_chunk = max(1, chunk_steps // n_step)
+    group = max(1, -(-n_periods // n_trace))  # periode per titik envelope
+    periods_per_chunk = max(group, periods_per_chunk - periods_per_chunk % group)
+    v_start = float(v0)
+    done = 0
+    
+    while done < n_periods:
+        M = min(periods_per_chunk, n_periods - done)
+        m = np.arange(M)
+        starts = v_star + np.power(A, m) * (v_start - v_star)
+        V = starts[:, None] * alpha[None, :] + beta[None, :]
         
-        # Input data
+        per_min = V.min(axis=1)
+        per_max = V.max(axis=1)
+        per_mean = V @ w
+        
+        n_group = -(-M // group)
+        pad = n_group * group - M
+        g_min = np.pad(per_min, (0, pad), constant_values=np.inf).reshape(n_group, group).min(axis=1)
+        g_max = np.pad(per_max, (0, pad), constant_values=-np.inf).reshape(n_group, group).max(axis=1)
+        
+        yield {
+            "periods_done": done + M,
+            "steps_done": (done + M) * n_step,
+            "t_env": (done + m[::group]) * period,
+            "env_min": g_min,
+            "env_max": g_max,
+            "last_period": V[-1],
+            "ripple": per_max[-1] - per_min[-1],
+            "mean": per_mean[-1],
+            "v_star": v_star,
+            "A": A,
+        }
+        
+        v_start = V[-1, -1]
+        done += M
+
+def transfer_function_response(num, den, f):
+    """Evaluasi H(s) = num(s)/den(s) di s = j·2πf untuk seluruh grid frekuensi sekaligus.
+    Koefisien polinom berurutan dari pangkat tertinggi (RC: num = [1], den = [RC, 1])."""
+    s = 2j * np.pi * np.asarray(f, dtype=float)
+    return np.polyval(num, s) / np.polyval(den, s)
+
+def find_cutoff_frequency(num, den, f, H, all_crossings=False):
+    """Frekuensi −3 dB (setengah daya relatif terhadap gain DC, atau gain maksimum di grid jika gain DC
+    nol/tak hingga, mis. high-pass atau band-pass): setiap pergantian tanda |H|dB + 3 dB pada grid
+    diperhalus dengan brentq pada |H(j2πf)|. Mengembalikan crossing pertama (None jika tidak ada),
+    atau daftar semua crossing jika all_crossings=True (band-pass: tepi bawah dan atas)."""
+    half_power_db = 10 * np.log10(2)
+    num0, den0 = np.polyval(num, 0.0), np.polyval(den, 0.0)
+    
+    if num0 != 0 and den0 != 0:
+        ref = abs(num0 / den0)
+    else:
+        # Puncak |H| diperhalus di sekitar maksimum grid; untuk derajat num = derajat den,
+        # gain frekuensi tinggi num[0]/den[0] juga kandidat (high-pass)
+        k = int(np.argmax(np.abs(H)))
+        puncak = optimize.minimize_scalar(
+            lambda fr: -abs(transfer_function_response(num, den, fr)),
+            bounds=(f[max(k - 1, 0)], f[min(k + 1, len(f) - 1)]),
+            method='bounded',
+            options={'xatol': 1e-12 * f[k]}
+        )
+        ref = max(np.abs(H[k]), -puncak.fun)
+        num_lead, den_lead = np.trim_zeros(np.asarray(num, dtype=float), 'f'), np.trim_zeros(np.asarray(den, dtype=float), 'f')
+        if len(num_lead) == len(den_lead):
+            ref = max(ref, abs(num_lead[0] / den_lead[0]))
+    ref_db = 20 * np.log10(ref)
+    
+    with np.errstate(divide='ignore'):
+        selisih = 20 * np.log10(np.abs(H)) - ref_db + half_power_db
+    
+    def g(fr):
+        return 20 * np.log10(np.abs(transfer_function_response(num, den, fr))) - ref_db + half_power_db
+    
+    atas = selisih > 0
+    crossings = [
+        optimize.brentq(g, f[k], f[k + 1], xtol=1e-12 * f[k + 1])
+        for k in np.flatnonzero(atas[:-1] != atas[1:])
+    ]
+    
+    if all_crossings:
+        return crossings
+    return crossings[0] if crossings else None
+
+def fft_frequency_response(t, y_step, amplitude):
+    """Respon frekuensi dari respon step tersimulasi: selisih Δy_k adalah respon impuls × Δt,
+    sehingga H(f) ≈ FFT(Δy)/amplitudo. Mengembalikan (f, H, respon impuls)."""
+    dt = t[1] - t[0]
+    dy = np.diff(y_step) / amplitude
+    H = np.fft.rfft(dy)
+    f = np.fft.rfftfreq(len(dy), dt)
+    return f, H, dy / dt
+
+def distribution_sigma(kind, nominal, tol_pct):
+    """Simpangan baku input dari toleransi ±tol%: normal (toleransi = 3σ), uniform, atau triangular"""
+    half_width = abs(nominal) * tol_pct / 100
+    return {"normal": half_width / 3, "uniform": half_width / np.sqrt(3), "triangular": half_width / np.sqrt(6)}[kind]
+
+def sample_distribution(rng, kind, nominal, tol_pct, size):
+    """Sampel satu input berdistribusi normal/uniform/triangular di sekitar nilai nominal"""
+    half_width = abs(nominal) * tol_pct / 100
+    if kind == "normal":
+        return rng.normal(nominal, half_width / 3, size)
+    if kind == "uniform":
+        return rng.uniform(nominal - half_width, nominal + half_width, size)
+    if kind == "triangular":
+        return rng.triangular(nominal - half_width, nominal, nominal + half_width, size)
+    raise ValueError(f"Distribusi tidak dikenal: {kind}")
+
+def histogram_percentiles(counts, edges, q, underflow=0, overflow=0):
+    """Persentil dari histogram berjalan dengan interpolasi linear di dalam bin. Sampel di luar rentang
+    bin (underflow/overflow) ikut dihitung; persentil yang jatuh di sana dikembalikan sebagai NaN."""
+    cum = np.concatenate([[underflow], underflow + np.cumsum(counts)])
+    total = cum[-1] + overflow
+    targets = np.asarray(q) / 100 * total
+    result = np.interp(targets, cum, edges)
+    result[(targets < cum[0]) | (targets > cum[-1])] = np.nan
+    return result
+
+def iter_monte_carlo_propagation(f, inputs, n_samples, chunk_size=1_000_000, n_bins=4096, seed=0):
+    """Generator propagasi ketidakpastian Monte Carlo: inputs adalah daftar (distribusi, nominal, tol%)
+    sesuai urutan argumen f. Setiap chunk dievaluasi tervektorisasi, lalu mean/varians digabung
+    (merge_running_stats) dan histogram berbin tetap diperbarui, sehingga memori konstan.
+    Rentang bin ditetapkan dari chunk pertama (diperlebar 50% di kedua sisi)."""
+    rng = np.random.default_rng(seed)
+    stats = (0, 0.0, 0.0)
+    counts = np.zeros(n_bins, dtype=np.int64)
+    edges = None
+    underflow = overflow = 0
+    y_min, y_max = np.inf, -np.inf
+    
+    while stats[0] < n_samples:
+        m = min(chunk_size, n_samples - stats[0])
+        samples = [sample_distribution(rng, kind, nom, tol, m) for kind, nom, tol in inputs]
+        y = np.broadcast_to(np.asarray(f(*samples), dtype=float), (m,))
+        
+        if not np.all(np.isfinite(y)):
+            raise ValueError("Fungsi menghasilkan nilai tidak hingga/NaN untuk sebagian sampel")
+        
+        if edges is None:
+            lo, hi = y.min(), y.max()
+            span = max(hi - lo, 1e-12 * max(abs(lo), 1.0))
+            edges = np.linspace(lo - 0.5 * span, hi + 0.5 * span, n_bins + 1)
+        
+        counts += np.histogram(y, bins=edges)[0]
+        underflow += int(np.sum(y < edges[0]))
+        overflow += int(np.sum(y > edges[-1]))
+        y_min, y_max = min(y_min, y.min()), max(y_max, y.max())
+        stats = merge_running_stats(stats, y)
+        
+        n, mean, M2 = stats
+        yield {
+            "n": n,
+            "mean": mean,
+            "std": np.sqrt(M2 / (n - 1)) if n > 1 else np.nan,
+            "min": y_min,
+            "max": y_max,
+            "counts": counts,
+            "edges": edges,
+            "underflow": underflow,
+            "overflow": overflow,
+        }
+
+def linearized_propagation(expr, variables, inputs):
+    """Propagasi orde satu: σ_f² = Σ (∂f/∂x_i · σ_i)², dengan gradien simbolik SymPy di titik nominal.
+    Mengembalikan (f nominal, σ_f, daftar (variabel, ∂f/∂x_i, kontribusi varians))."""
+    syms = sp.symbols(variables)
+    nominal = {s: nom for s, (_, nom, _) in zip(syms, inputs)}
+    f_nom = float(expr.subs(nominal))
+    
+    rincian = []
+    var_total = 0.0
+    for s, (kind, nom, tol) in zip(syms, inputs):
+        dfdx = float(sp.diff(expr, s).subs(nominal))
+        kontribusi = (dfdx * distribution_sigma(kind, nom, tol))**2
+        var_total += kontribusi
+        rincian.append((str(s), dfdx, kontribusi))
+    
+    return f_nom, np.sqrt(var_total), rincian
+
+NUMBER_TYPES = {
+    "float32 (single)": "float32",
+    "float64 (double)": "float64",
+    "mpmath (presisi sembarang)": "mpmath",
+}
+
+def precision_function(expr, variable, number_type):
+    """Lambdify ekspresi SymPy untuk tipe bilangan tertentu. float32/float64 memakai NumPy dan hasilnya
+    di-cast kembali ke dtype tersebut (tidak diam-diam naik ke float64); mpmath memakai modul mpmath
+    sehingga presisi mengikuti mpmath.mp.dps saat dievaluasi."""
+    if number_type == "mpmath":
+        return sp.lambdify(variable, expr, modules="mpmath")
+    
+    dtype = np.float32 if number_type == "float32" else np.float64
+    g = sp.lambdify(variable, expr, modules="numpy")
+    
+    def f(x):
+        x = np.asarray(x, dtype=dtype)
+        return np.broadcast_to(np.asarray(g(x), dtype=dtype), x.shape)[()]
+    
+    return f
+
+def trapezoid_rule(f, a, b, n, number_type="float64"):
+    """Trapesium komposit n segmen seragam dalam tipe bilangan yang dipilih.
+    float32/float64 tervektorisasi (f dievaluasi pada array), mpmath memakai mpmath.fsum per titik."""
+    if number_type == "mpmath":
+        a, b = mpmath.mpf(a), mpmath.mpf(b)
+        h = (b - a) / n
+        interior = mpmath.fsum(f(a + i * h) for i in range(1, n))
+        return h * (interior + (f(a) + f(b)) / 2)
+    
+    dtype = np.float32 if number_type == "float32" else np.float64
+    x = np.linspace(a, b, n + 1, dtype=dtype)
+    y = np.broadcast_to(np.asarray(f(x), dtype=dtype), x.shape)
+    h = dtype((b - a) / n)
+    return h * (np.sum(y[1:-1], dtype=dtype) + (y[0] + y[-1]) / 2)
+
+def euler_recurrence(a, b, x0, h, steps, number_type="float64"):
+    """Euler eksplisit untuk PDB linear skalar dx/dt = a·x + b, yaitu x_{k+1} = (1 + h·a)·x_k + h·b.
+    float32/float64 dihitung sebagai filter IIR orde satu (scipy.signal.lfilter) dalam dtype tersebut,
+    mpmath dengan loop Python. Mengembalikan array x_0..x_steps."""
+    if number_type == "mpmath":
+        r = 1 + mpmath.mpf(h) * a
+        c = mpmath.mpf(h) * b
+        x = [mpmath.mpf(x0)]
+        for _ in range(steps):
+            x.append(r * x[-1] + c)
+        return np.array(x, dtype=object)
+    
+    dtype = np.float32 if number_type == "float32" else np.float64
+    r = dtype(1 + h * a)
+    c = dtype(h * b)
+    x0 = dtype(x0)
+    y = signal.lfilter(
+        np.array([c], dtype=dtype), np.array([1, -r], dtype=dtype),
+        np.ones(steps, dtype=dtype), zi=np.array([r * x0], dtype=dtype)
+    )[0]
+    return np.concatenate(([x0], y))
+
+REFERENCE_CACHE_DIR = os.environ.get(
+    "NUMERIK_REFERENCE_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".reference_cache")
+)
+REFERENCE_DPS = 30
+
+def canonical_problem(kind, **fields):
+    """Deskripsi masalah kanonik untuk kunci cache: ekspresi SymPy ditulis sebagai sp.srepr (tidak peka
+    spasi atau gaya penulisan), bilangan sebagai repr float, diserialisasi JSON dengan kunci terurut"""
+    def normalize(v):
+        if isinstance(v, sp.Basic):
+            return sp.srepr(v)
+        if isinstance(v, (list, tuple, np.ndarray)):
+            return [normalize(u) for u in v]
+        if isinstance(v, (int, np.integer)):
+            return str(int(v))
+        if isinstance(v, (float, np.floating)):
+            return repr(float(v))
+        return str(v)
+    
+    return json.dumps({"kind": kind, **{k: normalize(v) for k, v in fields.items()}},
+                      sort_keys=True, separators=(",", ":"))
+
+def cached_reference(problem, compute):
+    """Nilai referensi presisi tinggi dengan cache persisten di disk: satu berkas JSON per sha256 dari
+    deskripsi kanonik. compute() (mengembalikan daftar mpf) hanya dipanggil jika belum ada di cache.
+    Mengembalikan (daftar mpf, dari_cache)."""
+    key = hashlib.sha256(problem.encode("utf-8")).hexdigest()
+    path = os.path.join(REFERENCE_CACHE_DIR, key + ".json")
+    
+    try:
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        if data["problem"] == problem:
+            return [mpmath.mpf(v) for v in data["value"]], True
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    values = compute()
+    
+    # Tulis atomik (berkas sementara + os.replace); cache read-only tidak menggagalkan perhitungan
+    try:
+        os.makedirs(REFERENCE_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=REFERENCE_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump({"problem": problem, "value": [mpmath.nstr(v, mpmath.mp.dps + 5) for v in values]}, fh)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    
+    return values, False
+
+def precise_constant(expr, dps=REFERENCE_DPS):
+    """Nilai ekspresi SymPy konstan (mis. sqrt(2), pi/4, Integral(...)) dengan dps digit, di-cache"""
+    problem = canonical_problem("constant", expr=expr, dps=dps)
+    
+    def compute():
+        return [mpmath.mpf(str(sp.N(expr, dps)))]
+    
+    with mpmath.workdps(dps):
+        values, from_cache = cached_reference(problem, compute)
+    return values[0], from_cache
+
+def precise_root(expr, near, dps=REFERENCE_DPS):
+    """Akar f(x) = 0 terdekat dari pendekatan numerik, dihitung mpmath.findroot dengan dps digit.
+    Kunci cache memakai pendekatan yang dibulatkan ke 8 digit signifikan sehingga run berulang
+    dengan metode atau toleransi berbeda memakai referensi yang sama."""
+    near = f"{float(near):.8g}"
+    problem = canonical_problem("root", expr=expr, near=near, dps=dps)
+    
+    def compute():
+        f = sp.lambdify(sp.Symbol("x"), expr, modules="mpmath")
+        return [mpmath.findroot(f, mpmath.mpf(near))]
+    
+    with mpmath.workdps(dps):
+        values, from_cache = cached_reference(problem, compute)
+    return values[0], from_cache
+
+def precise_integral(expr, a, b, dps=REFERENCE_DPS):
+    """Integral tentu f(x) pada [a, b] dengan mpmath.quad (tanh-sinh) dps digit, di-cache. Interval
+    dibagi 1, 4, 16, ... bagian sampai dua pembagian berurutan sepakat, agar integran osilatif
+    (satu panel tanh-sinh tidak cukup) tetap benar."""
+    problem = canonical_problem("integral", expr=expr, a=a, b=b, dps=dps, scheme="subdivided")
+    
+    def compute():
+        f = sp.lambdify(sp.Symbol("x"), expr, modules="mpmath")
+        toleransi = mpmath.mpf(10) ** (5 - dps)
+        sebelumnya = None
+        pieces = 1
+        while True:
+            nilai = mpmath.quad(f, mpmath.linspace(mpmath.mpf(a), mpmath.mpf(b), pieces + 1))
+            if sebelumnya is not None and abs(nilai - sebelumnya) <= toleransi * max(1, abs(nilai)):
+                return [nilai]
+            if pieces >= 1024:
+                return [nilai]
+            sebelumnya = nilai
+            pieces *= 4
+    
+    with mpmath.workdps(dps):
+        values, from_cache = cached_reference(problem, compute)
+    return values[0], from_cache
+
+def precise_ode_end(exprs, states, t_span, y0, dps=20):
+    """Nilai akhir y(t1) sistem dy/dt = f(t, y) dengan integrator deret Taylor mpmath.odefun
+    (dps digit), di-cache. Bisa beberapa detik untuk sistem kaku, tetapi hanya sekali."""
+    problem = canonical_problem("ode_end", exprs=list(exprs), states=list(states),
+                                t_span=list(t_span), y0=list(y0), dps=dps)
+    
+    def compute():
+        fs = [sp.lambdify((sp.Symbol("t"), *sp.symbols(states)), e, modules="mpmath") for e in exprs]
+        sol = mpmath.odefun(lambda t, y: [f(t, *y) for f in fs],
+                            mpmath.mpf(t_span[0]), [mpmath.mpf(float(v)) for v in y0])
+        return list(sol(mpmath.mpf(t_span[1])))
+    
+    with mpmath.workdps(dps):
+        values, from_cache = cached_reference(problem, compute)
+    return values, from_cache
+
+def precise_linear_solution(A, b, dps=REFERENCE_DPS):
+    """Solusi Ax = b dengan mpmath.lu_solve (dps digit) dari entri float yang sama persis, di-cache"""
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    problem = canonical_problem("linear", A=A.ravel(), b=b, n=A.shape[0], dps=dps)
+    
+    def compute():
+        x = mpmath.lu_solve(mpmath.matrix(A.tolist()), mpmath.matrix(b.tolist()))
+        return [x[i] for i in range(len(b))]
+    
+    with mpmath.workdps(dps):
+        values, from_cache = cached_reference(problem, compute)
+    return values, from_cache
+
+def true_error(approx, reference):
+    """Galat absolut dan relatif (%) sebenarnya terhadap referensi mpmath (relatif NaN jika referensi nol)"""
+    abs_err = abs(mpmath.mpf(float(approx)) - reference)
+    rel_err = abs_err / abs(reference) * 100 if reference != 0 else mpmath.nan
+    return float(abs_err), float(rel_err)
+
+def show_true_error(approx, reference, from_cache, label="Nilai Referensi"):
+    """Menampilkan referensi presisi tinggi beserta galat absolut dan relatif sebenarnya"""
+    abs_err, rel_err = true_error(approx, reference)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(label, mpmath.nstr(reference, 15))
+    
+    with col2:
+        st.metric("Galat Absolut Sebenarnya", f"{abs_err:.3e}")
+    
+    with col3:
+        st.metric("Galat Relatif Sebenarnya", f"{rel_err:.3e}%" if np.isfinite(rel_err) else "-")
+    
+    st.caption(f"Referensi mpmath {'dari cache disk' if from_cache else 'dihitung dan disimpan ke cache disk'} "
+               f"({REFERENCE_CACHE_DIR})")
+
+DIFF_STENCILS = {
+    "Central": "central",
+    "Forward": "forward",
+    "Backward": "backward",
+}
+
+def fornberg_weights(z, x, m):
+    """Bobot beda hingga Fornberg (1988) untuk turunan ke-0..m di titik z dari nilai pada node x
+    (sembarang, tidak harus seragam). Mengembalikan array (m+1, len(x))."""
+    n = len(x)
+    c = np.zeros((n, m + 1))
+    c[0, 0] = 1.0
+    c1, c4 = 1.0, x[0] - z
+    
+    for i in range(1, n):
+        mn = min(i, m)
+        c2, c5, c4 = 1.0, c4, x[i] - z
+        for j in range(i):
+            c3 = x[i] - x[j]
+            c2 *= c3
+            if j == i - 1:
+                for k in range(mn, 0, -1):
+                    c[i, k] = c1 * (k * c[i - 1, k - 1] - c5 * c[i - 1, k]) / c2
+                c[i, 0] = -c1 * c5 * c[i - 1, 0] / c2
+            for k in range(mn, 0, -1):
+                c[j, k] = (c4 * c[j, k] - k * c[j, k - 1]) / c3
+            c[j, 0] = c4 * c[j, 0] / c3
+        c1 = c2
+    
+    return c.T
+
+def finite_difference_stencil(deriv=1, accuracy=2, kind="central"):
+    """Offset (kelipatan h) dan bobot stencil untuk turunan ke-deriv dengan galat O(h^accuracy).
+    central: offset simetris -p..p (accuracy harus genap), forward: 0..N-1, backward: 0..-(N-1)."""
+    if deriv < 1 or accuracy < 1:
+        raise ValueError("Orde turunan dan orde akurasi minimal 1")
+    
+    if kind == "central":
+        if accuracy % 2:
+            raise ValueError("Orde akurasi stencil central harus genap")
+        p = (2 * ((deriv + 1) // 2) - 1 + accuracy) // 2
+        offsets = np.arange(-p, p + 1, dtype=float)
+    elif kind in ("forward", "backward"):
+        offsets = np.arange(deriv + accuracy, dtype=float) * (1 if kind == "forward" else -1)
+    else:
+        raise ValueError(f"Jenis stencil tidak dikenal: '{kind}'")
+    
+    return offsets, fornberg_weights(0.0, offsets, deriv)[deriv]
+
+def optimal_step(deriv=1, accuracy=2, x=0.0):
+    """Langkah h yang menyeimbangkan galat pemotongan (∝ h^p) dan pembulatan (∝ ε·|f|/h^d):
+    minimum jumlah keduanya di h* ≈ ε^(1/(p+d)), diskalakan dengan max(|x|, 1)"""
+    return np.finfo(float).eps ** (1.0 / (accuracy + deriv)) * np.maximum(np.abs(x), 1.0)
+
+def derivative(f, x, deriv=1, accuracy=2, kind="central", h=None):
+    """Turunan numerik f^(deriv)(x) dengan stencil beda hingga. f dievaluasi sekali pada array
+    x[..., None] + h·offset, sehingga x dan h (skalar atau array, di-broadcast) diproses sekaligus.
+    Tanpa h, dipakai optimal_step yang dibulatkan agar x + h terwakili persis."""
+    offsets, weights = finite_difference_stencil(deriv, accuracy, kind)
+    x = np.asarray(x, dtype=float)
+    
+    if h is None:
+        h = optimal_step(deriv, accuracy, x)
+        h = (x + h) - x
+    
+    x_b, h_b = np.broadcast_arrays(x, np.asarray(h, dtype=float))
+    pts = x_b[..., None] + h_b[..., None] * offsets
+    y = np.broadcast_to(np.asarray(f(pts), dtype=float), pts.shape)
+    return ((y @ weights) / h_b ** deriv)[()]
+
+def richardson_derivative(f, x, deriv=1, accuracy=2, kind="central", h=None, levels=4, ratio=2.0):
+    """Ekstrapolasi Richardson atas D(h), D(h/r), ..., D(h/r^(levels-1)) (semua level dievaluasi
+    dalam satu panggilan f). Kolom ke-k tabel menghapus suku galat orde accuracy + step·(k-1), dengan
+    step = 2 untuk stencil central (galat hanya pangkat genap) dan 1 untuk stencil satu sisi.
+    Mengembalikan (estimasi, estimasi galat dari dua kolom terakhir)."""
+    step = 2 if kind == "central" else 1
+    x = np.asarray(x, dtype=float)
+    
+    if h is None:
+        h = optimal_step(deriv, accuracy + step * (levels - 1), x) * ratio ** (levels - 1)
+    
+    hs = np.asarray(h, dtype=float)[..., None] / ratio ** np.arange(levels)
+    D = derivative(f, x[..., None], deriv, accuracy, kind, hs)
+    T = [D[..., i] for i in range(levels)]
+    
+    prev = T[-1]
+    for k in range(1, levels):
+        faktor = ratio ** (accuracy + step * (k - 1)) - 1
+        prev = T[-1]
+        T = [T[i] + (T[i] - T[i - 1]) / faktor for i in range(1, len(T))]
+    
+    return T[-1][()], np.abs(T[-1] - prev)[()]
+
+def differentiate_samples(y, dx, deriv=1, accuracy=2):
+    """Turunan data tersampel seragam sepanjang sumbu terakhir. Interior: stencil central dikonvolusi
+    ke seluruh array sekaligus (sliding window @ bobot); titik tepi: stencil Fornberg pada deriv + accuracy
+    node pertama/terakhir sehingga orde akurasi sama di seluruh array."""
+    y = np.asarray(y, dtype=float)
+    offsets, weights = finite_difference_stencil(deriv, accuracy, "central")
+    p = len(offsets) // 2
+    n = y.shape[-1]
+    n_edge = deriv + accuracy
+    
+    if n < max(len(offsets), n_edge):
+        raise ValueError(f"Butuh minimal {max(len(offsets), n_edge)} titik untuk stencil ini")
+    
+    out = np.empty_like(y)
+    out[..., p:n - p] = np.lib.stride_tricks.sliding_window_view(y, len(offsets), axis=-1) @ weights
+    
+    nodes = np.arange(n_edge, dtype=float)
+    for i in range(p):
+        out[..., i] = y[..., :n_edge] @ fornberg_weights(float(i), nodes, deriv)[deriv]
+        out[..., n - 1 - i] = y[..., n - n_edge:] @ fornberg_weights(float(n_edge - 1 - i), nodes, deriv)[deriv]
+    
+    return out / dx ** deriv
+
+def newton_vectorized(f, df, z0, max_iter=50, tol=1e-10):
+    """Newton-Raphson untuk banyak titik awal sekaligus (array real atau kompleks). Tiap iterasi hanya
+    memproses titik yang masih aktif (masker konvergensi per titik), sehingga biaya turun seiring makin
+    banyak titik yang konvergen. Mengembalikan (z akhir, jumlah iterasi, masker konvergen)."""
+    z = np.array(z0).ravel()
+    iterations = np.full(z.size, max_iter, dtype=np.int32)
+    converged = np.zeros(z.size, dtype=bool)
+    active = np.arange(z.size)
+    
+    with np.errstate(all='ignore'):
+        for k in range(1, max_iter + 1):
+            if active.size == 0:
+                break
+            
+            z_a = z[active]
+            step = np.broadcast_to(f(z_a) / df(z_a), z_a.shape)
+            z_a = z_a - step
+            z[active] = z_a
+            
+            done = np.abs(step) <= tol * np.maximum(np.abs(z_a), 1.0)
+            gagal = ~np.isfinite(z_a)
+            converged[active[done]] = True
+            iterations[active[done | gagal]] = k
+            active = active[~(done | gagal)]
+    
+    return z, iterations, converged
+
+def newton_basin_map(f, df, re_range, im_range, resolution=1000, max_iter=50, tol=1e-10):
+    """Peta basin Newton di bidang kompleks: resolution × resolution titik awal diiterasi sekaligus
+    sebagai satu array complex128 (newton_vectorized), lalu titik akhir dikelompokkan per akar.
+    Mengembalikan dict berisi label akar per titik (-1 = tidak konvergen), jumlah iterasi, dan daftar akar."""
+    re = np.linspace(re_range[0], re_range[1], resolution)
+    im = np.linspace(im_range[0], im_range[1], resolution)
+    z, iterations, converged = newton_vectorized(f, df, re[None, :] + 1j * im[:, None], max_iter, tol)
+    
+    # Kelompokkan titik akhir yang konvergen menjadi akar berbeda
+    labels = np.full(z.size, -1, dtype=np.int32)
+    roots = []
+    if np.any(converged):
+        z_conv = z[converged]
+        skala = 1e-6 * max(np.max(np.abs(z_conv)), 1.0)
+        kunci = np.round(z_conv.real / skala) + 1j * np.round(z_conv.imag / skala)
+        _, pertama, inverse = np.unique(kunci, return_index=True, return_inverse=True)
+        
+        # Kandidat yang bersebelahan karena pembulatan digabung (jarak < 1e-4 relatif)
+        label_kandidat = np.empty(len(pertama), dtype=np.int32)
+        for i, c in enumerate(z_conv[pertama]):
+            jarak = [abs(c - r) for r in roots]
+            if jarak and min(jarak) < 100 * skala:
+                label_kandidat[i] = int(np.argmin(jarak))
+            else:
+                label_kandidat[i] = len(roots)
+                roots.append(c)
+        labels[converged] = label_kandidat[inverse.ravel()]
+    
+    return {
+        "labels": labels.reshape(resolution, resolution),
+        "iterations": iterations.reshape(resolution, resolution),
+        "roots": np.array(roots, dtype=complex),
+        "re": re,
+        "im": im,
+    }
+
+def basin_image(labels, iterations, max_shade_iter=None):
+    """Gambar RGB peta basin: warna menandai akar yang dicapai, kecerahan menurun dengan jumlah
+    iterasi (titik gelap = lambat konvergen), hitam = tidak konvergen. Baris 0 = Im minimum."""
+    palet = np.array([
+        [230, 57, 70], [29, 120, 230], [46, 180, 90], [245, 165, 35], [150, 80, 200],
+        [20, 190, 200], [230, 100, 170], [140, 110, 60], [120, 200, 40], [90, 90, 220],
+    ], dtype=float)
+    
+    if max_shade_iter is None:
+        valid = iterations[labels >= 0]
+        max_shade_iter = max(np.percentile(valid, 98), 1) if valid.size else 1
+    
+    terang = 1.0 - 0.75 * np.clip((iterations - 1) / max_shade_iter, 0, 1)
+    rgb = palet[np.maximum(labels, 0) % len(palet)] * terang[..., None]
+    rgb[labels < 0] = 0
+    return rgb.astype(np.uint8)
+
+def polynomial_coefficients(expr, variable="x"):
+    """Koefisien polinomial (pangkat tertinggi dahulu) jika ekspresi SymPy adalah polinomial dalam
+    variabel dengan koefisien numerik real; None jika bukan (mis. sin(x), 1/x, atau derajat < 1)"""
+    x = sp.Symbol(variable)
+    expr = sp.expand(expr)
+    
+    if not expr.is_polynomial(x):
+        return None
+    
+    poly = sp.Poly(expr, x)
+    if poly.degree() < 1 or not all(c.is_real and c.is_number for c in poly.all_coeffs()):
+        return None
+    
+    return np.array([float(c) for c in poly.all_coeffs()])
+
+def polynomial_eval(coeffs, z):
+    """Horner tervektorisasi: p(z) dan p'(z) untuk koefisien (..., n+1) dan titik (..., m)"""
+    p = np.zeros(np.broadcast_shapes(coeffs.shape[:-1] + (1,), z.shape), dtype=complex)
+    dp = np.zeros_like(p)
+    for k in range(coeffs.shape[-1]):
+        dp = dp * z + p
+        p = p * z + coeffs[..., k:k + 1]
+    return p, dp
+
+def companion_roots(coeffs, polish_steps=2):
+    """Semua akar polinomial sekaligus dari nilai eigen matriks companion. coeffs berbentuk (n+1,) atau
+    (k, n+1) untuk batch (satu polinomial per baris, np.linalg.eigvals dipanggil sekali untuk seluruh
+    batch). Setiap akar dipoles polish_steps langkah Newton; langkah hanya diterima jika |p| mengecil
+    (aman untuk akar ganda). Mengembalikan (akar (k, n), residual |p(akar)| (k, n))."""
+    coeffs = np.atleast_2d(np.asarray(coeffs, dtype=float))
+    batch = coeffs.shape[0]
+    
+    if coeffs.shape[0] == 1:
+        nonzero = np.flatnonzero(coeffs[0])
+        if nonzero.size == 0:
+            raise ValueError("Polinomial nol tidak memiliki akar yang terdefinisi")
+        coeffs = coeffs[:, nonzero[0]:]
+    elif np.any(coeffs[:, 0] == 0):
+        raise ValueError("Koefisien pangkat tertinggi setiap baris batch harus tak nol")
+    
+    n = coeffs.shape[1] - 1
+    if n < 1:
+        raise ValueError("Derajat polinomial minimal 1")
+    
+    # Matriks companion (k, n, n): baris pertama -a_i/a_0, subdiagonal satu
+    C = np.zeros((batch, n, n))
+    C[:, 0, :] = -coeffs[:, 1:] / coeffs[:, :1]
+    C[:, np.arange(1, n), np.arange(n - 1)] = 1.0
+    roots = np.linalg.eigvals(C).astype(complex)
+    
+    p, dp = polynomial_eval(coeffs, roots)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(polish_steps):
+            kandidat = roots - p / dp
+            p_baru, dp_baru = polynomial_eval(coeffs, kandidat)
+            terima = np.isfinite(kandidat) & (np.abs(p_baru) < np.abs(p))
+            roots = np.where(terima, kandidat, roots)
+            p = np.where(terima, p_baru, p)
+            dp = np.where(terima, dp_baru, dp)
+    
+    # Bagian imajiner sisa pembulatan dari akar real dibuang
+    real = np.abs(roots.imag) <= 1e-12 * np.maximum(np.abs(roots), 1.0)
+    roots = np.where(real, roots.real + 0j, roots)
+    
+    order = np.lexsort((roots.imag, roots.real), axis=-1)
+    roots = np.take_along_axis(roots, order, axis=-1)
+    return roots, np.abs(np.take_along_axis(p, order, axis=-1))
+
+CONTINUATION_PREDICTORS = {
+    "Prediktor Tangen": "tangent",
+    "Warm Start (akar sebelumnya)": "previous",
+    "Cold Start (tebakan awal tetap)": "cold",
+}
+
+def refine_fold(F, Fx, Fp, Fxx, Fxp, x, p, tol=1e-12, max_iter=30):
+    """Titik lipat (fold) F = 0, ∂F/∂x = 0 diselesaikan sebagai sistem 2×2 dalam (x, p) dengan Newton.
+    Mengembalikan (x, p) atau None jika tidak konvergen."""
+    for _ in range(max_iter):
+        G = np.array([F(x, p), Fx(x, p)], dtype=float)
+        J = np.array([[Fx(x, p), Fp(x, p)], [Fxx(x, p), Fxp(x, p)]], dtype=float)
+        try:
+            delta = np.linalg.solve(J, -G)
+        except np.linalg.LinAlgError:
+            return None
+        x, p = x + delta[0], p + delta[1]
+        if np.all(np.abs(delta) <= tol * np.maximum(np.abs([x, p]), 1.0)):
+            return x, p
+    return None
+
+def continuation_sweep(F, Fx, Fp, x_start, p_vals, predictor="tangent", tol=1e-12, max_iter=25, Fxx=None, Fxp=None):
+    """Kontinuasi parameter natural untuk F(x; p) = 0 pada grid p, semua cabang (satu per nilai x_start)
+    diproses sebagai satu array. Prediktor: 'tangent' (x + dx/dp·Δp dengan dx/dp = -F_p/F_x),
+    'previous' (akar langkah sebelumnya), atau 'cold' (x_start di setiap p). Korektor: Newton dengan
+    masker konvergensi per cabang. Fold terdeteksi saat F_x berganti tanda di sepanjang cabang; jika
+    Fxx dan Fxp diberikan, lokasinya dihaluskan dengan refine_fold. Cabang berhenti di fold atau saat
+    korektor gagal. Mengembalikan dict berisi x (N, B), iterasi (N, B), folds dan status per cabang."""
+    p_vals = np.asarray(p_vals, dtype=float)
+    x_start = np.atleast_1d(np.asarray(x_start, dtype=float))
+    N, B = p_vals.size, x_start.size
+    
+    X = np.full((N, B), np.nan)
+    iters = np.zeros((N, B), dtype=np.int32)
+    alive = np.ones(B, dtype=bool)
+    status = ["✅ Selesai"] * B
+    folds = []
+    
+    x = x_start.copy()
+    fx_prev = None
+    
+    with np.errstate(all='ignore'):
+        for j, p in enumerate(p_vals):
+            idx = np.flatnonzero(alive)
+            if idx.size == 0:
+                break
+            
+            # Prediktor
+            if j == 0 or predictor == "cold":
+                guess = x_start[idx].copy()
+            elif predictor == "tangent":
+                p_prev = p_vals[j - 1]
+                dxdp = -np.broadcast_to(Fp(x[idx], p_prev), idx.shape) / np.broadcast_to(Fx(x[idx], p_prev), idx.shape)
+                guess = x[idx] + dxdp * (p - p_prev)
+            else:
+                guess = x[idx].copy()
+            
+            # Korektor Newton tervektorisasi dengan masker per cabang
+            xc = guess
+            done = np.zeros(idx.size, dtype=bool)
+            for k in range(1, max_iter + 1):
+                aktif = np.flatnonzero(~done)
+                if aktif.size == 0:
+                    break
+                step = (np.broadcast_to(F(xc[aktif], p), aktif.shape) /
+                        np.broadcast_to(Fx(xc[aktif], p), aktif.shape))
+                xc[aktif] = xc[aktif] - step
+                iters[j, idx[aktif]] = k
+                ok = np.abs(step) <= tol * np.maximum(np.abs(xc[aktif]), 1.0)
+                done[aktif[ok | ~np.isfinite(step)]] = True
+            
+            gagal = ~np.isfinite(xc) | ~done
+            fx_now = np.broadcast_to(Fx(xc, p), idx.shape)
+            
+            # Fold: F_x berganti tanda dari langkah sebelumnya (korektor melompat ke cabang lain),
+            # atau korektor gagal karena akar cabang ini hilang setelah melewati titik lipat
+            fold = np.zeros(idx.size, dtype=bool)
+            if fx_prev is not None:
+                kandidat = gagal | (np.sign(fx_now) != np.sign(fx_prev[idx]))
+                p_prev = p_vals[j - 1]
+                
+                for i in np.flatnonzero(kandidat):
+                    b = idx[i]
+                    titik = None
+                    if Fxx is not None and Fxp is not None:
+                        titik = refine_fold(F, Fx, Fp, Fxx, Fxp, x[b], p_prev)
+                        if titik is not None and abs(titik[1] - (p_prev + p) / 2) > abs(p - p_prev):
+                            titik = None
+                    elif not gagal[i]:
+                        titik = ((x[b] + xc[i]) / 2, (p_prev + p) / 2)
+                    
+                    if titik is not None:
+                        fold[i] = True
+                        folds.append((b, titik[0], titik[1]))
+                        status[b] = f"🔁 Fold di p ≈ {titik[1]:.6g}"
+            
+            for i in np.flatnonzero(gagal & ~fold):
+                status[idx[i]] = f"⚠️ Korektor gagal di p = {p:.6g}"
+            
+            berhenti = gagal | fold
+            lanjut = idx[~berhenti]
+            x[lanjut] = xc[~berhenti]
+            X[j, lanjut] = xc[~berhenti]
+            alive[idx[berhenti]] = False
+            
+            if fx_prev is None:
+                fx_prev = np.full(B, np.nan)
+            fx_prev[idx] = fx_now
+    
+    return {"x": X, "iterations": iters, "folds": folds, "status": status}
+
+def chebyshev_coefficients(values):
+    """Koefisien Chebyshev dari nilai pada titik Chebyshev jenis kedua x_k = cos(πk/n), k = 0..n
+    (DCT-I lewat FFT dari data yang dicerminkan)"""
+    n = len(values) - 1
+    if n == 0:
+        return np.asarray(values, dtype=float).copy()
+    c = np.fft.rfft(np.concatenate([values, values[-2:0:-1]])).real[:n + 1] / n
+    c[0] /= 2
+    c[n] /= 2
+    return c
+
+def chebyshev_surrogate(f, a, b, tol=1e-13, min_points=17, max_points=4097):
+    """Interpolan Chebyshev adaptif f pada [a, b]. Jumlah titik digandakan (titik jenis kedua bersarang,
+    sehingga nilai lama dipakai ulang) sampai koefisien ekor meluruh di bawah tol·max|c|; derajat lalu
+    dipotong ke koefisien terakhir di atas ambang. Setelah dibangun, f tidak perlu dievaluasi lagi."""
+    def peta(t):
+        return (b - a) / 2 * t + (a + b) / 2
+    
+    n = min_points - 1
+    y = evaluate_array(f, peta(np.cos(np.pi * np.arange(n + 1) / n)))
+    n_evals = n + 1
+    
+    while True:
+        if not np.all(np.isfinite(y)):
+            raise ValueError("f bernilai tak hingga/NaN pada interval; surrogate Chebyshev butuh f yang terbatas")
+        
+        c = chebyshev_coefficients(y)
+        skala = np.max(np.abs(c))
+        ekor = np.abs(c[-max(4, (n + 1) // 8):])
+        converged = skala == 0 or np.all(ekor <= tol * skala)
+        
+        if converged or 2 * n + 1 > max_points:
+            break
+        
+        # Titik baru = indeks ganjil pada grid 2n
+        y_baru = evaluate_array(f, peta(np.cos(np.pi * np.arange(1, 2 * n, 2) / (2 * n))))
+        n_evals += len(y_baru)
+        y_gabung = np.empty(2 * n + 1)
+        y_gabung[0::2], y_gabung[1::2] = y, y_baru
+        y, n = y_gabung, 2 * n
+    
+    signifikan = np.flatnonzero(np.abs(c) > tol * skala)
+    degree = int(signifikan[-1]) if signifikan.size else 0
+    
+    return {
+        "a": float(a),
+        "b": float(b),
+        "coeffs": c[:degree + 1],
+        "n_evals": n_evals,
+        "converged": bool(converged),
+        "tail": float(ekor.max()),
+    }
+
+def surrogate_eval(s, x):
+    """Evaluasi surrogate (Clenshaw lewat chebval) pada x di dalam [a, b]"""
+    t = (2 * np.asarray(x, dtype=float) - s["a"] - s["b"]) / (s["b"] - s["a"])
+    return np.polynomial.chebyshev.chebval(t, s["coeffs"])
+
+def surrogate_integral(s):
+    """Integral surrogate pada [a, b] dengan Clenshaw-Curtis langsung dari koefisien:
+    ∫T_k = 2/(1 − k²) untuk k genap dan 0 untuk k ganjil. Estimasi error dari koefisien ekor."""
+    c = s["coeffs"]
+    k = np.arange(0, len(c), 2)
+    hasil = (s["b"] - s["a"]) / 2 * np.sum(c[::2] * 2 / (1 - k**2))
+    return hasil, (s["b"] - s["a"]) * s["tail"]
+
+def surrogate_roots(s, max_degree=100):
+    """Akar real surrogate di [a, b] dari nilai eigen matriks colleague (chebcompanion). Untuk derajat
+    di atas max_degree, interval dibelah dan surrogate di-resample per bagian (tanpa evaluasi f baru)
+    agar ukuran masalah eigen tetap kecil. Akar dipoles satu langkah Newton pada surrogate."""
+    c = s["coeffs"]
+    a, b = s["a"], s["b"]
+    degree = len(c) - 1
+    
+    if degree > max_degree:
+        tengah = a + (b - a) * 0.5004849834
+        t = np.cos(np.pi * np.arange(degree + 1) / degree)
+        akar = []
+        for lo, hi in ((a, tengah), (tengah, b)):
+            c_bagian = chebyshev_coefficients(surrogate_eval(s, (hi - lo) / 2 * t + (lo + hi) / 2))
+            skala = np.max(np.abs(c_bagian))
+            # Derajat tiap bagian dibatasi 3/4 induknya agar rekursi pasti berhenti walau koefisien
+            # tidak meluruh di bawah derau evaluasi (mis. f tidak mulus)
+            signifikan = np.flatnonzero(np.abs(c_bagian) > 1e-13 * skala)
+            derajat_bagian = min(int(signifikan[-1]) if signifikan.size else 0, 3 * degree // 4)
+            c_bagian = c_bagian[:derajat_bagian + 1]
+            akar.append(surrogate_roots({**s, "a": lo, "b": hi, "coeffs": c_bagian}, max_degree))
+        akar = np.concatenate(akar)
+        if akar.size > 1:
+            akar = akar[np.concatenate([[True], np.diff(akar) > 1e-10 * (b - a)])]
+        return akar
+    
+    if len(c) < 2 or np.all(c[1:] == 0):
+        return np.array([])
+    
+    with np.errstate(all='ignore'):
+        t = np.linalg.eigvals(np.polynomial.chebyshev.chebcompanion(c)) if len(c) > 2 else np.array([-c[0] / c[1]])
+    t = t[(np.abs(t.imag) < 1e-8) & (np.abs(t.real) <= 1 + 1e-8)].real
+    t = np.clip(t, -1, 1)
+    
+    # Satu langkah Newton pada surrogate
+    dc = np.polynomial.chebyshev.chebder(c)
+    with np.errstate(all='ignore'):
+        koreksi = np.polynomial.chebyshev.chebval(t, c) / np.polynomial.chebyshev.chebval(t, dc)
+    t = np.where(np.isfinite(koreksi) & (np.abs(koreksi) < 1e-6), t - koreksi, t)
+    
+    return np.sort((b - a) / 2 * np.clip(t, -1, 1) + (a + b) / 2)
+
+@st.cache_data(max_entries=32)
+def cached_surrogate(expr_str, a, b, tol=1e-13):
+    """Surrogate Chebyshev f pada [a, b], di-cache per (ekspresi, a, b, tol) sehingga plot, integral,
+    dan kandidat akar memakai satu kali pembangunan"""
+    f = parse_expression(expr_str)
+    return chebyshev_surrogate(f, a, b, tol)
+
+# --- SIDEBAR NAVIGASI ---
+st.sidebar.title("📚 Menu Materi")
+menu = st.sidebar.radio(
+    "Navigasi Pembelajaran:",
+    ["🏠 Beranda", "🔍 Analisis Galat", "🎯 Akar Persamaan", "🧮 Sistem Linear", "📈 Interpolasi", "⚙️ Integral & PDB"]
+)
+
+# --- HALAMAN 1: BERANDA ---
+if menu == "🏠 Beranda":
+    st.markdown('<div class="main-header">Metode Numerik Companion</div>', unsafe_allow_html=True)
+    st.markdown("---")
+    
+    st.markdown("""
+    ### Selamat Datang, Insinyur Muda! 👋
+    
+    Ini adalah teman belajar interaktif untuk mata kuliah **Metode Numerik (ELT60214)**. 
+    Aplikasi ini dirancang untuk membantu Anda memahami bagaimana komputer menyelesaikan 
+    masalah matematika yang "terlalu sulit" diselesaikan dengan tangan.
+    """)
+    
+    st.markdown('<div class="concept-box">', unsafe_allow_html=True)
+    st.markdown("""
+    ### 💡 Konsep Feynman: Mengapa Kita Butuh Ini?
+    
+    Bayangkan Anda ingin menghitung luas area kolam renang yang berbentuk sangat aneh, 
+    bukan lingkaran atau kotak biasa. Rumus Luas = panjang × lebar tidak bisa digunakan. 
+    
+    Di sinilah **Metode Numerik** berperan. Alih-alih mencari satu jawaban "tepat" 
+    (yang mungkin tidak ada), kita mencari jawaban "cukup dekat" yang bisa diterima 
+    dalam dunia teknik.
+    
+    **Prinsip Utama:** 
+    > Approximation (Pendekatan) + Iterasi (Pengulangan) = Solusi
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.info("🔍 **Analisis Galat**\n\nBelajar mengukur seberapa akurat hasil perhitungan numerik")
+    
+    with col2:
+        st.success("🎯 **Akar Persamaan**\n\nMencari nilai x dimana f(x) = 0")
+    
+    with col3:
+        st.warning("🧮 **Sistem Linear**\n\nMenyelesaikan sistem persamaan linear")
+    
+    st.markdown("---")
+    st.info("💡 **Tip:** Gunakan menu di sidebar untuk memulai eksperimen dengan metode-metode numerik!")
+
+# --- HALAMAN 2: ANALISIS GALAT ---
+elif menu == "🔍 Analisis Galat":
+    st.header("🔍 Analisis Galat (Error Analysis)")
+    
+    st.markdown("""
+    Sebelum kita menghitung apapun, kita harus tahu: **Seberapa salah bolehnya jawaban kita?**
+    
+    Dalam komputasi numerik, kita tidak bisa mendapatkan jawaban yang 100% tepat. 
+    Yang penting adalah memahami dan mengontrol tingkat kesalahan.
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown('<div class="formula-box"><h4>Absolute Error</h4></div>', unsafe_allow_html=True)
+        st.latex(r"E_{abs} = |x_{true} - x_{approx}|")
+        st.caption("""
+        **Absolute Error** adalah selisih murni antara nilai sebenarnya dan nilai pendekatan.
+        
+        **Contoh:** Jika nilai sebenarnya 100 dan hasil perhitungan 98, maka absolute error = 2.
+        
+        **Kapan penting?** Ketika skala pengukuran konsisten (misal: semua dalam meter).
+        """)
+    
+    with col2:
+        st.markdown('<div class="formula-box"><h4>Relative Error</h4></div>', unsafe_allow_html=True)
+        st.latex(r"E_{rel} = \left| \frac{x_{true} - x_{approx}}{x_{true}} \right| \times 100\%")
+        st.caption("""
+        **Relative Error** memberi konteks skala pada kesalahan.
+        
+        **Contoh:** Error 1mm pada mikrochip (besar!), tapi kecil pada jembatan.
+        
+        **Kapan penting?** Ketika membandingkan error pada skala yang berbeda.
+        """)
+    
+    st.markdown("---")
+    st.subheader("🧪 Kalkulator Error")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        true_val = st.number_input("Nilai Sebenarnya (True Value):", value=100.0, format="%.6f")
+        expr_true = st.text_input(
+            "atau Ekspresi Nilai Sebenarnya (opsional):",
+            value="",
+            key="expr_true",
+            help="Dihitung SymPy/mpmath dengan presisi tinggi dan di-cache di disk. "
+                 "Contoh: sqrt(2), pi/4, Integral(exp(-x**2), (x, 0, 1))"
+        )
+    
+    with col2:
+        approx_val = st.number_input("Nilai Pendekatan (Approximate):", value=98.5, format="%.10f")
+    
+    ref_true = None
+    if expr_true.strip():
+        expr_sym_true = parse_sympy_expression(expr_true, ())
+        if expr_sym_true is not None:
+            try:
+                with st.spinner("Menghitung nilai referensi..."):
+                    ref_true, dari_cache_true = precise_constant(expr_sym_true)
+                true_val = float(ref_true)
+            except (TypeError, ValueError) as e:
+                st.error(f"❌ Ekspresi tidak dapat dievaluasi menjadi bilangan real: {e}")
+    
+    if true_val != 0:
+        if ref_true is not None:
+            abs_err, rel_err = true_error(approx_val, ref_true)
+            format_err = ".3e"
+            st.caption(
+                f"Nilai sebenarnya = {mpmath.nstr(ref_true, 25)} (mpmath {REFERENCE_DPS} digit, "
+                f"{'dari cache disk' if dari_cache_true else 'dihitung dan disimpan ke cache disk'})"
+            )
+        else:
+            abs_err = abs(true_val - approx_val)
+            rel_err = (abs_err / abs(true_val)) * 100
+            format_err = ".6f"
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.metric("Absolute Error", f"{abs_err:{format_err}}")
+        
+        with col2:
+            st.metric("Relative Error", f"{rel_err:{format_err}}%")
+        
+        # Interpretasi
+        st.markdown("---")
+        st.subheader("📊 Interpretasi")
+        
+        if rel_err < 0.1:
+            st.success("✅ **Sangat Baik!** Relative error < 0.1%")
+        elif rel_err < 1:
+            st.info("✓ **Baik.** Relative error < 1%")
+        elif rel_err < 5:
+            st.warning("⚠️ **Cukup.** Relative error < 5%")
+        else:
+            st.error("❌ **Perlu Perbaikan.** Relative error > 5%")
+    else:
+        st.warning("⚠️ Nilai sebenarnya tidak boleh nol untuk menghitung relative error.")
+    
+    # Propagasi ketidakpastian
+    st.markdown("---")
+    st.subheader("🎲 Propagasi Ketidakpastian (Monte Carlo)")
+    
+    st.markdown("""
+    <div class="concept-box">
+    <h4>🎯 Konsep: Toleransi Komponen Merambat ke Hasil</h4>
+    
+    Resistor 10 kΩ ±5% bisa bernilai 9.5–10.5 kΩ. Seberapa besar sebaran tegangan keluaran pembagi tegangan?
+    
+    1. **Monte Carlo**: ambil jutaan sampel acak semua input, evaluasi rumus, lihat sebaran hasilnya
+    2. **Linearisasi orde satu**: σ_f² ≈ Σ (∂f/∂xᵢ · σᵢ)², cepat tapi hanya akurat jika f hampir linear di rentang toleransi
+    
+    Sampel diproses per chunk; mean, varians, dan histogram diperbarui secara berjalan sehingga memori tetap konstan.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        expr_mc = st.text_input("Rumus f:", value="Vin*R2/(R1 + R2)", key="expr_mc")
+        input_mc = st.text_area(
+            "Input (nama, distribusi, nominal, toleransi %), satu per baris:",
+            value="Vin, normal, 5, 1\nR1, uniform, 10000, 5\nR2, uniform, 10000, 5",
+            height=110,
+            key="input_mc",
+            help="Distribusi: normal (toleransi = 3σ), uniform (±toleransi), triangular (±toleransi)"
+        )
+    
+    with col2:
+        n_mc = st.select_slider(
+            "Jumlah Sampel:",
+            options=[10**k for k in range(4, 9)],
+            value=10**6,
+            format_func=lambda v: f"{v:,}",
+            key="n_mc"
+        )
+        chunk_mc = st.select_slider(
+            "Ukuran Chunk:",
+            options=[10**k for k in range(4, 8)],
+            value=10**6,
+            format_func=lambda v: f"{v:,}",
+            key="chunk_mc"
+        )
+    
+    if st.button("🚀 Propagasikan Ketidakpastian", type="primary", key="btn_mc"):
+        try:
+            inputs_mc, variabel_mc = [], []
+            for baris in input_mc.strip().splitlines():
+                if not baris.strip():
+                    continue
+                bagian = [b.strip() for b in baris.split(",")]
+                if len(bagian) != 4 or bagian[1] not in ("normal", "uniform", "triangular"):
+                    raise ValueError(f"Format baris tidak valid: '{baris}'")
+                variabel_mc.append(bagian[0])
+                inputs_mc.append((bagian[1], float(bagian[2]), float(bagian[3])))
+            
+            variabel_mc = tuple(variabel_mc)
+            f_mc = parse_expression(expr_mc, variabel_mc)
+            expr_sym_mc = parse_sympy_expression(expr_mc, variabel_mc)
+            
+            if f_mc is not None and expr_sym_mc is not None:
+                f_lin, sigma_lin, rincian_lin = linearized_propagation(expr_sym_mc, variabel_mc, inputs_mc)
+                
+                progress_mc = st.progress(0.0)
+                live_mc = st.empty()
+                t_start = time.perf_counter()
+                
+                for hasil_mc in iter_monte_carlo_propagation(f_mc, inputs_mc, n_mc, chunk_mc):
+                    progress_mc.progress(hasil_mc["n"] / n_mc)
+                    live_mc.markdown(
+                        f"**N = {hasil_mc['n']:,}** &nbsp; | &nbsp; mean = `{hasil_mc['mean']:.6g}` "
+                        f"&nbsp; | &nbsp; σ = `{hasil_mc['std']:.6g}`"
+                    )
+                
+                t_mc = time.perf_counter() - t_start
+                
+                st.success(f"✅ {hasil_mc['n']:,} sampel dalam {t_mc:.2f} s ({hasil_mc['n'] / t_mc / 1e6:.1f} juta sampel/s)")
+                
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    st.metric("Mean (Monte Carlo)", f"{hasil_mc['mean']:.6g}")
+                
+                with col2:
+                    st.metric("σ (Monte Carlo)", f"{hasil_mc['std']:.6g}")
+                
+                with col3:
+                    st.metric("f(nominal) (Linear)", f"{f_lin:.6g}")
+                
+                with col4:
+                    st.metric("σ (Linear)", f"{sigma_lin:.6g}",
+                              f"{(sigma_lin - hasil_mc['std']) / hasil_mc['std'] * 100:+.2f}% vs MC" if hasil_mc['std'] > 0 else None,
+                              delta_color="off")
+                
+                # Persentil dari histogram berjalan
+                q_mc = [0.1, 2.5, 16, 50, 84, 97.5, 99.9]
+                p_mc = histogram_percentiles(
+                    hasil_mc["counts"], hasil_mc["edges"], q_mc,
+                    hasil_mc["underflow"], hasil_mc["overflow"]
+                )
+                p_lin = f_lin + sigma_lin * np.array([-3.090, -1.960, -0.994, 0.0, 0.994, 1.960, 3.090])
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown("**Persentil**")
+                    df_persentil = pd.DataFrame({
+                        "Persentil (%)": q_mc,
+                        "Monte Carlo": p_mc,
+                        "Linear (Normal)": p_lin
+                    })
+                    st.dataframe(df_persentil.style.format({
+                        "Persentil (%)": "{:.1f}", "Monte Carlo": "{:.6g}", "Linear (Normal)": "{:.6g}"
+                    }), use_container_width=True)
+                
+                with col2:
+                    st.markdown("**Kontribusi Varians (Linear)**")
+                    total_var = sum(k for _, _, k in rincian_lin) or 1.0
+                    df_kontribusi = pd.DataFrame(
+                        [(v, d, k / total_var * 100) for v, d, k in rincian_lin],
+                        columns=["Variabel", "∂f/∂x", "Kontribusi (%)"]
+                    )
+                    st.dataframe(df_kontribusi.style.format({
+                        "∂f/∂x": "{:.4e}", "Kontribusi (%)": "{:.2f}"
+                    }), use_container_width=True)
+                
+                # Histogram vs distribusi normal dari linearisasi
+                edges_mc = hasil_mc["edges"]
+                counts_mc = hasil_mc["counts"]
+                lebar_bin = edges_mc[1] - edges_mc[0]
+                nonzero = np.flatnonzero(counts_mc)
+                lo_bin, hi_bin = nonzero[0], nonzero[-1] + 1
+                faktor = max(1, (hi_bin - lo_bin) // 200)
+                n_gabung = (hi_bin - lo_bin) // faktor * faktor
+                counts_plot = counts_mc[lo_bin:lo_bin + n_gabung].reshape(-1, faktor).sum(axis=1)
+                centers_plot = edges_mc[lo_bin:lo_bin + n_gabung:faktor] + faktor * lebar_bin / 2
+                densitas = counts_plot / (hasil_mc["n"] * faktor * lebar_bin)
+                
+                fig = go.Figure()
+                fig.add_trace(go.Bar(
+                    x=centers_plot, y=densitas,
+                    name='Monte Carlo', marker_color='rgba(99, 110, 250, 0.6)'
+                ))
+                if sigma_lin > 0:
+                    fig.add_trace(go.Scatter(
+                        x=centers_plot,
+                        y=np.exp(-0.5 * ((centers_plot - f_lin) / sigma_lin)**2) / (sigma_lin * np.sqrt(2 * np.pi)),
+                        mode='lines', name='Normal (Linearisasi)', line=dict(color='red', width=2)
+                    ))
+                fig.update_layout(
+                    title="Distribusi Keluaran f",
+                    xaxis_title='f',
+                    yaxis_title='Densitas',
+                    bargap=0,
+                    template='plotly_white'
+                )
+                st.plotly_chart(fig, use_container_width=True)
+                
+                if hasil_mc["underflow"] or hasil_mc["overflow"]:
+                    st.caption(
+                        f"{hasil_mc['underflow'] + hasil_mc['overflow']:,} sampel berada di luar rentang histogram "
+                        f"(ditetapkan dari chunk pertama); persentil ekor mungkin tidak tersedia."
+                    )
+        
+        except ValueError as e:
+            st.error(f"❌ Error: {e}")
+    
+    # Eksplorasi presisi bilangan
+    st.markdown("---")
+    st.subheader("🔢 Eksplorasi Presisi Bilangan (float32 vs float64 vs mpmath)")
+    
+    st.markdown("""
+    <div class="concept-box">
+    <h4>🎯 Konsep: Galat Pembulatan Bergantung pada Tipe Bilangan</h4>
+    
+    Algoritma yang sama dijalankan dalam tiga tipe bilangan:
+    
+    1. **float32**: ε mesin ≈ 1.2×10⁻⁷ (±7 digit), hemat memori tetapi cepat kehabisan digit
+    2. **float64**: ε mesin ≈ 2.2×10⁻¹⁶ (±16 digit), standar NumPy
+    3. **mpmath**: presisi sembarang lewat SymPy, akurat tetapi jauh lebih lambat (aritmetika perangkat lunak)
+    
+    Selisih terhadap hasil mpmath memperlihatkan galat pembulatan murni, karena galat pemotongan metodenya sama.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        masalah_prec = st.radio(
+            "Masalah:",
+            ["Akar Persamaan", "Integral Trapesium", "Euler (dx/dt = a·x + b)"],
+            horizontal=True,
+            key="masalah_prec"
+        )
+    
+    with col2:
+        dps_prec = st.slider("Digit mpmath (mp.dps):", 15, 100, 50, key="dps_prec")
+    
+    if masalah_prec == "Akar Persamaan":
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            expr_prec = st.text_input("f(x) =", value="x**3 - 2*x - 5", key="expr_prec_akar")
+            metode_prec = st.selectbox("Metode:", ["Bisection", "Newton-Raphson", "Secant"], key="metode_prec")
+        
+        with col2:
+            p1_prec = st.number_input("a / x₀:", value=2.0, format="%.6f", key="p1_prec")
+            p2_prec = st.number_input("b / x₁ (Bisection & Secant):", value=3.0, format="%.6f", key="p2_prec")
+        
+        with col3:
+            tol_prec = st.select_slider(
+                "Toleransi:",
+                options=[10.0**-k for k in range(4, 17, 2)],
+                value=1e-12,
+                format_func=lambda v: f"{v:.0e}",
+                key="tol_prec"
+            )
+            iter_prec = st.number_input("Maksimum Iterasi:", value=100, min_value=1, max_value=1000, key="iter_prec")
+    
+    elif masalah_prec == "Integral Trapesium":
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            expr_prec = st.text_input("f(x) =", value="exp(-x**2)", key="expr_prec_int")
+        
+        with col2:
+            p1_prec = st.number_input("Batas bawah a:", value=0.0, format="%.6f", key="a_prec")
+            p2_prec = st.number_input("Batas atas b:", value=1.0, format="%.6f", key="b_prec")
+        
+        with col3:
+            n_prec = st.number_input("Jumlah Segmen (n):", value=100000, min_value=1, max_value=10**6, key="n_prec")
+            st.caption("Mode mpmath mengevaluasi titik satu per satu; n besar bisa memakan waktu beberapa detik.")
+    
+    else:
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            a_prec = st.number_input("a:", value=-1.0, format="%.6f", key="koef_a_prec")
+            b_prec = st.number_input("b:", value=5.0, format="%.6f", key="koef_b_prec")
+        
+        with col2:
+            x0_prec = st.number_input("x(0):", value=0.0, format="%.6f", key="x0_prec")
+            t_end_prec = st.number_input("t akhir:", value=5.0, min_value=0.01, format="%.4f", key="t_end_prec")
+        
+        with col3:
+            h_prec = st.select_slider(
+                "Step size h:",
+                options=[10.0**-k for k in range(1, 7)],
+                value=1e-4,
+                format_func=lambda v: f"{v:.0e}",
+                key="h_prec"
+            )
+            st.caption("Default: rangkaian RC dengan τ = 1 s dan Vin = 5 V (a = -1/τ, b = Vin/τ).")
+    
+    if st.button("🚀 Jalankan di Semua Tipe Bilangan", type="primary", key="btn_prec"):
+        try:
+            hasil_prec = {}
+            
+            with mpmath.workdps(dps_prec):
+                if masalah_prec in ("Akar Persamaan", "Integral Trapesium"):
+                    expr_sym_prec = parse_sympy_expression(expr_prec)
+                    if expr_sym_prec is None:
+                        raise ValueError("Ekspresi tidak valid")
+                    x_sym = sp.Symbol('x')
+                    f_mp = precision_function(expr_sym_prec, x_sym, "mpmath")
+                
+                for tipe in NUMBER_TYPES.values():
+                    t_start = time.perf_counter()
+                    
+                    if masalah_prec == "Akar Persamaan":
+                        f_tipe = precision_function(expr_sym_prec, x_sym, tipe)
+                        if metode_prec == "Bisection":
+                            results, msg = bisection_method(f_tipe, p1_prec, p2_prec, tol_prec, int(iter_prec), tipe)
+                        elif metode_prec == "Newton-Raphson":
+                            df_tipe = precision_function(sp.diff(expr_sym_prec, x_sym), x_sym, tipe)
+                            results, msg = newton_raphson_method(f_tipe, df_tipe, p1_prec, tol_prec, int(iter_prec), tipe)
+                        else:
+                            results, msg = secant_method(f_tipe, p1_prec, p2_prec, tol_prec, int(iter_prec), tipe)
+                        
+                        if results is None:
+                            nilai, langkah, jejak = None, 0, []
+                        else:
+                            nilai, langkah, jejak = results[-1][3], len(results), [r[3] for r in results]
+                    
+                    elif masalah_prec == "Integral Trapesium":
+                        f_tipe = precision_function(expr_sym_prec, x_sym, tipe)
+                        nilai = trapezoid_rule(f_tipe, p1_prec, p2_prec, int(n_prec), tipe)
+                        langkah, jejak, msg = int(n_prec) + 1, [], "✅ Selesai"
+                    
+                    else:
+                        steps_prec = max(1, int(round(t_end_prec / h_prec)))
+                        jejak = euler_recurrence(a_prec, b_prec, x0_prec, h_prec, steps_prec, tipe)
+                        nilai, langkah, msg = jejak[-1], steps_prec, "✅ Selesai"
+                    
+                    hasil_prec[tipe] = (nilai, langkah, msg, time.perf_counter() - t_start, jejak)
+                
+                def ke_mpf(v):
+                    return v if isinstance(v, mpmath.mpf) else mpmath.mpf(float(v))
+                
+                # Nilai eksak sebagai pembanding galat total
+                ref_mp = hasil_prec["mpmath"][0]
+                if masalah_prec == "Akar Persamaan":
+                    tebakan = ref_mp if ref_mp is not None else mpmath.mpf(p1_prec)
+                    try:
+                        eksak = mpmath.findroot(f_mp, tebakan)
+                    except (ValueError, ZeroDivisionError):
+                        eksak = ref_mp
+                elif masalah_prec == "Integral Trapesium":
+                    eksak = mpmath.quad(f_mp, [p1_prec, p2_prec])
+                else:
+                    a_mp, b_mp = mpmath.mpf(a_prec), mpmath.mpf(b_prec)
+                    t_mp = steps_prec * mpmath.mpf(h_prec)
+                    if a_mp != 0:
+                        eksak = (x0_prec + b_mp / a_mp) * mpmath.exp(a_mp * t_mp) - b_mp / a_mp
+                    else:
+                        eksak = x0_prec + b_mp * t_mp
+                
+                eps_tipe = {
+                    "float32": float(np.finfo(np.float32).eps),
+                    "float64": float(np.finfo(np.float64).eps),
+                    "mpmath": float(mpmath.eps),
+                }
+                
+                rows_prec = []
+                for label, tipe in NUMBER_TYPES.items():
+                    nilai, langkah, msg, waktu, _ = hasil_prec[tipe]
+                    if nilai is None:
+                        teks, galat_eksak, selisih_mp = "-", np.nan, np.nan
+                    else:
+                        if tipe == "mpmath":
+                            teks = mpmath.nstr(nilai, min(dps_prec, 30))
+                        else:
+                            teks = f"{float(nilai):.{9 if tipe == 'float32' else 17}g}"
+                        galat_eksak = float(abs(ke_mpf(nilai) - eksak)) if eksak is not None else np.nan
+                        selisih_mp = float(abs(ke_mpf(nilai) - ref_mp)) if ref_mp is not None else np.nan
+                    rows_prec.append((label, teks, langkah, msg, galat_eksak, selisih_mp, waktu * 1000, eps_tipe[tipe]))
+            
+            df_prec = pd.DataFrame(rows_prec, columns=[
+                "Tipe Bilangan", "Hasil", "Iterasi/Langkah", "Status",
+                "Galat vs Eksak", "Selisih vs mpmath", "Waktu (ms)", "ε Mesin"
+            ])
+            st.dataframe(df_prec.style.format({
+                "Galat vs Eksak": "{:.3e}", "Selisih vs mpmath": "{:.3e}",
+                "Waktu (ms)": "{:.2f}", "ε Mesin": "{:.2e}"
+            }), use_container_width=True)
+            
+            # Visualisasi
+            fig = go.Figure()
+            warna_prec = {"float32": "red", "float64": "blue", "mpmath": "green"}
+            
+            with mpmath.workdps(dps_prec):
+                if masalah_prec == "Akar Persamaan" and eksak is not None:
+                    for label, tipe in NUMBER_TYPES.items():
+                        jejak = hasil_prec[tipe][4]
+                        if jejak:
+                            galat_iter = [max(float(abs(ke_mpf(v) - eksak)), 1e-300) for v in jejak]
+                            fig.add_trace(go.Scatter(
+                                x=list(range(1, len(jejak) + 1)), y=galat_iter,
+                                mode='lines+markers', name=label, line=dict(color=warna_prec[tipe])
+                            ))
+                    fig.update_layout(title="Galat |x_k − x*| per Iterasi", xaxis_title='Iterasi', yaxis_title='Galat')
+                
+                elif masalah_prec == "Integral Trapesium":
+                    n_sweep = np.unique(np.geomspace(2, int(n_prec), 15).astype(int))
+                    for label, tipe in list(NUMBER_TYPES.items())[:2]:
+                        f_tipe = precision_function(expr_sym_prec, x_sym, tipe)
+                        galat_n = [
+                            max(float(abs(ke_mpf(trapezoid_rule(f_tipe, p1_prec, p2_prec, int(n), tipe)) - eksak)), 1e-300)
+                            for n in n_sweep
+                        ]
+                        fig.add_trace(go.Scatter(
+                            x=n_sweep, y=galat_n, mode='lines+markers', name=label, line=dict(color=warna_prec[tipe])
+                        ))
+                    fig.update_layout(title="Galat Trapesium vs n (pemotongan turun ∝ 1/n², pembulatan naik)",
+                                      xaxis_title='n', xaxis_type='log', yaxis_title='Galat')
+                
+                else:
+                    idx_plot = np.unique(np.linspace(0, steps_prec, min(steps_prec + 1, 2000)).astype(int))
+                    x_ref = hasil_prec["mpmath"][4]
+                    for label, tipe in list(NUMBER_TYPES.items())[:2]:
+                        x_tipe = hasil_prec[tipe][4]
+                        selisih_t = [max(float(abs(ke_mpf(x_tipe[k]) - x_ref[k])), 1e-300) for k in idx_plot]
+                        fig.add_trace(go.Scatter(
+                            x=idx_plot * h_prec, y=selisih_t, mode='lines', name=label, line=dict(color=warna_prec[tipe])
+                        ))
+                    fig.update_layout(title="Selisih Trajektori Euler terhadap mpmath (galat pembulatan akumulatif)",
+                                      xaxis_title='t', yaxis_title='|x_k − x_k(mpmath)|')
+            
+            fig.update_layout(yaxis_type='log', template='plotly_white')
+            st.plotly_chart(fig, use_container_width=True)
+        
+        except (ValueError, TypeError, ZeroDivisionError) as e:
+            st.error(f"❌ Error: {e}")
+    
+    # Kurva V turunan numerik
+    st.markdown("---")
+    st.subheader("📉 Galat Turunan Numerik vs Langkah h (Kurva V)")
+    
+    st.markdown("""
+    <div class="concept-box">
+    <h4>🎯 Konsep: Galat Pemotongan vs Galat Pembulatan</h4>
+    
+    Stencil beda hingga orde p untuk turunan ke-d memiliki dua sumber galat:
+    
+    1. **Pemotongan** ∝ h^p: mengecil saat h mengecil (garis miring ke kanan pada plot log-log)
+    2. **Pembulatan** ∝ ε·|f|/h^d: membesar saat h mengecil karena f(x+h) − f(x) kehilangan digit
+    
+    Jumlahnya membentuk huruf **V** dengan minimum di h* ≈ ε^(1/(p+d)). Stencil orde tinggi mencapai
+    minimum yang lebih rendah pada h yang lebih besar; **Richardson** menggabungkan beberapa h besar untuk
+    menghapus suku pemotongan tanpa masuk ke wilayah pembulatan.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        expr_diff = st.text_input("f(x) =", value="exp(x)*sin(x)", key="expr_diff")
+        x0_diff = st.number_input("Titik x₀:", value=1.0, format="%.6f", key="x0_diff")
+    
+    with col2:
+        orde_diff = st.selectbox("Turunan ke-", [1, 2, 3], key="orde_diff")
+        stencil_diff = st.multiselect(
+            "Stencil:",
+            ["Forward O(h)", "Forward O(h²)", "Central O(h²)", "Central O(h⁴)", "Central O(h⁶)"],
+            default=["Forward O(h)", "Central O(h²)", "Central O(h⁴)"],
+            key="stencil_diff"
+        )
+    
+    with col3:
+        n_sampel_diff = st.select_slider(
+            "Jumlah Sampel (data tersampel):",
+            options=[11, 21, 51, 101, 201, 501, 1001, 10001],
+            value=101,
+            key="n_sampel_diff"
+        )
+    
+    if st.button("🚀 Analisis Turunan", type="primary", key="btn_diff"):
+        f_diff = parse_expression(expr_diff)
+        expr_sym_diff = parse_sympy_expression(expr_diff)
+        
+        if f_diff is not None and expr_sym_diff is not None:
+            try:
+                x_sym = sp.Symbol('x')
+                turunan_sym = sp.diff(expr_sym_diff, x_sym, orde_diff)
+                eksak_diff = float(turunan_sym.subs(x_sym, x0_diff).evalf(30))
+                
+                konfigurasi_diff = {
+                    "Forward O(h)": ("forward", 1),
+                    "Forward O(h²)": ("forward", 2),
+                    "Central O(h²)": ("central", 2),
+                    "Central O(h⁴)": ("central", 4),
+                    "Central O(h⁶)": ("central", 6),
+                }
+                h_grid = np.logspace(-16, 0, 161)
+                
+                fig = go.Figure()
+                rows_diff = []
+                
+                warna_diff = ['red', 'orange', 'blue', 'green', 'purple']
+                
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    for i_cfg, label in enumerate(stencil_diff):
+                        kind, akurasi = konfigurasi_diff[label]
+                        err_h = np.abs(derivative(f_diff, x0_diff, orde_diff, akurasi, kind, h=h_grid) - eksak_diff)
+                        valid = np.isfinite(err_h) & (err_h > 0)
+                        fig.add_trace(go.Scatter(
+                            x=h_grid[valid], y=err_h[valid], mode='lines', name=label,
+                            line=dict(color=warna_diff[i_cfg % len(warna_diff)])
+                        ))
+                        
+                        h_auto = float(optimal_step(orde_diff, akurasi, x0_diff))
+                        err_auto = abs(derivative(f_diff, x0_diff, orde_diff, akurasi, kind) - eksak_diff)
+                        fig.add_trace(go.Scatter(
+                            x=[h_auto], y=[max(err_auto, 1e-17)], mode='markers',
+                            marker=dict(size=11, symbol='x', color=warna_diff[i_cfg % len(warna_diff)]),
+                            name=f"h* otomatis ({label})", showlegend=False
+                        ))
+                        
+                        nilai_rich, est_rich = richardson_derivative(f_diff, x0_diff, orde_diff, akurasi, kind)
+                        i_min = int(np.nanargmin(np.where(valid, err_h, np.nan)))
+                        rows_diff.append((
+                            label, h_auto, err_auto, h_grid[i_min], err_h[i_min],
+                            abs(nilai_rich - eksak_diff), est_rich
+                        ))
+                
+                fig.update_layout(
+                    title=f"Galat Turunan ke-{orde_diff} di x₀ = {x0_diff:g} (× = h otomatis)",
+                    xaxis_title='h',
+                    yaxis_title='|D(h) − f⁽ᵈ⁾(x₀)|',
+                    xaxis_type='log',
+                    yaxis_type='log',
+                    template='plotly_white'
+                )
+                st.plotly_chart(fig, use_container_width=True)
+                
+                df_diff = pd.DataFrame(rows_diff, columns=[
+                    "Stencil", "h* Otomatis", "Galat di h*", "h Terbaik (Empiris)", "Galat Minimum",
+                    "Galat Richardson", "Estimasi Galat Richardson"
+                ])
+                st.dataframe(df_diff.style.format({
+                    "h* Otomatis": "{:.1e}", "Galat di h*": "{:.2e}", "h Terbaik (Empiris)": "{:.1e}",
+                    "Galat Minimum": "{:.2e}", "Galat Richardson": "{:.2e}", "Estimasi Galat Richardson": "{:.2e}"
+                }), use_container_width=True)
+                st.caption(f"Nilai eksak f⁽{orde_diff}⁾(x₀) = {eksak_diff:.15g} (turunan simbolik SymPy)")
+                
+                # Data tersampel: konvolusi stencil ke seluruh array
+                st.markdown("**Turunan Data Tersampel (konvolusi stencil pada grid seragam di [x₀ − 1, x₀ + 1])**")
+                x_sampel = np.linspace(x0_diff - 1, x0_diff + 1, n_sampel_diff)
+                y_sampel = np.broadcast_to(np.asarray(f_diff(x_sampel), dtype=float), x_sampel.shape)
+                f_turunan = sp.lambdify(x_sym, turunan_sym, 'numpy')
+                eksak_sampel = np.broadcast_to(np.asarray(f_turunan(x_sampel), dtype=float), x_sampel.shape)
+                
+                rows_sampel = []
+                for akurasi in [2, 4, 6]:
+                    try:
+                        t_start = time.perf_counter()
+                        d_sampel = differentiate_samples(y_sampel, x_sampel[1] - x_sampel[0], orde_diff, akurasi)
+                        t_sampel = time.perf_counter() - t_start
+                        p = len(finite_difference_stencil(orde_diff, akurasi)[0]) // 2
+                        galat_sampel = np.abs(d_sampel - eksak_sampel)
+                        rows_sampel.append((
+                            f"O(h^{akurasi})", np.max(galat_sampel[p:n_sampel_diff - p]),
+                            np.max(np.concatenate([galat_sampel[:p], galat_sampel[n_sampel_diff - p:]])),
+                            t_sampel * 1000
+                        ))
+                    except ValueError:
+                        rows_sampel.append((f"O(h^{akurasi})", np.nan, np.nan, np.nan))
+                
+                df_sampel = pd.DataFrame(rows_sampel, columns=[
+                    "Orde Akurasi", "Galat Maks Interior", "Galat Maks Tepi", "Waktu (ms)"
+                ])
+                st.dataframe(df_sampel.style.format({
+                    "Galat Maks Interior": "{:.2e}", "Galat Maks Tepi": "{:.2e}", "Waktu (ms)": "{:.3f}"
+                }), use_container_width=True)
+            
+            except (ValueError, TypeError) as e:
+                st.error(f"❌ Error: {e}")
+
+# --- HALAMAN 3: AKAR PERSAMAAN ---
+elif menu == "🎯 Akar Persamaan":
+    st.header("🎯 Mencari Akar (Root Finding)")
+    
+    st.markdown("""
+    **Masalah klasik:** Kapan fungsi ini menyentuh sumbu X (nilai nol)?
+    
+    **Aplikasi dalam teknik:**
+    - Kapan arus dalam rangkaian menjadi nol?
+    - Kapan tegangan drop menjadi nol?
+    - Mencari titik kesetimbangan sistem
+    """)
+    
+    # Pilih Metode
+    method = st.selectbox(
+        "Pilih Metode:",
+        [
+            "Bisection (Dikotomi)",
+            "Newton-Raphson",
+            "Secant",
+            "Peta Basin Newton (Kompleks)",
+            "Sweep Polinomial (Batch)",
+            "Kontinuasi Parameter (x, p)"
+        ]
+    )
+    
+    # Input Fungsi
+    st.markdown("---")
+    st.subheader("📝 Input Fungsi")
+    
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        func_input = st.text_input(
+            "Masukkan fungsi f(x):",
+            value="x**2 - 4",
+            help="Gunakan `**` untuk pangkat. Contoh: x**2 - 4, x**3 - x - 1, sin(x) - 0.5"
+        )
+    
+    with col2:
+        st.markdown("**Contoh:**")
+        st.code("x**2 - 4")
+        st.code("x**3 - x - 1")
+        st.code("sin(x) - 0.5")
+    
+    # Parse fungsi
+    f = parse_expression(func_input)
+    
+    if f is None:
+        st.warning("⚠️ Mohon perbaiki rumus fungsi sebelum melanjutkan.")
+        st.info("""
+        **Tips Penulisan:**
+        - Gunakan `x` sebagai variabel
+        - Pangkat: `x**2` bukan `x^2`
+        - Fungsi trigonometri: `sin(x)`, `cos(x)`, `tan(x)`
+        - Eksponensial: `exp(x)`
+        - Logaritma natural: `log(x)`
+        - Akar kuadrat: `sqrt(x)`
+        """)
+        st.stop()
+    
+    # Plot fungsi
+    st.markdown("---")
+    st.subheader("📊 Visualisasi Fungsi")
+    
+    try:
+        x_range = st.slider("Range X untuk plot:", -20.0, 20.0, (-10.0, 10.0), 0.5)
+        pakai_surrogate = st.checkbox(
+            "⚡ Gunakan surrogate Chebyshev (f dievaluasi sekali per range, plot & kandidat akar dibaca dari interpolan)",
+            value=False,
+            key="surrogate_akar"
+        )
+        x = np.linspace(x_range[0], x_range[1], 500)
+        
+        surrogate = None
+        if pakai_surrogate:
+            try:
+                surrogate = cached_surrogate(func_input, x_range[0], x_range[1])
+            except ValueError as e:
+                st.warning(f"⚠️ Surrogate tidak dapat dibangun, kembali ke evaluasi langsung: {e}")
+        
+        if surrogate is not None:
+            y = surrogate_eval(surrogate, x)
+        else:
+            y = f(x)
+        
+        # Pastikan y adalah array
+        if not isinstance(y, np.ndarray):
+            y = np.array(y)
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name='f(x)', line=dict(color='blue', width=2)))
+        fig.add_hline(y=0, line_dash="dash", line_color="red", annotation_text="y=0")
+        
+        if surrogate is not None:
+            kandidat_akar = surrogate_roots(surrogate)
+            fig.add_trace(go.Scatter(
+                x=kandidat_akar, y=np.zeros_like(kandidat_akar),
+                mode='markers',
+                name='Kandidat Akar (Surrogate)',
+                marker=dict(size=9, color='orange', symbol='x')
+            ))
+        fig.update_layout(
+            title="Grafik Fungsi f(x)",
+            xaxis_title='x',
+            yaxis_title='f(x)',
+            hovermode='x unified',
+            height=400
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        if surrogate is not None:
+            st.caption(
+                f"Surrogate Chebyshev derajat {len(surrogate['coeffs']) - 1} dari {surrogate['n_evals']:,} evaluasi f "
+                f"(koefisien ekor {surrogate['tail']:.1e}, di-cache per fungsi dan range). "
+                f"Kandidat akar dari nilai eigen matriks colleague: {len(kandidat_akar)} akar real."
+            )
+            if not surrogate["converged"]:
+                st.warning("⚠️ Koefisien Chebyshev belum meluruh (f tidak mulus?); plot dan kandidat akar hanya aproksimasi kasar.")
+            if len(kandidat_akar) > 0:
+                st.write("**Kandidat akar (pakai sebagai tebakan awal metode di bawah):** " +
+                         ", ".join(f"{r:.10g}" for r in kandidat_akar[:20]) +
+                         (f", … (+{len(kandidat_akar) - 20})" if len(kandidat_akar) > 20 else ""))
+        
+    except Exception as e:
+        st.error(f"❌ Error saat plotting: {e}")
+        st.info("Pastikan fungsi yang dimasukkan valid dan dapat dievaluasi untuk range x yang dipilih.")
+        st.stop()
+    
+    # Polinomial: semua akar sekaligus dari matriks companion
+    expr_poli = parse_sympy_expression(func_input)
+    koef_poli = polynomial_coefficients(expr_poli) if expr_poli is not None else None
+    
+    if koef_poli is not None:
+        st.markdown("---")
+        st.subheader(f"🧮 Polinomial Terdeteksi (Derajat {len(koef_poli) - 1}): Semua Akar Sekaligus")
+        
+        try:
+            akar_poli, residual_poli = companion_roots(koef_poli)
+            akar_poli, residual_poli = akar_poli[0], residual_poli[0]
+            
+            df_poli = pd.DataFrame({
+                "Re(akar)": akar_poli.real,
+                "Im(akar)": akar_poli.imag,
+                "Jenis": ["Real" if r.imag == 0 else "Kompleks" for r in akar_poli],
+                "|p(akar)|": residual_poli
+            })
+            st.dataframe(df_poli.style.format({
+                "Re(akar)": "{:.12g}", "Im(akar)": "{:.12g}", "|p(akar)|": "{:.2e}"
+            }), use_container_width=True)
+            st.caption(
+                "Akar dihitung sebagai nilai eigen matriks companion dari koefisien "
+                f"[{', '.join(f'{c:g}' for c in koef_poli)}], lalu dipoles 2 langkah Newton. "
+                "Metode iteratif di bawah hanya menemukan satu akar real per tebakan awal."
+            )
+        except (ValueError, np.linalg.LinAlgError) as e:
+            st.warning(f"⚠️ Akar polinomial tidak dapat dihitung: {e}")
+    
+    # Metode Bisection
+    if method == "Bisection (Dikotomi)":
+        st.markdown("---")
+        st.markdown("""
+        <div class="concept-box">
+        <h4>🎲 Konsep: Permainan Tebak Angka</h4>
+        
+        Bayangkan kita bermain tebak angka 1-100:
+        1. Pilih tengah (50): "Terlalu besar"
+        2. Pilih tengah baru (25): "Terlalu kecil"
+        3. Pilih tengah lagi (37): "Terlalu besar"
+        4. Dan seterusnya...
+        
+        **Metode Bisection** bekerja dengan cara yang sama:
+        - Kita punya interval [a, b] dimana f(a) dan f(b) berlawanan tanda
+        - Artinya ada akar di antara a dan b (berdasarkan Teorema Nilai Antara)
+        - Kita potong tengah-tengahnya, cek tandanya, buang setengah yang salah
+        - Ulangi sampai intervalnya sangat kecil
+        
+        **Keunggulan:** Selalu konvergen jika ada akar dalam interval
+        **Kelemahan:** Lambat (mengurangi error 50% setiap iterasi)
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            a = st.number_input("Batas Bawah (a):", value=-3.0, format="%.6f")
+        
+        with col2:
+            b = st.number_input("Batas Atas (b):", value=3.0, format="%.6f")
+        
+        with col3:
+            tol = st.number_input("Toleransi:", value=0.0001, format="%.6f", min_value=1e-10)
+        
+        max_iter = st.slider("Maksimum Iterasi:", 5, 100, 20)
+        batas_waktu = st.number_input("Batas Waktu (detik, 0 = tanpa batas):", value=0.0, min_value=0.0, step=1.0, key="batas_waktu_bisection")
+        
+        if st.button("🚀 Hitung Akar (Bisection)", type="primary"):
+            results, msg = stream_iterations(
+                iter_bisection(f, a, b, tol, max_iter),
+                ["Iterasi", "a", "b", "c (Akar)", "f(c)"],
+                time_budget=batas_waktu
+            )
+            
+            if results is None:
+                st.error(msg)
+            else:
+                st.success(msg)
+                
+                # Tampilkan tabel
+                st.subheader("📋 Tabel Iterasi")
+                df = pd.DataFrame(results, columns=["Iterasi", "a", "b", "c (Akar)", "f(c)"])
+                df['|b - a|'] = df['b'] - df['a']
+                st.dataframe(df.style.format({
+                    'a': '{:.6f}',
+                    'b': '{:.6f}',
+                    'c (Akar)': '{:.6f}',
+                    'f(c)': '{:.6e}',
+                    '|b - a|': '{:.6e}'
+                }), use_container_width=True)
+                
+                # Hasil akhir
+                final_root = results[-1][3]
+                final_error = abs(results[-1][4])
+                
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Akar yang ditemukan", f"{final_root:.8f}")
+                with col2:
+                    st.metric("f(akar)", f"{final_error:.2e}")
+                with col3:
+                    st.metric("Jumlah Iterasi", len(results))
+                
+                # Galat sebenarnya terhadap akar referensi presisi tinggi
+                expr_ref = parse_sympy_expression(func_input)
+                if expr_ref is not None:
+                    try:
+                        ref_akar, dari_cache = precise_root(expr_ref, final_root)
+                        show_true_error(final_root, ref_akar, dari_cache, "Akar Referensi (mpmath)")
+                    except (ValueError, ZeroDivisionError) as e:
+                        st.caption(f"Referensi presisi tinggi tidak tersedia: {e}")
+                
+                # Plot hasil
+                fig_result = go.Figure()
+                fig_result.add_trace(go.Scatter(x=x, y=y, mode='lines', name='f(x)', line=dict(color='blue', width=2)))
+                fig_result.add_hline(y=0, line_dash="dash", line_color="gray")
+                fig_result.add_trace(go.Scatter(
+                    x=[final_root], y=[0],
+                    mode='markers',
+                    marker=dict(size=15, color='red', symbol='star'),
+                    name=f'Akar ≈ {final_root:.6f}'
+                ))
+                fig_result.update_layout(
+                    title="Hasil: Akar yang Ditemukan",
+                    xaxis_title='x',
+                    yaxis_title='f(x)',
+                    height=400
+                )
+                st.plotly_chart(fig_result, use_container_width=True)
+    
+    # Metode Newton-Raphson
+    elif method == "Newton-Raphson":
+        st.markdown("---")
+        st.markdown("""
+        <div class="concept-box">
+        <h4>🎿 Konsep: Meluncur di Lereng</h4>
+        
+        Bayangkan Anda berdiri di lereng bukit dan ingin cepat turun ke lembah (akar):
+        1. Lihat kemiringan di bawah kaki Anda (turunan)
+        2. Meluncur mengikuti kemiringan itu
+        3. Sampai di titik baru, lihat kemiringan lagi
+        4. Ulangi sampai sampai di lembah
+        
+        **Metode Newton-Raphson:**
+        - Mulai dari tebakan awal x₀
+        - Tarik garis singgung di titik (x₀, f(x₀))
+        - Garis singgung memotong sumbu X di x₁
+        - x₁ biasanya lebih dekat ke akar daripada x₀
+        - Rumus: x_{n+1} = x_n - f(x_n)/f'(x_n)
+        
+        **Keunggulan:** Sangat cepat (konvergensi kuadratik)
+        **Kelemahan:** Butuh turunan, bisa gagal jika f'(x) ≈ 0
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            x0 = st.number_input("Tebakan Awal (x₀):", value=3.0, format="%.6f")
+        
+        with col2:
+            tol = st.number_input("Toleransi:", value=0.0001, format="%.6f", min_value=1e-10)
+        
+        with col3:
+            max_iter = st.slider("Maksimum Iterasi:", 5, 50, 15)
+            batas_waktu = st.number_input("Batas Waktu (detik, 0 = tanpa batas):", value=0.0, min_value=0.0, step=1.0, key="batas_waktu_newton")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            stencil_newton = st.selectbox("Stencil Turunan f'(x):", list(DIFF_STENCILS.keys()), key="stencil_newton")
+            kind_newton = DIFF_STENCILS[stencil_newton]
+        
+        with col2:
+            akurasi_newton = st.selectbox(
+                "Orde Akurasi Stencil:",
+                [2, 4, 6] if kind_newton == "central" else [1, 2, 3, 4],
+                key=f"akurasi_newton_{kind_newton}"
+            )
+        
+        with col3:
+            richardson_newton = st.checkbox("Ekstrapolasi Richardson", value=False, key="richardson_newton")
+        
+        # Turunan numerik dari engine diferensiasi (h otomatis)
+        if richardson_newton:
+            def df(x_val):
+                return richardson_derivative(f, x_val, 1, akurasi_newton, kind_newton)[0]
+        else:
+            def df(x_val):
+                return derivative(f, x_val, 1, akurasi_newton, kind_newton)
+        
+        if st.button("🚀 Hitung Akar (Newton-Raphson)", type="primary"):
+            results, msg = stream_iterations(
+                iter_newton_raphson(f, df, x0, tol, max_iter),
+                ["Iterasi", "xₙ", "f(xₙ)", "xₙ₊₁", "|xₙ₊₁ - xₙ|"],
+                time_budget=batas_waktu
+            )
+            
+            if results is None:
+                st.error(msg)
+            else:
+                st.success(msg)
+                
+                # Tampilkan tabel
+                st.subheader("📋 Tabel Iterasi")
+                df_results = pd.DataFrame(results, columns=["Iterasi", "xₙ", "f(xₙ)", "xₙ₊₁", "|xₙ₊₁ - xₙ|"])
+                st.dataframe(df_results.style.format({
+                    'xₙ': '{:.8f}',
+                    'f(xₙ)': '{:.6e}',
+                    'xₙ₊₁': '{:.8f}',
+                    '|xₙ₊₁ - xₙ|': '{:.6e}'
+                }), use_container_width=True)
+                
+                # Hasil akhir
+                final_root = results[-1][3]
+                final_error = abs(float(f(final_root)))
+                
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Akar yang ditemukan", f"{final_root:.8f}")
+                with col2:
+                    st.metric("f(akar)", f"{final_error:.2e}")
+                with col3:
+                    st.metric("Jumlah Iterasi", len(results))
+                
+                st.caption(
+                    f"f'(x) numerik: stencil {stencil_newton.lower()} O(h^{akurasi_newton}), "
+                    f"h* = {optimal_step(1, akurasi_newton, final_root):.1e}"
+                    + (", diekstrapolasi Richardson 4 level" if richardson_newton else "")
+                )
+                
+                # Galat sebenarnya terhadap akar referensi presisi tinggi
+                expr_ref = parse_sympy_expression(func_input)
+                if expr_ref is not None:
+                    try:
+                        ref_akar, dari_cache = precise_root(expr_ref, final_root)
+                        show_true_error(final_root, ref_akar, dari_cache, "Akar Referensi (mpmath)")
+                    except (ValueError, ZeroDivisionError) as e:
+                        st.caption(f"Referensi presisi tinggi tidak tersedia: {e}")
+                
+                # Plot hasil dengan garis singgung
+                fig_result = go.Figure()
+                fig_result.add_trace(go.Scatter(x=x, y=y, mode='lines', name='f(x)', line=dict(color='blue', width=2)))
+                fig_result.add_hline(y=0, line_dash="dash", line_color="gray")
+                
+                # Tambahkan garis singgung iterasi terakhir
+                if len(results) > 0:
+                    x_last = results[-1][1]
+                    f_last = float(f(x_last))
+                    df_last = float(df(x_last))
+                    
+                    # Buat garis singgung
+                    x_tangent = np.linspace(x_last - 2, x_last + 2, 50)
+                    y_tangent = f_last + df_last * (x_tangent - x_last)
+                    
+                    fig_result.add_trace(go.Scatter(
+                        x=x_tangent, y=y_tangent,
+                        mode='lines',
+                        name='Garis Singgung',
+                        line=dict(color='orange', dash='dot')
+                    ))
+                
+                fig_result.add_trace(go.Scatter(
+                    x=[final_root], y=[0],
+                    mode='markers',
+                    marker=dict(size=15, color='green', symbol='star'),
+                    name=f'Akar ≈ {final_root:.6f}'
+                ))
+                fig_result.update_layout(
+                    title="Hasil: Akar yang Ditemukan",
+                    xaxis_title='x',
+                    yaxis_title='f(x)',
+                    height=400
+                )
+                st.plotly_chart(fig_result, use_container_width=True)
+    
+    # Metode Secant
+    elif method == "Secant":
+        st.markdown("---")
+        st.markdown("""
+        <div class="concept-box">
+        <h4>📐 Konsep: Newton-Raphson Tanpa Turunan</h4>
+        
+        **Metode Secant** adalah modifikasi Newton-Raphson yang tidak memerlukan turunan:
+        - Gunakan 2 titik awal: x₀ dan x₁
+        - Tarik garis lurus (secant) melalui kedua titik
+        - Garis secant memotong sumbu X di x₂
+        - Geser: gunakan x₁ dan x₂ untuk iterasi berikutnya
+        
+        **Rumus:**
+        x_{n+1} = x_n - f(x_n) × (x_n - x_{n-1}) / (f(x_n) - f(x_{n-1}))
+        
+        **Keunggulan:** Tidak butuh turunan, lebih cepat dari Bisection
+        **Kelemahan:** Lebih lambat dari Newton-Raphson, bisa divergen
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            x0 = st.number_input("Tebakan Awal 1 (x₀):", value=0.0, format="%.6f")
+        
+        with col2:
+            x1 = st.number_input("Tebakan Awal 2 (x₁):", value=1.0, format="%.6f")
+        
+        with col3:
+            tol = st.number_input("Toleransi:", value=0.0001, format="%.6f", min_value=1e-10)
+        
+        max_iter = st.slider("Maksimum Iterasi:", 5, 50, 15)
+        batas_waktu = st.number_input("Batas Waktu (detik, 0 = tanpa batas):", value=0.0, min_value=0.0, step=1.0, key="batas_waktu_secant")
+        
+        if st.button("🚀 Hitung Akar (Secant)", type="primary"):
+            results, msg = stream_iterations(
+                iter_secant(f, x0, x1, tol, max_iter),
+                ["Iterasi", "xₙ₋₁", "xₙ", "xₙ₊₁", "f(xₙ₊₁)"],
+                time_budget=batas_waktu
+            )
+            
+            if results is None:
+                st.error(msg)
+            else:
+                st.success(msg)
+                
+                # Tampilkan tabel
+                st.subheader("📋 Tabel Iterasi")
+                df_results = pd.DataFrame(results, columns=["Iterasi", "xₙ₋₁", "xₙ", "xₙ₊₁", "f(xₙ₊₁)"])
+                st.dataframe(df_results.style.format({
+                    'xₙ₋₁': '{:.8f}',
+                    'xₙ': '{:.8f}',
+                    'xₙ₊₁': '{:.8f}',
+                    'f(xₙ₊₁)': '{:.6e}'
+                }), use_container_width=True)
+                
+                # Hasil akhir
+                final_root = results[-1][3]
+                final_error = abs(float(f(final_root)))
+                
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Akar yang ditemukan", f"{final_root:.8f}")
+                with col2:
+                    st.metric("f(akar)", f"{final_error:.2e}")
+                with col3:
+                    st.metric("Jumlah Iterasi", len(results))
+                
+                # Galat sebenarnya terhadap akar referensi presisi tinggi
+                expr_ref = parse_sympy_expression(func_input)
+                if expr_ref is not None:
+                    try:
+                        ref_akar, dari_cache = precise_root(expr_ref, final_root)
+                        show_true_error(final_root, ref_akar, dari_cache, "Akar Referensi (mpmath)")
+                    except (ValueError, ZeroDivisionError) as e:
+                        st.caption(f"Referensi presisi tinggi tidak tersedia: {e}")
+                
+                # Plot hasil
+                fig_result = go.Figure()
+                fig_result.add_trace(go.Scatter(x=x, y=y, mode='lines', name='f(x)', line=dict(color='blue', width=2)))
+                fig_result.add_hline(y=0, line_dash="dash", line_color="gray")
+                fig_result.add_trace(go.Scatter(
+                    x=[final_root], y=[0],
+                    mode='markers',
+                    marker=dict(size=15, color='purple', symbol='star'),
+                    name=f'Akar ≈ {final_root:.6f}'
+                ))
+                fig_result.update_layout(
+                    title="Hasil: Akar yang Ditemukan",
+                    xaxis_title='x',
+                    yaxis_title='f(x)',
+                    height=400
+                )
+                st.plotly_chart(fig_result, use_container_width=True)
+    
+    # Peta basin Newton di bidang kompleks
+    elif method == "Peta Basin Newton (Kompleks)":
+        st.markdown("---")
+        st.markdown("""
+        <div class="concept-box">
+        <h4>🗺️ Konsep: Ke Akar Mana Newton Akan Berakhir?</h4>
+        
+        Newton-Raphson sangat cepat, **tetapi hasilnya bergantung pada tebakan awal**. Dengan menjalankan
+        Newton dari setiap titik z₀ = a + bi pada sebuah grid di bidang kompleks, kita mendapatkan
+        **basin of attraction**: wilayah titik awal yang menuju akar yang sama.
+        
+        - **Warna**: akar yang dicapai
+        - **Kecerahan**: makin gelap makin banyak iterasi yang dibutuhkan
+        - **Hitam**: tidak konvergen (misalnya terjebak di dekat f'(z) = 0)
+        
+        Batas antar basin sering berbentuk fraktal. Titik awal di sana sangat sensitif: perubahan kecil x₀ mengubah akar yang ditemukan.
+        Contoh menarik: `x**3 - 1`, `x**4 - 1`, `x**3 - 2*x + 2` (Newton real dari x₀ = 0 berosilasi).
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            re_basin = st.slider("Rentang Re(z):", -10.0, 10.0, (-2.0, 2.0), 0.1, key="re_basin")
+            im_basin = st.slider("Rentang Im(z):", -10.0, 10.0, (-2.0, 2.0), 0.1, key="im_basin")
+        
+        with col2:
+            res_basin = st.select_slider(
+                "Resolusi Grid:",
+                options=[200, 400, 600, 800, 1000],
+                value=1000,
+                format_func=lambda v: f"{v} × {v}",
+                key="res_basin"
+            )
+            iter_basin = st.slider("Maksimum Iterasi:", 10, 200, 50, key="iter_basin")
+        
+        with col3:
+            tol_basin = st.select_slider(
+                "Toleransi Langkah:",
+                options=[1e-6, 1e-8, 1e-10, 1e-12],
+                value=1e-10,
+                format_func=lambda v: f"{v:.0e}",
+                key="tol_basin"
+            )
+        
+        if st.button("🚀 Hitung Peta Basin", type="primary", key="btn_basin"):
+            expr_basin = parse_sympy_expression(func_input)
+            
+            if expr_basin is not None:
+                try:
+                    df_basin = sp.lambdify(sp.Symbol('x'), sp.diff(expr_basin, sp.Symbol('x')), 'numpy')
+                    
+                    with st.spinner(f"Menjalankan {res_basin**2:,} iterasi Newton sekaligus..."):
+                        t_start = time.perf_counter()
+                        basin = newton_basin_map(f, df_basin, re_basin, im_basin, res_basin, iter_basin, tol_basin)
+                        t_basin = time.perf_counter() - t_start
+                    
+                    labels_basin = basin["labels"]
+                    iter_map = basin["iterations"]
+                    akar_basin = basin["roots"]
+                    
+                    col1, col2, col3, col4 = st.columns(4)
+                    
+                    with col1:
+                        st.metric("Titik Awal", f"{labels_basin.size:,}")
+                    
+                    with col2:
+                        st.metric("Konvergen", f"{np.mean(labels_basin >= 0) * 100:.2f}%")
+                    
+                    with col3:
+                        st.metric("Akar Berbeda", len(akar_basin))
+                    
+                    with col4:
+                        st.metric("Waktu", f"{t_basin:.2f} s", f"{labels_basin.size / t_basin / 1e6:.2f} juta trajektori/s", delta_color="off")
+                    
+                    # Render sebagai PNG agar grid 10⁶ titik tetap ringan di browser
+                    buffer = io.BytesIO()
+                    Image.fromarray(basin_image(labels_basin, iter_map)).save(buffer, format="PNG")
+                    sumber_png = "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode()
+                    
+                    re_grid, im_grid = basin["re"], basin["im"]
+                    fig = go.Figure()
+                    fig.add_trace(go.Image(
+                        source=sumber_png,
+                        x0=re_grid[0], dx=re_grid[1] - re_grid[0],
+                        y0=im_grid[0], dy=im_grid[1] - im_grid[0],
+                        hoverinfo='skip'
+                    ))
+                    terlihat = ((akar_basin.real >= re_basin[0]) & (akar_basin.real <= re_basin[1]) &
+                                (akar_basin.imag >= im_basin[0]) & (akar_basin.imag <= im_basin[1]))
+                    fig.add_trace(go.Scatter(
+                        x=akar_basin.real[terlihat], y=akar_basin.imag[terlihat],
+                        mode='markers', name='Akar',
+                        marker=dict(size=10, color='white', symbol='x', line=dict(color='black', width=1))
+                    ))
+                    if im_basin[0] <= 0 <= im_basin[1]:
+                        fig.add_hline(y=0, line_dash="dash", line_color="white", line_width=1)
+                    fig.update_layout(
+                        title=f"Basin of Attraction Newton untuk f(z) = {func_input}",
+                        xaxis_title='Re(z₀)',
+                        yaxis_title='Im(z₀)',
+                        yaxis=dict(autorange=True, scaleanchor='x'),
+                        height=650
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                    
+                    # Ringkasan per akar
+                    data_akar = [
+                        {
+                            "Akar": f"{r.real:.8g}" if abs(r.imag) < 1e-12 * max(abs(r), 1.0)
+                                    else f"{r.real:.8g} {'+' if r.imag >= 0 else '−'} {abs(r.imag):.8g}i",
+                            "Porsi Grid (%)": np.mean(labels_basin == k) * 100,
+                            "Iterasi Rata-rata": iter_map[labels_basin == k].mean(),
+                            "Iterasi Maks": int(iter_map[labels_basin == k].max()),
+                        }
+                        for k, r in enumerate(akar_basin)
+                    ]
+                    if data_akar:
+                        st.dataframe(pd.DataFrame(data_akar).style.format({
+                            "Porsi Grid (%)": "{:.2f}", "Iterasi Rata-rata": "{:.2f}"
+                        }), use_container_width=True)
+                    
+                    # Sumbu real (garis putus-putus) = Newton skalar pada halaman ini, dihitung tepat di Im = 0
+                    _, _, konvergen_real = newton_vectorized(f, df_basin, re_grid.astype(complex), iter_basin, tol_basin)
+                    gagal_real = ~konvergen_real
+                    st.caption(
+                        f"Newton real dari {res_basin:,} titik x₀ ∈ [{re_basin[0]}, {re_basin[1]}] (Im = 0): "
+                        f"{np.mean(gagal_real) * 100:.2f}% tidak konvergen"
+                        + (f", misalnya x₀ = {re_grid[gagal_real][0]:.4f}" if np.any(gagal_real) else "")
+                        + "."
+                    )
+                
+                except (TypeError, ValueError) as e:
+                    st.error(f"❌ Error: {e}")
+    
+    # Sweep akar polinomial (batch companion matrix)
+    elif method == "Sweep Polinomial (Batch)":
+        st.markdown("---")
+        st.markdown("""
+        <div class="concept-box">
+        <h4>📈 Konsep: Persamaan Karakteristik yang Bergantung Parameter</h4>
+        
+        Respons rangkaian ditentukan oleh akar **persamaan karakteristik**, misalnya untuk RLC seri:
+        LC·s² + RC·s + 1 = 0. Saat parameter p (mis. R) berubah, akar bergerak di bidang kompleks (**root locus**):
+        
+        - Akar kompleks → respons berosilasi (underdamped)
+        - Akar real ganda → critically damped
+        - Re(akar) > 0 → sistem tidak stabil
+        
+        Setiap nilai p menghasilkan satu baris matriks koefisien; semua matriks companion diselesaikan dalam
+        **satu panggilan np.linalg.eigvals** untuk seluruh batch.
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            expr_sweep_poli = st.text_input(
+                "Polinomial dalam x dengan parameter p:",
+                value="x**3 + 2*x**2 + p*x + 1",
+                key="expr_sweep_poli"
+            )
+        
+        with col2:
+            p_min_poli = st.number_input("p minimum:", value=0.0, format="%.4f", key="p_min_poli")
+            p_max_poli = st.number_input("p maksimum:", value=4.0, format="%.4f", key="p_max_poli")
+        
+        with col3:
+            n_p_poli = st.select_slider(
+                "Jumlah Nilai p:",
+                options=[100, 1000, 10000, 100000],
+                value=10000,
+                format_func=lambda v: f"{v:,}",
+                key="n_p_poli"
+            )
+        
+        if st.button("🚀 Hitung Root Locus", type="primary", key="btn_sweep_poli"):
+            expr_sp = parse_sympy_expression(expr_sweep_poli, ("x", "p"))
+            
+            if expr_sp is not None:
+                try:
+                    x_sym, p_sym = sp.symbols("x p")
+                    if not sp.expand(expr_sp).is_polynomial(x_sym):
+                        raise ValueError("Ekspresi harus polinomial dalam x")
+                    
+                    # Matriks koefisien: satu baris per nilai p
+                    p_vals = np.linspace(p_min_poli, p_max_poli, n_p_poli)
+                    koef_sym = sp.Poly(sp.expand(expr_sp), x_sym).all_coeffs()
+                    koef_batch = np.column_stack([
+                        np.broadcast_to(np.asarray(sp.lambdify(p_sym, c, 'numpy')(p_vals), dtype=float), p_vals.shape)
+                        for c in koef_sym
+                    ])
+                    
+                    t_start = time.perf_counter()
+                    akar_batch, residual_batch = companion_roots(koef_batch)
+                    t_batch = time.perf_counter() - t_start
+                    
+                    re_maks = akar_batch.real.max(axis=1)
+                    
+                    col1, col2, col3, col4 = st.columns(4)
+                    
+                    with col1:
+                        st.metric("Polinomial", f"{n_p_poli:,} × derajat {akar_batch.shape[1]}")
+                    
+                    with col2:
+                        st.metric("Waktu", f"{t_batch*1000:.1f} ms", f"{t_batch / n_p_poli * 1e6:.2f} µs/polinomial", delta_color="off")
+                    
+                    with col3:
+                        st.metric("Residual Maks |p(akar)|", f"{residual_batch.max():.2e}")
+                    
+                    with col4:
+                        st.metric("Nilai p Stabil (Re < 0)", f"{np.mean(re_maks < 0) * 100:.1f}%")
+                    
+                    # Root locus (dicuplik agar ringan untuk browser)
+                    stride = max(1, n_p_poli // 2000)
+                    akar_plot = akar_batch[::stride]
+                    p_plot = np.repeat(p_vals[::stride], akar_batch.shape[1])
+                    
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        fig = go.Figure()
+                        fig.add_trace(go.Scatter(
+                            x=akar_plot.real.ravel(), y=akar_plot.imag.ravel(),
+                            mode='markers',
+                            marker=dict(size=4, color=p_plot, colorscale='Viridis', showscale=True,
+                                        colorbar=dict(title='p')),
+                            name='Akar'
+                        ))
+                        fig.add_vline(x=0, line_dash="dash", line_color="red")
+                        fig.update_layout(
+                            title="Root Locus",
+                            xaxis_title='Re(akar)',
+                            yaxis_title='Im(akar)',
+                            height=450
+                        )
+                        st.plotly_chart(fig, use_container_width=True)
+                    
+                    with col2:
+                        fig_re = go.Figure()
+                        fig_re.add_trace(go.Scatter(
+                            x=p_vals[::stride], y=re_maks[::stride],
+                            mode='lines', name='max Re(akar)', line=dict(color='blue', width=2)
+                        ))
+                        fig_re.add_hline(y=0, line_dash="dash", line_color="red", annotation_text="Batas stabil")
+                        fig_re.update_layout(
+                            title="Bagian Real Terbesar vs p",
+                            xaxis_title='p',
+                            yaxis_title='max Re(akar)',
+                            height=450
+                        )
+                        st.plotly_chart(fig_re, use_container_width=True)
+                    
+                    # Nilai p saat kestabilan berubah (max Re melewati nol)
+                    silang = np.flatnonzero(np.diff(np.sign(re_maks)) != 0)
+                    if silang.size:
+                        st.info("💡 Kestabilan berubah di sekitar p ≈ " + ", ".join(f"{p_vals[i]:.6g}" for i in silang[:10]))
+                
+                except (ValueError, TypeError, np.linalg.LinAlgError) as e:
+                    st.error(f"❌ Error: {e}")
+    
+    # Kontinuasi parameter: F(x; p) = 0 untuk banyak nilai p
+    elif method == "Kontinuasi Parameter (x, p)":
+        st.markdown("---")
+        st.markdown("""
+        <div class="concept-box">
+        <h4>🧭 Konsep: Menelusuri Akar Saat Parameter Berubah</h4>
+        
+        Titik kerja rangkaian (misalnya tegangan dioda terhadap tegangan sumber) adalah akar F(x; p) = 0
+        untuk setiap nilai parameter p. Daripada menyelesaikan dari nol untuk setiap p:
+        
+        1. **Prediktor**: tebak akar di p berikutnya dari akar sebelumnya, x + (dx/dp)·Δp dengan dx/dp = −F_p / F_x
+        2. **Korektor**: beberapa langkah Newton pada p tetap, biasanya cukup 1–2 iterasi
+        3. **Fold (titik lipat)**: F_x = 0, dua akar bertemu lalu hilang. Di sana cabang berhenti dan sistem "melompat"
+        
+        Semua cabang (akar berbeda di p awal) diproses sekaligus sebagai satu array.
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            expr_kont = st.text_input(
+                "F(x, p) =",
+                value="x**3 - x - p",
+                key="expr_kont",
+                help="Contoh titik kerja dioda vs tegangan sumber: p - x - 1000*1e-12*(exp(x/0.025) - 1)"
+            )
+            prediktor_kont = st.selectbox("Prediktor:", list(CONTINUATION_PREDICTORS.keys()), key="prediktor_kont")
+        
+        with col2:
+            p_awal_kont = st.number_input("p awal:", value=-1.0, format="%.6f", key="p_awal_kont")
+            p_akhir_kont = st.number_input("p akhir:", value=1.0, format="%.6f", key="p_akhir_kont")
+            n_p_kont = st.select_slider(
+                "Jumlah Nilai p:",
+                options=[100, 500, 1000, 2000, 5000, 10000, 50000],
+                value=2000,
+                format_func=lambda v: f"{v:,}",
+                key="n_p_kont"
+            )
+        
+        with col3:
+            seed_kont = st.slider(
+                "Rentang tebakan x untuk mencari cabang di p awal:",
+                -20.0, 20.0, (-3.0, 3.0), 0.5,
+                key="seed_kont"
+            )
+            tol_kont = st.select_slider(
+                "Toleransi Korektor:",
+                options=[1e-6, 1e-8, 1e-10, 1e-12],
+                value=1e-12,
+                format_func=lambda v: f"{v:.0e}",
+                key="tol_kont"
+            )
+        
+        if st.button("🚀 Telusuri Cabang Akar", type="primary", key="btn_kont"):
+            expr_sp = parse_sympy_expression(expr_kont, ("x", "p"))
+            
+            if expr_sp is not None:
+                try:
+                    x_sym, p_sym = sp.symbols("x p")
+                    F_k, Fx_k, Fp_k, Fxx_k, Fxp_k = [
+                        sp.lambdify((x_sym, p_sym), e, 'numpy')
+                        for e in (expr_sp, sp.diff(expr_sp, x_sym), sp.diff(expr_sp, p_sym),
+                                  sp.diff(expr_sp, x_sym, 2), sp.diff(expr_sp, x_sym, p_sym))
+                    ]
+                    p_vals = np.linspace(p_awal_kont, p_akhir_kont, n_p_kont)
+                    
+                    # Cabang: akar real berbeda di p awal dari banyak tebakan sekaligus
+                    z_seed, _, konv_seed = newton_vectorized(
+                        lambda z: F_k(z, p_vals[0]), lambda z: Fx_k(z, p_vals[0]),
+                        np.linspace(seed_kont[0], seed_kont[1], 400), 60, 1e-13
+                    )
+                    akar_awal = np.unique(np.round(z_seed[konv_seed].real, 8))
+                    
+                    if akar_awal.size == 0:
+                        st.error("❌ Tidak ada akar real di p awal dalam rentang tebakan. Perlebar rentang x.")
+                    else:
+                        hasil_kont = {}
+                        for nama, pred in CONTINUATION_PREDICTORS.items():
+                            t_start = time.perf_counter()
+                            hasil_kont[nama] = continuation_sweep(
+                                F_k, Fx_k, Fp_k, akar_awal, p_vals, pred, tol_kont, Fxx=Fxx_k, Fxp=Fxp_k
+                            )
+                            hasil_kont[nama]["waktu"] = time.perf_counter() - t_start
+                        
+                        kont = hasil_kont[prediktor_kont]
+                        valid = ~np.isnan(kont["x"])
+                        
+                        col1, col2, col3, col4 = st.columns(4)
+                        
+                        with col1:
+                            st.metric("Cabang", len(akar_awal))
+                        
+                        with col2:
+                            st.metric("Titik Diselesaikan", f"{int(valid.sum()):,}")
+                        
+                        with col3:
+                            st.metric("Iterasi Korektor Rata-rata", f"{kont['iterations'][valid].mean():.2f}")
+                        
+                        with col4:
+                            st.metric("Fold Terdeteksi", len(kont["folds"]))
+                        
+                        # Plot diagram cabang
+                        stride = max(1, n_p_kont // 3000)
+                        fig = go.Figure()
+                        for b in range(len(akar_awal)):
+                            fig.add_trace(go.Scatter(
+                                x=p_vals[::stride], y=kont["x"][::stride, b],
+                                mode='lines', name=f'Cabang {b + 1} (x₀ = {akar_awal[b]:.4g})'
+                            ))
+                        if kont["folds"]:
+                            fig.add_trace(go.Scatter(
+                                x=[fp for _, _, fp in kont["folds"]], y=[fx for _, fx, _ in kont["folds"]],
+                                mode='markers', name='Fold',
+                                marker=dict(size=12, color='red', symbol='diamond')
+                            ))
+                        fig.update_layout(
+                            title=f"Diagram Cabang: {expr_kont} = 0",
+                            xaxis_title='p',
+                            yaxis_title='x',
+                            hovermode='closest',
+                            height=500
+                        )
+                        st.plotly_chart(fig, use_container_width=True)
+                        
+                        col1, col2 = st.columns(2)
+                        
+                        with col1:
+                            st.markdown("**Perbandingan Prediktor**")
+                            df_pred = pd.DataFrame([
+                                {
+                                    "Prediktor": nama,
+                                    "Titik Selesai": int((~np.isnan(h["x"])).sum()),
+                                    "Iterasi Rata-rata": h["iterations"][~np.isnan(h["x"])].mean(),
+                                    "Iterasi Maks": int(h["iterations"][~np.isnan(h["x"])].max()),
+                                    "Total Iterasi": int(h["iterations"].sum()),
+                                    "Waktu (ms)": h["waktu"] * 1000,
+                                }
+                                for nama, h in hasil_kont.items()
+                            ])
+                            st.dataframe(df_pred.style.format({
+                                "Iterasi Rata-rata": "{:.2f}", "Waktu (ms)": "{:.1f}"
+                            }), use_container_width=True)
+                        
+                        with col2:
+                            st.markdown("**Status Cabang**")
+                            df_cabang = pd.DataFrame({
+                                "Cabang": np.arange(1, len(akar_awal) + 1),
+                                "x di p awal": akar_awal,
+                                "Status": kont["status"],
+                            })
+                            st.dataframe(df_cabang.style.format({"x di p awal": "{:.8g}"}), use_container_width=True)
+                        
+                        if kont["folds"]:
+                            st.info("💡 Fold (F = 0 dan F_x = 0): " + ", ".join(
+                                f"(p = {fp:.10g}, x = {fx:.10g})" for _, fx, fp in
+                                sorted({(round(fp, 9), round(fx, 9)): (b, fx, fp) for b, fx, fp in kont["folds"]}.values(),
+                                       key=lambda t: t[2])
+                            ))
+                
+                except (ValueError, TypeError) as e:
+                    st.error(f"❌ Error: {e}")
+
+# --- HALAMAN 4: SISTEM LINEAR ---
+elif menu == "🧮 Sistem Linear":
+    st.header("🧮 Sistem Persamaan Linear")
+    
+    st.markdown("""
+    **Memecahkan masalah seperti:**
+    - Berapa arus di setiap cabang rangkaian? (Hukum Kirchhoff)
+    - Berapa gaya pada setiap tumpuan jembatan?
+    - Bagaimana distribusi suhu dalam sistem?
+    
+    Semua masalah ini dapat dinyatakan dalam bentuk matriks: **Ax = b**
+    """)
+    
+    st.markdown('<div class="concept-box">', unsafe_allow_html=True)
+    st.markdown("""
+    ### 🎯 Konsep Sistem Linear
+    
+    Sistem persamaan linear adalah kumpulan persamaan seperti:
+```
+    3x + 2y - z = 1
+    2x - 2y + 4z = -2
+    -x + 0.5y - z = 0
+```
+    
+    Dalam bentuk matriks:
+    
+    **A** (Koefisien) × **x** (Unknown) = **b** (Konstanta)
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    st.markdown("---")
+    st.subheader("📝 Input Sistem 3×3")
+    
+    st.info("💡 Masukkan koefisien untuk sistem 3 persamaan dengan 3 variabel (x₁, x₂, x₃)")
+    
+    # Input Matrix A
+    st.markdown("**Matriks Koefisien A:**")
+    col1, col2, col3, col4 = st.columns([2, 2, 2, 2])
+    
+    with col1:
+        st.markdown("**Persamaan 1:**")
+        a11 = st.number_input("a₁₁", value=3.0, format="%.4f", key="a11")
+        a12 = st.number_input("a₁₂", value=2.0, format="%.4f", key="a12")
+        a13 = st.number_input("a₁₃", value=-1.0, format="%.4f", key="a13")
+    
+    with col2:
+        st.markdown("**Persamaan 2:**")
+        a21 = st.number_input("a₂₁", value=2.0, format="%.4f", key="a21")
+        a22 = st.number_input("a₂₂", value=-2.0, format="%.4f", key="a22")
+        a23 = st.number_input("a₂₃", value=4.0, format="%.4f", key="a23")
+    
+    with col3:
+        st.markdown("**Persamaan 3:**")
+        a31 = st.number_input("a₃₁", value=-1.0, format="%.4f", key="a31")
+        a32 = st.number_input("a₃₂", value=0.5, format="%.4f", key="a32")
+        a33 = st.number_input("a₃₃", value=-1.0, format="%.4f", key="a33")
+    
+    with col4:
+        st.markdown("**Vektor b:**")
+        b1 = st.number_input("b₁", value=1.0, format="%.4f", key="b1")
+        b2 = st.number_input("b₂", value=-2.0, format="%.4f", key="b2")
+        b3 = st.number_input("b₃", value=0.0, format="%.4f", key="b3")
+    
+    # Tampilkan sistem dalam bentuk LaTeX
+    st.markdown("---")
+    st.subheader("📐 Sistem Persamaan:")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.latex(fr"""
+        \begin{{cases}}
+        {a11}x_1 + {a12}x_2 + {a13}x_3 = {b1} \\
+        {a21}x_1 + {a22}x_2 + {a23}x_3 = {b2} \\
+        {a31}x_1 + {a32}x_2 + {a33}x_3 = {b3}
+        \end{{cases}}
+        """)
+    
+    with col2:
+        st.markdown("**Bentuk Matriks:**")
+        st.latex(r"""
+        \begin{bmatrix} A \end{bmatrix} 
+        \begin{bmatrix} x \end{bmatrix} = 
+        \begin{bmatrix} b \end{bmatrix}
+        """)
+    
+    # Matriks input dipakai bersama oleh semua mode
+    A_input = np.array([
+        [a11, a12, a13],
+        [a21, a22, a23],
+        [a31, a32, a33]
+    ])
+    b_input = np.array([b1, b2, b3])
+    
+    st.markdown("---")
+    mode_linear = st.selectbox(
+        "Pilih Mode:",
+        [
+            "Solusi Tunggal (LAPACK)",
+            "Eliminasi Gauss (Langkah demi Langkah)",
+            "Nilai Eigen",
+            "Sistem Nonlinear (Newton/Broyden)",
+            "Batch / Monte Carlo",
+            "Out-of-Core LU (Matriks di Disk)"
+        ]
+    )
+    
+    if mode_linear == "Solusi Tunggal (LAPACK)":
+        # Tombol solve
+        if st.button("🚀 Selesaikan Sistem", type="primary"):
+            A = np.array([
+                [a11, a12, a13],
+                [a21, a22, a23],
+                [a31, a32, a33]
+            ])
+            b = np.array([b1, b2, b3])
+            
+            try:
+                # Hitung determinan
+                det_A = np.linalg.det(A)
+                
+                st.markdown("---")
+                st.subheader("📊 Analisis Matriks")
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.metric("Determinan", f"{det_A:.6f}")
+                    if abs(det_A) < 1e-10:
+                        st.error("⚠️ Matriks singular! (det ≈ 0)")
+                        st.info("Sistem tidak memiliki solusi unik atau tidak memiliki solusi.")
+                    else:
+                        st.success("✅ Matriks non-singular (det ≠ 0)")
+                
+                with col2:
+                    condition_number = np.linalg.cond(A)
+                    st.metric("Condition Number", f"{condition_number:.2f}")
+                    if condition_number > 1000:
+                        st.warning("⚠️ Matriks ill-conditioned (sensitif terhadap error)")
+                    else:
+                        st.success("✅ Matriks well-conditioned")
+                
+                # Solve
+                if abs(det_A) >= 1e-10:
+                    sol = np.linalg.solve(A, b)
+                    
+                    st.markdown("---")
+                    st.subheader("✅ Solusi")
+                    
+                    col1, col2, col3 = st.columns(3)
+                    
+                    with col1:
+                        st.metric("x₁", f"{sol[0]:.6f}")
+                    
+                    with col2:
+                        st.metric("x₂", f"{sol[1]:.6f}")
+                    
+                    with col3:
+                        st.metric("x₃", f"{sol[2]:.6f}")
+                    
+                    # Verifikasi
+                    st.markdown("---")
+                    st.subheader("🔍 Verifikasi: A × x = b")
+                    
+                    result = A @ sol
+                    
+                    verification_df = pd.DataFrame({
+                        'Persamaan': ['Persamaan 1', 'Persamaan 2', 'Persamaan 3'],
+                        'A×x (Hasil)': result,
+                        'b (Target)': b,
+                        'Error': np.abs(result - b)
+                    })
+                    
+                    st.dataframe(verification_df.style.format({
+                        'A×x (Hasil)': '{:.6f}',
+                        'b (Target)': '{:.6f}',
+                        'Error': '{:.2e}'
+                    }), use_container_width=True)
+                    
+                    max_error = np.max(np.abs(result - b))
+                    if max_error < 1e-6:
+                        st.success(f"✅ Verifikasi berhasil! Max error: {max_error:.2e}")
+                    else:
+                        st.warning(f"⚠️ Error verifikasi: {max_error:.2e}")
+                    
+                    # Galat sebenarnya terhadap solusi referensi presisi tinggi
+                    ref_sol, dari_cache = precise_linear_solution(A, b)
+                    galat_sol = [true_error(x_k, r_k) for x_k, r_k in zip(sol, ref_sol)]
+                    df_ref_sol = pd.DataFrame({
+                        'Variabel': ['x₁', 'x₂', 'x₃'],
+                        'Solusi (LAPACK)': sol,
+                        'Referensi (mpmath)': [mpmath.nstr(r, 17) for r in ref_sol],
+                        'Galat Absolut': [g[0] for g in galat_sol],
+                        'Galat Relatif (%)': [g[1] for g in galat_sol]
+                    })
+                    st.dataframe(df_ref_sol.style.format({
+                        'Solusi (LAPACK)': '{:.10f}',
+                        'Galat Absolut': '{:.2e}',
+                        'Galat Relatif (%)': '{:.2e}'
+                    }), use_container_width=True)
+                    st.caption(f"Referensi mpmath.lu_solve {REFERENCE_DPS} digit "
+                               f"{'dari cache disk' if dari_cache else 'dihitung dan disimpan ke cache disk'}")
+                    
+                    # Visualisasi (untuk sistem 2D)
+                    st.markdown("---")
+                    st.info("""
+                    💡 **Metode yang Digunakan:**
+                    
+                    NumPy menggunakan algoritma LAPACK yang didasarkan pada:
+                    - **LU Decomposition** untuk matriks umum
+                    - **Gaussian Elimination** dengan partial pivoting
+                    - Sangat efisien dan stabil secara numerik
+                    """)
+            
+            except np.linalg.LinAlgError as e:
+                st.error(f"❌ Error: Singular Matrix! {e}")
+                st.info("""
+                **Penyebab:**
+                - Determinan = 0
+                - Ada persamaan yang redundan
+                - Tidak ada solusi unik
+                """)    
+    elif mode_linear == "Eliminasi Gauss (Langkah demi Langkah)":
+        st.markdown("""
+        <div class="concept-box">
+        <h4>🪜 Konsep: Eliminasi Gauss yang Bisa Diputar Ulang</h4>
+        
+        Setiap langkah k memilih pivot, lalu mengurangkan kelipatan baris pivot dari baris di bawahnya
+        sehingga kolom k menjadi nol. Multiplier yang dipakai disimpan di tempat nol tersebut
+        (seperti LAPACK), sehingga **log pivot + multiplier** cukup untuk merekonstruksi
+        keadaan matriks di langkah mana pun tanpa menyimpan n salinan matriks.
+        
+        **Scaled partial pivoting** membandingkan |aᵢₖ| relatif terhadap elemen terbesar di barisnya,
+        berguna bila skala baris sangat berbeda (misal: satuan Ω vs MΩ).
+        </div>
+        """, unsafe_allow_html=True)
+        
+        sumber_gauss = st.radio(
+            "Sumber Matriks:",
+            ["Matriks 3×3 di atas", "Matriks acak n×n"],
+            horizontal=True
+        )
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            pivot_gauss = st.selectbox("Strategi Pivoting:", ["Partial Pivoting", "Scaled Partial Pivoting", "Tanpa Pivoting"])
+        
+        with col2:
+            if sumber_gauss == "Matriks acak n×n":
+                n_gauss = st.slider("Ukuran Matriks (n):", 2, 1500, 200)
+            else:
+                n_gauss = 3
+        
+        with col3:
+            record_gauss = st.checkbox("Rekam log pivot & multiplier", value=True)
+        
+        pivot_key = {"Partial Pivoting": "partial", "Scaled Partial Pivoting": "scaled", "Tanpa Pivoting": "none"}[pivot_gauss]
+        
+        if st.button("🚀 Jalankan Eliminasi", type="primary"):
+            if sumber_gauss == "Matriks 3×3 di atas":
+                A_gauss, b_gauss = A_input, b_input
+            else:
+                A_gauss, b_gauss = random_test_system(n_gauss)
+            
+            try:
+                with st.spinner("Eliminasi..."):
+                    t_start = time.perf_counter()
+                    x_gauss, log_gauss = gauss_elimination(A_gauss, b_gauss, pivot_key, record_gauss)
+                    t_engine = time.perf_counter() - t_start
+                    
+                    t_start = time.perf_counter()
+                    x_lapack = np.linalg.solve(A_gauss, b_gauss)
+                    t_lapack = time.perf_counter() - t_start
+                
+                st.session_state["gauss_result"] = {
+                    "A": A_gauss, "b": b_gauss, "x": x_gauss, "x_lapack": x_lapack,
+                    "log": log_gauss, "t_engine": t_engine, "t_lapack": t_lapack
+                }
+            
+            except np.linalg.LinAlgError as e:
+                st.session_state.pop("gauss_result", None)
+                st.error(f"❌ Error: Singular Matrix! {e}")
+        
+        hasil_gauss = st.session_state.get("gauss_result")
+        
+        if hasil_gauss is not None:
+            A_gauss, b_gauss, x_gauss = hasil_gauss["A"], hasil_gauss["b"], hasil_gauss["x"]
+            n_hasil = len(x_gauss)
+            
+            st.markdown("---")
+            st.subheader("⏱️ Waktu vs LAPACK")
+            
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.metric("Ukuran", f"{n_hasil} × {n_hasil}")
+            
+            with col2:
+                st.metric("Engine NumPy (in-place)", f"{hasil_gauss['t_engine']*1000:.2f} ms")
+            
+            with col3:
+                st.metric("LAPACK (np.linalg.solve)", f"{hasil_gauss['t_lapack']*1000:.2f} ms")
+            
+            with col4:
+                st.metric("Selisih Solusi", f"{np.max(np.abs(x_gauss - hasil_gauss['x_lapack'])):.2e}")
+            
+            if n_hasil <= 10:
+                st.subheader("✅ Solusi")
+                st.dataframe(pd.DataFrame({
+                    'Variabel': [f"x{i+1}" for i in range(n_hasil)],
+                    'Eliminasi Gauss': x_gauss,
+                    'LAPACK': hasil_gauss["x_lapack"]
+                }).style.format({'Eliminasi Gauss': '{:.8f}', 'LAPACK': '{:.8f}'}), use_container_width=True)
+            
+            max_error = np.max(np.abs(A_gauss @ x_gauss - b_gauss))
+            if max_error < 1e-6:
+                st.success(f"✅ Verifikasi berhasil! Max error: {max_error:.2e}")
+            else:
+                st.warning(f"⚠️ Error verifikasi: {max_error:.2e}")
+            
+            log_gauss = hasil_gauss["log"]
+            
+            if log_gauss is None:
+                st.info("💡 Aktifkan perekaman log untuk memutar ulang langkah eliminasi.")
+            else:
+                st.markdown("---")
+                st.subheader("🔁 Replay Langkah Eliminasi")
+                
+                F = log_gauss["factors"]
+                growth = np.max(np.abs(np.triu(F[:, :n_hasil]))) / np.max(np.abs(A_gauss))
+                st.caption(
+                    f"Ukuran log: {(F.nbytes + log_gauss['pivots'].nbytes) / 1024**2:.2f} MB "
+                    f"(vs {n_hasil * F.nbytes / 1024**2:,.1f} MB untuk {n_hasil} snapshot) · "
+                    f"Growth factor: {growth:.2f}"
+                )
+                
+                step = st.slider("Keadaan setelah langkah ke-:", 0, n_hasil, min(1, n_hasil))
+                state, perm_step = replay_elimination(A_gauss, b_gauss, log_gauss, step)
+                
+                if step > 0:
+                    k = step - 1
+                    multipliers = F[k+1:, k]
+                    
+                    col1, col2, col3 = st.columns(3)
+                    
+                    with col1:
+                        st.metric("Baris Pivot Dipilih", f"{log_gauss['pivots'][k] + 1} → {k + 1}")
+                    
+                    with col2:
+                        st.metric("Nilai Pivot", f"{F[k, k]:.6f}")
+                    
+                    with col3:
+                        st.metric("Max |Multiplier|", f"{np.max(np.abs(multipliers)):.4f}" if len(multipliers) else "-")
+                
+                if n_hasil <= 10:
+                    kolom = [f"x{i+1}" for i in range(n_hasil)] + ["b"]
+                    df_state = pd.DataFrame(state, columns=kolom, index=[f"Baris {p+1}" for p in perm_step])
+                    st.dataframe(df_state.style.format('{:.6f}'), use_container_width=True)
+                else:
+                    stride = max(1, n_hasil // 200)
+                    with np.errstate(divide='ignore'):
+                        z = np.log10(np.abs(state[::stride, ::stride]))
+                    fig_state = go.Figure(go.Heatmap(z=z, colorscale='Viridis', colorbar=dict(title='log₁₀|a|')))
+                    fig_state.update_layout(
+                        title=f"Matriks Augmented setelah Langkah {step} (stride {stride})",
+                        yaxis=dict(autorange='reversed'),
+                        height=500
+                    )
+                    st.plotly_chart(fig_state, use_container_width=True)    
+    elif mode_linear == "Nilai Eigen":
+        st.markdown("""
+        <div class="concept-box">
+        <h4>🎵 Konsep: Nilai Eigen = "Nada Alami" Sistem</h4>
+        
+        Nilai eigen λ memenuhi **A v = λ v**: arah v yang hanya diregangkan oleh A.
+        Dalam teknik elektro, nilai eigen menentukan **frekuensi resonansi** dan **kestabilan** sistem.
+        
+        - **Power Iteration:** kalikan A berulang-ulang → menuju eigen dominan (|λ| terbesar)
+        - **Shifted Inverse Iteration:** power iteration pada (A - σI)⁻¹ → eigen terdekat ke σ
+        - **Algoritma QR:** A = QR → RQ berulang hingga segitiga atas → semua eigen
+        - **Lanczos/Arnoldi:** untuk matriks sparse besar, cari hanya k eigen ekstrem
+        </div>
+        """, unsafe_allow_html=True)
+        
+        metode_eigen = st.selectbox(
+            "Metode Eigen:",
+            ["Power Iteration", "Shifted Inverse Iteration", "Algoritma QR", "Lanczos/Arnoldi (Sparse)"]
+        )
+        
+        if metode_eigen != "Lanczos/Arnoldi (Sparse)":
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                sumber_eigen = st.radio(
+                    "Sumber Matriks:",
+                    ["Matriks 3×3 di atas", "Matriks acak n×n"],
+                    horizontal=True,
+                    key="sumber_eigen"
+                )
+            
+            with col2:
+                if sumber_eigen == "Matriks acak n×n":
+                    n_eigen = st.slider("Ukuran Matriks (n):", 2, 500, 50, key="n_eigen")
+                    simetris_eigen = st.checkbox("Simetriskan: (A + Aᵀ) / 2", value=True)
+            
+            if sumber_eigen == "Matriks 3×3 di atas":
+                A_eigen = A_input
+            else:
+                A_eigen = random_test_system(n_eigen)[0]
+                if simetris_eigen:
+                    A_eigen = (A_eigen + A_eigen.T) / 2
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                tol_eigen = st.number_input("Toleransi:", value=1e-10, format="%.2e", min_value=1e-15, key="tol_eigen")
+            
+            with col2:
+                max_iter_eigen = st.number_input("Maksimum Iterasi:", value=500, min_value=1, max_value=100000, step=100)
+            
+            with col3:
+                if metode_eigen == "Shifted Inverse Iteration":
+                    shift_eigen = st.number_input("Shift σ:", value=0.0, format="%.6f")
+            
+            if st.button("🚀 Hitung Nilai Eigen", type="primary"):
+                n_eig = A_eigen.shape[0]
+                x0_eigen = np.ones(n_eig)
+                
+                try:
+                    t_start = time.perf_counter()
+                    
+                    if metode_eigen == "Power Iteration":
+                        results, msg = power_iteration(A_eigen, x0_eigen, tol_eigen, int(max_iter_eigen))
+                    
+                    elif metode_eigen == "Shifted Inverse Iteration":
+                        # Pakai ulang faktorisasi LU dari mode Eliminasi Gauss bila matriksnya sama
+                        hasil_gauss = st.session_state.get("gauss_result")
+                        if (shift_eigen == 0 and hasil_gauss is not None and hasil_gauss["log"] is not None
+                                and hasil_gauss["A"].shape == A_eigen.shape and np.array_equal(hasil_gauss["A"], A_eigen)):
+                            lu_piv = (hasil_gauss["log"]["factors"][:, :n_eig], hasil_gauss["log"]["pivots"])
+                            st.caption("♻️ Memakai faktorisasi LU dari mode Eliminasi Gauss")
+                        else:
+                            lu_piv = lu_factor_cached(A_eigen - shift_eigen * np.eye(n_eig))
+                            st.caption("♻️ Faktorisasi LU dari (A - σI) di-cache untuk run berikutnya")
+                        results, msg = inverse_iteration(A_eigen, lu_piv, x0_eigen, tol_eigen, int(max_iter_eigen))
+                    
+                    else:
+                        eig_qr, results, msg = qr_algorithm(A_eigen, tol_eigen, int(max_iter_eigen))
+                    
+                    t_eigen = time.perf_counter() - t_start
+                
+                except (np.linalg.LinAlgError, linalg.LinAlgError) as e:
+                    st.error(f"❌ Error: {e}")
+                    st.stop()
+                
+                if results is None:
+                    st.error(msg)
+                    st.stop()
+                
+                if msg.startswith("✅"):
+                    st.success(msg)
+                else:
+                    st.warning(msg)
+                
+                eig_ref = np.linalg.eigvals(A_eigen)
+                
+                st.subheader("📋 Tabel Konvergensi")
+                
+                if metode_eigen == "Algoritma QR":
+                    df_eigen = pd.DataFrame(results, columns=["Iterasi", "Ukuran Aktif", "Shift μ", "|h(m,m-1)|"])
+                    df_eigen["Shift μ"] = df_eigen["Shift μ"].map(lambda z: f"{z.real:.6f}{z.imag:+.6f}j")
+                    y_konvergensi = df_eigen["|h(m,m-1)|"]
+                    fmt = {'|h(m,m-1)|': '{:.3e}'}
+                else:
+                    df_eigen = pd.DataFrame(results, columns=["Iterasi", "λ", "|Δλ|", "‖Ax - λx‖"])
+                    y_konvergensi = df_eigen["‖Ax - λx‖"]
+                    fmt = {'λ': '{:.10f}', '|Δλ|': '{:.3e}', '‖Ax - λx‖': '{:.3e}'}
+                
+                st.dataframe(df_eigen.style.format(fmt), use_container_width=True, height=300)
+                
+                fig_eig = go.Figure(go.Scatter(x=df_eigen["Iterasi"], y=y_konvergensi, mode='lines+markers'))
+                fig_eig.update_layout(
+                    title="Konvergensi per Iterasi",
+                    xaxis_title='Iterasi',
+                    yaxis_title='Residual / |subdiagonal|',
+                    yaxis_type='log',
+                    height=350
+                )
+                st.plotly_chart(fig_eig, use_container_width=True)
+                
+                col1, col2, col3 = st.columns(3)
+                
+                if metode_eigen == "Algoritma QR":
+                    with col1:
+                        st.metric("Jumlah Eigen Ditemukan", f"{len(eig_qr)} / {n_eig}")
+                    with col2:
+                        st.metric("Jumlah Iterasi QR", len(results))
+                    with col3:
+                        st.metric("Waktu", f"{t_eigen*1000:.2f} ms")
+                    
+                    if len(eig_qr) == n_eig:
+                        selisih = np.max(np.min(np.abs(eig_ref[:, None] - eig_qr[None, :]), axis=1))
+                        st.info(f"Selisih maksimum terhadap np.linalg.eigvals: {selisih:.2e}")
+                    
+                    eig_qr = eig_qr[np.argsort(-np.abs(eig_qr))]
+                    st.dataframe(pd.DataFrame({
+                        'λ (Real)': np.real(eig_qr),
+                        'λ (Imajiner)': np.imag(eig_qr),
+                        '|λ|': np.abs(eig_qr)
+                    }).style.format('{:.8f}'), use_container_width=True)
+                else:
+                    lam_final = results[-1][1]
+                    terdekat = eig_ref[np.argmin(np.abs(eig_ref - lam_final))]
+                    with col1:
+                        st.metric("Nilai Eigen λ", f"{lam_final:.10f}")
+                    with col2:
+                        st.metric("Jumlah Iterasi", len(results))
+                    with col3:
+                        st.metric("Selisih vs eigvals", f"{abs(lam_final - terdekat):.2e}")
+                    
+                    if metode_eigen == "Power Iteration":
+                        urut = np.sort(np.abs(eig_ref))[::-1]
+                        if len(urut) > 1 and urut[0] > 0:
+                            st.caption(f"Rasio |λ₂/λ₁| = {urut[1]/urut[0]:.4f} menentukan laju konvergensi (semakin dekat 1, semakin lambat).")
+        
+        else:
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                jenis_sparse = st.selectbox("Matriks Sparse:", ["Laplacian 1-D (rantai RC)", "Laplacian 2-D (grid)", "Upload file .npz"])
+            
+            with col2:
+                if jenis_sparse == "Upload file .npz":
+                    file_sparse = st.file_uploader("Matriks sparse (scipy.sparse.save_npz):", type=["npz"])
+                else:
+                    n_sparse = st.number_input("Ukuran (n):", value=100000, min_value=10, max_value=2000000, step=10000)
+            
+            with col3:
+                k_sparse = st.slider("Jumlah Eigen (k):", 1, 20, 6)
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                target_sparse = st.radio("Cari Eigen:", ["Terkecil", "Terbesar", "Terdekat ke σ"], horizontal=True)
+                if target_sparse == "Terdekat ke σ":
+                    sigma_sparse = st.number_input("σ:", value=1.0, format="%.6f")
+            
+            with col2:
+                shift_invert = st.checkbox(
+                    "Shift-invert (faktorisasi LU sparse)",
+                    value=True,
+                    help="Jauh lebih cepat bila nilai eigen di ujung spektrum berdekatan, seperti pada Laplacian"
+                )
+            
+            if st.button("🚀 Hitung Eigen Sparse", type="primary"):
+                try:
+                    if jenis_sparse == "Upload file .npz":
+                        if file_sparse is None:
+                            st.warning("⚠️ Upload file matriks sparse terlebih dahulu.")
+                            st.stop()
+                        A_sparse = sparse.load_npz(io.BytesIO(file_sparse.getvalue())).tocsr().astype(float)
+                        eig_exact = None
+                    else:
+                        kind = "1-D" if jenis_sparse.startswith("Laplacian 1-D") else "2-D"
+                        A_sparse, eig_exact = sparse_test_matrix(kind, int(n_sparse))
+                    
+                    # Batas Gershgorin sebagai shift untuk ujung spektrum
+                    radius = np.asarray(abs(A_sparse).sum(axis=1)).ravel() - abs(A_sparse.diagonal())
+                    if target_sparse == "Terdekat ke σ":
+                        sigma = sigma_sparse
+                    elif not shift_invert:
+                        sigma = None
+                    elif target_sparse == "Terbesar":
+                        sigma = float(np.max(A_sparse.diagonal() + radius))
+                    else:
+                        sigma = float(np.min(A_sparse.diagonal() - radius))
+                    
+                    with st.spinner("Iterasi Lanczos/Arnoldi..."):
+                        t_start = time.perf_counter()
+                        vals, residuals, n_op, nama_algo = sparse_extreme_eigs(
+                            A_sparse, k_sparse, largest=(target_sparse == "Terbesar"), sigma=sigma
+                        )
+                        t_sparse = time.perf_counter() - t_start
+                
+                except (ValueError, RuntimeError, sparse_linalg.ArpackError) as e:
+                    st.error(f"❌ Error: {e}")
+                    st.stop()
+                
+                st.success(f"✅ {k_sparse} pasangan eigen ditemukan dengan {nama_algo}")
+                
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    st.metric("Ukuran Matriks", f"{A_sparse.shape[0]:,}")
+                
+                with col2:
+                    st.metric("Elemen Tak-Nol", f"{A_sparse.nnz:,}")
+                
+                with col3:
+                    st.metric("Solve LU" if sigma is not None else "Perkalian A·v", f"{n_op:,}")
+                
+                with col4:
+                    st.metric("Waktu", f"{t_sparse:.3f} s")
+                
+                df_sparse = pd.DataFrame({
+                    'λ': np.real(vals),
+                    'Im(λ)': np.imag(vals),
+                    '‖Av - λv‖': residuals
+                })
+                
+                if eig_exact is not None:
+                    idx = np.argmin(np.abs(eig_exact[None, :] - np.real(vals)[:, None]), axis=1)
+                    df_sparse['λ Eksak'] = eig_exact[idx]
+                    df_sparse['Error'] = np.abs(np.real(vals) - eig_exact[idx])
+                
+                st.dataframe(df_sparse.style.format('{:.6e}'), use_container_width=True)
+                st.caption(f"Matriks penuh {A_sparse.shape[0]:,}² akan membutuhkan {A_sparse.shape[0]**2 * 8 / 1024**3:,.1f} GB untuk np.linalg.eig.")    
+    elif mode_linear == "Sistem Nonlinear (Newton/Broyden)":
+        st.markdown("""
+        <div class="concept-box">
+        <h4>🔁 Konsep: Linearisasi Berulang</h4>
+        
+        Rangkaian dengan dioda atau transistor menghasilkan sistem **F(x) = 0** yang nonlinear.
+        Newton multivariat mengganti F dengan pendekatan linear di sekitar x:
+        
+        **J(xₙ) Δx = -F(xₙ)**, lalu xₙ₊₁ = xₙ + Δx
+        
+        Setiap iterasi adalah satu sistem linear **Ax = b** dengan A = Jacobian!
+        
+        **Broyden** menghemat perhitungan Jacobian: J dihitung sekali, lalu diperbarui dengan
+        koreksi rank-1 dari langkah sebelumnya.
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            eq_input = st.text_area(
+                "Persamaan F(x) = 0 (satu per baris):",
+                value="x1**2 + x2**2 - 4\nexp(x1) + x2 - 1",
+                height=120
+            )
+            var_input = st.text_input("Variabel (pisahkan dengan koma):", value="x1, x2")
+            x0_input = st.text_input("Tebakan Awal x₀ (pisahkan dengan koma):", value="1, -1")
+        
+        with col2:
+            st.markdown("**Contoh (dua dioda seri, v1, v2):**")
+            st.code("(5 - v1)/1000 - 1e-12*(exp((v1 - v2)/0.02585) - 1)\n1e-12*(exp((v1 - v2)/0.02585) - 1) - v2/1000")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            metode_nl = st.radio("Metode:", ["Newton", "Broyden"], horizontal=True)
+        
+        with col2:
+            tol_nl = st.number_input("Toleransi:", value=1e-10, format="%.2e", min_value=1e-15, key="tol_nl")
+        
+        with col3:
+            max_iter_nl = st.slider("Maksimum Iterasi:", 5, 200, 50, key="max_iter_nl")
+        
+        if metode_nl == "Newton":
+            damped_nl = st.checkbox("Damping (backtracking line search)", value=False)
+        
+        variabel_nl = tuple(v.strip() for v in var_input.split(',') if v.strip())
+        baris_nl = [s.strip() for s in eq_input.strip().splitlines() if s.strip()]
+        
+        if len(baris_nl) != len(variabel_nl):
+            st.error(f"❌ Jumlah persamaan ({len(baris_nl)}) harus sama dengan jumlah variabel ({len(variabel_nl)})!")
+            st.stop()
+        
+        ekspresi_nl = [parse_sympy_expression(s, variabel_nl) for s in baris_nl]
+        if any(e is None for e in ekspresi_nl):
+            st.warning("⚠️ Mohon perbaiki rumus persamaan sebelum melanjutkan.")
+            st.stop()
+        
+        F_nl, J_nl, J_expr = build_nonlinear_system(ekspresi_nl, variabel_nl)
+        
+        st.markdown("**Jacobian simbolik J(x):**")
+        st.latex(r"J = " + sp.latex(J_expr))
+        
+        if st.button("🚀 Selesaikan Sistem Nonlinear", type="primary"):
+            try:
+                x0_nl = np.array([float(v.strip()) for v in x0_input.split(',')])
+            except ValueError as e:
+                st.error(f"❌ Error parsing tebakan awal: {e}")
+                st.stop()
+            
+            if len(x0_nl) != len(variabel_nl):
+                st.error("❌ Jumlah tebakan awal harus sama dengan jumlah variabel!")
+                st.stop()
+            
+            with st.spinner("Menghitung..."):
+                if metode_nl == "Newton":
+                    results, msg = newton_system_method(F_nl, J_nl, x0_nl, tol_nl, max_iter_nl, damped_nl)
+                else:
+                    results, msg = broyden_method(F_nl, J_nl, x0_nl, tol_nl, max_iter_nl)
+            
+            if results is None:
+                st.error(msg)
+            else:
+                if msg.startswith("✅"):
+                    st.success(msg)
+                else:
+                    st.warning(msg)
+                
+                st.subheader("📋 Tabel Iterasi")
+                kolom_nl = ["Iterasi", *variabel_nl, "‖F(x)‖", "‖Δx‖", "Evaluasi Jacobian"]
+                df_nl = pd.DataFrame(results, columns=kolom_nl)
+                st.dataframe(df_nl.style.format({
+                    **{v: '{:.10f}' for v in variabel_nl},
+                    '‖F(x)‖': '{:.3e}',
+                    '‖Δx‖': '{:.3e}'
+                }), use_container_width=True)
+                
+                fig_nl = go.Figure()
+                fig_nl.add_trace(go.Scatter(x=df_nl["Iterasi"], y=df_nl["‖F(x)‖"], mode='lines+markers', name='‖F(x)‖'))
+                fig_nl.add_trace(go.Scatter(x=df_nl["Iterasi"], y=df_nl["‖Δx‖"], mode='lines+markers', name='‖Δx‖'))
+                fig_nl.update_layout(
+                    title="Konvergensi Newton/Broyden",
+                    xaxis_title='Iterasi',
+                    yaxis_type='log',
+                    height=350
+                )
+                st.plotly_chart(fig_nl, use_container_width=True)
+                
+                st.subheader("✅ Solusi")
+                cols = st.columns(min(len(variabel_nl), 6))
+                for i, v in enumerate(variabel_nl):
+                    with cols[i % len(cols)]:
+                        st.metric(v, f"{results[-1][i+1]:.8f}")
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("‖F(solusi)‖", f"{results[-1][-3]:.2e}")
+                with col2:
+                    st.metric("Evaluasi Jacobian", f"{results[-1][-1]} dari {len(results)} iterasi")
+    
+    elif mode_linear == "Batch / Monte Carlo":
+        st.markdown("""
+        <div class="concept-box">
+        <h4>🎲 Konsep: Analisis Toleransi Monte Carlo</h4>
+        
+        Komponen nyata tidak pernah tepat sesuai nilai nominalnya. Dengan mengacak koefisien
+        ribuan kali (sesuai toleransi komponen) kita bisa melihat **sebaran** solusinya.
+        
+        Semua sistem ditumpuk menjadi array berukuran (k, n, n) dan diselesaikan dalam **satu
+        panggilan** np.linalg.solve per chunk, bukan ribuan kali solve satu per satu.
+        </div>
+        """, unsafe_allow_html=True)
+        
+        sumber_batch = st.radio(
+            "Sumber Data:",
+            ["Monte Carlo dari matriks di atas", "Upload file .npy"],
+            horizontal=True
+        )
+        
+        if sumber_batch == "Monte Carlo dari matriks di atas":
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                k_batch = st.number_input("Jumlah Sistem (k):", value=10000, min_value=10, max_value=2000000, step=1000)
+            
+            with col2:
+                tol_batch = st.number_input("Toleransi Koefisien (%):", value=5.0, min_value=0.0, max_value=50.0, format="%.2f")
+            
+            with col3:
+                seed_batch = st.number_input("Seed Acak:", value=0, min_value=0, step=1)
+            
+            distribusi_batch = st.selectbox("Distribusi Toleransi:", ["Uniform", "Normal (toleransi = 3σ)"])
+        else:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                file_A = st.file_uploader("Array koefisien A (k, n, n):", type=["npy"], key="batch_A")
+            
+            with col2:
+                file_b = st.file_uploader("Array ruas kanan b (k, n):", type=["npy"], key="batch_b")
+        
+        mem_budget = st.slider("Anggaran Memori per Chunk (MB):", 8, 1024, 64, 8)
+        
+        if st.button("🚀 Selesaikan Batch", type="primary"):
+            try:
+                if sumber_batch == "Monte Carlo dari matriks di atas":
+                    rng = np.random.default_rng(int(seed_batch))
+                    k_batch = int(k_batch)
+                    rel = tol_batch / 100
+                    
+                    if distribusi_batch == "Uniform":
+                        dA = rng.uniform(-rel, rel, size=(k_batch, 3, 3))
+                        db = rng.uniform(-rel, rel, size=(k_batch, 3))
+                    else:
+                        dA = rng.normal(0, rel / 3, size=(k_batch, 3, 3))
+                        db = rng.normal(0, rel / 3, size=(k_batch, 3))
+                    
+                    A_batch = A_input * (1 + dA)
+                    b_batch = b_input * (1 + db)
+                else:
+                    if file_A is None or file_b is None:
+                        st.warning("⚠️ Upload kedua file A dan b terlebih dahulu.")
+                        st.stop()
+                    A_batch = np.load(io.BytesIO(file_A.getvalue()))
+                    b_batch = np.load(io.BytesIO(file_b.getvalue()))
+                
+                with st.spinner("Menyelesaikan batch..."):
+                    t_start = time.perf_counter()
+                    hasil_batch = batch_solve(A_batch, b_batch, mem_budget)
+                    t_total = time.perf_counter() - t_start
+                
+                k_total, n_var = A_batch.shape[:2]
+                n_singular = int(np.sum(np.isnan(hasil_batch["residual"])))
+                
+                st.markdown("---")
+                st.subheader("📊 Ringkasan Batch")
+                
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    st.metric("Jumlah Sistem", f"{k_total:,}")
+                
+                with col2:
+                    st.metric("Sistem Singular", f"{n_singular:,}")
+                
+                with col3:
+                    st.metric("Jumlah Chunk", f"{hasil_batch['n_chunks']} × {hasil_batch['chunk_size']:,}")
+                
+                with col4:
+                    st.metric("Waktu per Sistem", f"{t_total / k_total * 1e6:.2f} µs")
+                
+                if n_singular > 0:
+                    st.warning(f"⚠️ {n_singular} sistem singular dilewati (solusi = NaN).")
+                
+                # Statistik solusi
+                x_batch = hasil_batch["x"]
+                nama_var = [f"x{i+1}" for i in range(n_var)]
+                
+                stats_df = pd.DataFrame({
+                    'Variabel': nama_var,
+                    'Mean': np.nanmean(x_batch, axis=0),
+                    'Std': np.nanstd(x_batch, axis=0),
+                    'Min': np.nanmin(x_batch, axis=0),
+                    'P5': np.nanpercentile(x_batch, 5, axis=0),
+                    'P95': np.nanpercentile(x_batch, 95, axis=0),
+                    'Max': np.nanmax(x_batch, axis=0)
+                })
+                
+                st.dataframe(stats_df.style.format({
+                    'Mean': '{:.6f}',
+                    'Std': '{:.2e}',
+                    'Min': '{:.6f}',
+                    'P5': '{:.6f}',
+                    'P95': '{:.6f}',
+                    'Max': '{:.6f}'
+                }), use_container_width=True)
+                
+                # Histogram menggantikan metrik per-sistem
+                st.subheader("📈 Histogram Sebaran")
+                
+                fig_x = go.Figure()
+                for i in range(min(n_var, 6)):
+                    fig_x.add_trace(go.Histogram(x=x_batch[:, i], name=nama_var[i], opacity=0.6, nbinsx=80))
+                fig_x.update_layout(
+                    title="Sebaran Solusi",
+                    xaxis_title='Nilai',
+                    yaxis_title='Frekuensi',
+                    barmode='overlay',
+                    height=400
+                )
+                st.plotly_chart(fig_x, use_container_width=True)
+                
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    fig_det = go.Figure(go.Histogram(x=hasil_batch["det"], nbinsx=80, marker_color='teal'))
+                    fig_det.update_layout(title="Determinan", height=300)
+                    st.plotly_chart(fig_det, use_container_width=True)
+                
+                with col2:
+                    cond_finite = hasil_batch["cond"][np.isfinite(hasil_batch["cond"])]
+                    fig_cond = go.Figure(go.Histogram(x=np.log10(cond_finite), nbinsx=80, marker_color='orange'))
+                    fig_cond.update_layout(title="log₁₀ Condition Number", height=300)
+                    st.plotly_chart(fig_cond, use_container_width=True)
+                
+                with col3:
+                    res_valid = hasil_batch["residual"][~np.isnan(hasil_batch["residual"])]
+                    fig_res = go.Figure(go.Histogram(x=np.log10(res_valid + 1e-300), nbinsx=80, marker_color='purple'))
+                    fig_res.update_layout(title="log₁₀ Residual Maks |Ax - b|", height=300)
+                    st.plotly_chart(fig_res, use_container_width=True)
+                
+                max_residual = np.nanmax(hasil_batch["residual"]) if n_singular < k_total else np.nan
+                if max_residual < 1e-6:
+                    st.success(f"✅ Verifikasi berhasil untuk semua sistem! Max error: {max_residual:.2e}")
+                else:
+                    st.warning(f"⚠️ Error verifikasi maksimum: {max_residual:.2e}")
+                
+                # Unduh hasil per-sistem
+                buffer = io.BytesIO()
+                np.savez_compressed(buffer, **{k: v for k, v in hasil_batch.items() if isinstance(v, np.ndarray)})
+                st.download_button(
+                    "💾 Unduh Hasil (.npz)",
+                    data=buffer.getvalue(),
+                    file_name="hasil_batch.npz",
+                    mime="application/octet-stream"
+                )
+            
+            except ValueError as e:
+                st.error(f"❌ Error: {e}")
+            except np.linalg.LinAlgError as e:
+                st.error(f"❌ Error: Singular Matrix! {e}")
+    
+    elif mode_linear == "Out-of-Core LU (Matriks di Disk)":
+        st.markdown("""
+        <div class="concept-box">
+        <h4>💾 Konsep: Matriks yang Lebih Besar dari RAM</h4>
+        
+        Matriks boundary-element 50.000×50.000 membutuhkan 20 GB. Alih-alih memuat seluruh A,
+        matriks disimpan di disk (np.memmap) dan difaktorkan **per panel kolom**:
+        1. Baca satu panel, faktorkan dengan partial pivoting
+        2. Alirkan blok kolom lain satu per satu: tukar baris, update, tulis kembali
+        3. Hanya panel + satu blok kolom yang berada di RAM pada satu waktu
+        
+        Lebar panel ditentukan oleh anggaran memori.
+        </div>
+        """, unsafe_allow_html=True)
+        
+        sumber_ooc = st.radio(
+            "Sumber Matriks:",
+            ["Buat matriks uji di disk", "File .npy yang sudah ada"],
+            horizontal=True
+        )
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            if sumber_ooc == "Buat matriks uji di disk":
+                n_ooc = st.number_input("Ukuran Matriks (n):", value=2000, min_value=10, max_value=50000, step=500)
+                st.caption(f"Ukuran file: {n_ooc**2 * 8 / 1024**2:,.1f} MB")
+            else:
+                nama_A_ooc = st.text_input("File matriks A (.npy, n×n float64):", value="")
+            nama_b_ooc = st.text_input(
+                "File vektor b (.npy, opsional):",
+                value="",
+                help="Kosongkan untuk memakai b = A·1 sehingga solusi eksaknya x = 1"
+            )
+            st.caption(f"File dibaca dari direktori data server: {DATA_DIR}")
+        
+        with col2:
+            mem_budget_ooc = st.slider("Anggaran Memori (MB):", 1, 2048, 64)
+            hapus_ooc = st.checkbox("Hapus file kerja (matriks uji & faktor LU) setelah selesai", value=True)
+        
+        if st.button("🚀 Faktorkan & Selesaikan", type="primary"):
+            # Matriks uji dan faktor LU ditulis ke direktori sementara milik proses ini
+            dir_ooc = tempfile.mkdtemp(prefix="ooc_lu_")
+            path_LU_ooc = os.path.join(dir_ooc, "ooc_LU.npy")
+            berhasil_ooc = False
+            
+            try:
+                if sumber_ooc == "Buat matriks uji di disk":
+                    path_A_ooc = os.path.join(dir_ooc, f"ooc_A_{int(n_ooc)}.npy")
+                    with st.spinner("Menulis matriks uji ke disk..."):
+                        create_test_matrix_file(path_A_ooc, int(n_ooc), mem_budget_mb=mem_budget_ooc)
+                else:
+                    path_A_ooc = resolve_data_path(nama_A_ooc)
+                
+                if not os.path.isfile(path_A_ooc):
+                    st.error(f"❌ File tidak ditemukan: {path_A_ooc}")
+                    st.stop()
+                
+                n_file = np.load(path_A_ooc, mmap_mode='r').shape[0]
+                
+                if nama_b_ooc:
+                    b_ooc = np.load(resolve_data_path(nama_b_ooc)).astype(float)
+                    x_exact = None
+                    if b_ooc.shape != (n_file,):
+                        st.error(f"❌ Ukuran b {b_ooc.shape} tidak cocok dengan matriks A ({n_file:,} × {n_file:,})")
+                        st.stop()
+                else:
+                    x_exact = np.ones(n_file)
+                    b_ooc = ooc_matvec(path_A_ooc, x_exact, mem_budget_ooc)
+                
+                with st.spinner("Faktorisasi LU out-of-core..."):
+                    t_start = time.perf_counter()
+                    perm_ooc, nb_ooc, panel_log = ooc_lu_factor(path_A_ooc, path_LU_ooc, mem_budget_ooc)
+                    sol_ooc = ooc_lu_solve(path_LU_ooc, perm_ooc, b_ooc, nb_ooc)
+                    t_total = time.perf_counter() - t_start
+                
+                berhasil_ooc = True
+                df_panel = pd.DataFrame(panel_log, columns=["Panel", "Kolom Awal", "Lebar", "Waktu I/O (s)", "Waktu Komputasi (s)"])
+                
+                st.markdown("---")
+                st.subheader("📊 Ringkasan Faktorisasi")
+                
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    st.metric("Ukuran Matriks", f"{n_file:,} × {n_file:,}")
+                
+                with col2:
+                    st.metric("Lebar Panel (nb)", f"{nb_ooc} ({len(panel_log)} panel)")
+                
+                with col3:
+                    st.metric("Total I/O", f"{df_panel['Waktu I/O (s)'].sum():.3f} s")
+                
+                with col4:
+                    st.metric("Total Komputasi", f"{df_panel['Waktu Komputasi (s)'].sum():.3f} s")
+                
+                st.caption(f"Waktu total (termasuk substitusi): {t_total:.3f} s")
+                
+                fig_panel = go.Figure()
+                fig_panel.add_trace(go.Bar(x=df_panel["Panel"], y=df_panel["Waktu I/O (s)"], name='I/O'))
+                fig_panel.add_trace(go.Bar(x=df_panel["Panel"], y=df_panel["Waktu Komputasi (s)"], name='Komputasi'))
+                fig_panel.update_layout(
+                    title="Waktu I/O vs Komputasi per Panel",
+                    xaxis_title='Panel',
+                    yaxis_title='Waktu (s)',
+                    barmode='stack',
+                    height=400
+                )
+                st.plotly_chart(fig_panel, use_container_width=True)
+                
+                st.dataframe(df_panel.style.format({
+                    'Waktu I/O (s)': '{:.4f}',
+                    'Waktu Komputasi (s)': '{:.4f}'
+                }), use_container_width=True)
+                
+                # Verifikasi dengan membaca ulang A asli dari disk
+                st.markdown("---")
+                st.subheader("🔍 Verifikasi: A × x = b")
+                
+                result = ooc_matvec(path_A_ooc, sol_ooc, mem_budget_ooc)
+                n_show = min(n_file, 10)
+                
+                verification_df = pd.DataFrame({
+                    'Persamaan': [f'Persamaan {i+1}' for i in range(n_show)],
+                    'A×x (Hasil)': result[:n_show],
+                    'b (Target)': b_ooc[:n_show],
+                    'Error': np.abs(result - b_ooc)[:n_show]
+                })
+                
+                st.dataframe(verification_df.style.format({
+                    'A×x (Hasil)': '{:.6f}',
+                    'b (Target)': '{:.6f}',
+                    'Error': '{:.2e}'
+                }), use_container_width=True)
+                if n_file > n_show:
+                    st.caption(f"Menampilkan {n_show} dari {n_file:,} persamaan.")
+                
+                max_error = np.max(np.abs(result - b_ooc))
+                if max_error < 1e-6:
+                    st.success(f"✅ Verifikasi berhasil! Max error: {max_error:.2e}")
+                else:
+                    st.warning(f"⚠️ Error verifikasi: {max_error:.2e}")
+                
+                if x_exact is not None:
+                    st.info(f"Selisih maksimum terhadap solusi eksak x = 1: {np.max(np.abs(sol_ooc - x_exact)):.2e}")
+                
+                if not hapus_ooc:
+                    st.caption(f"File faktor LU disimpan di: {path_LU_ooc}")
+            
+            except (ValueError, OSError) as e:
+                st.error(f"❌ Error: {e}")
+            except np.linalg.LinAlgError as e:
+                st.error(f"❌ Error: Singular Matrix! {e}")
+            finally:
+                # Faktor LU dari run yang gagal tidak pernah disimpan
+                if hapus_ooc or not berhasil_ooc:
+                    shutil.rmtree(dir_ooc, ignore_errors=True)
+
+# --- HALAMAN 5: INTERPOLASI ---
+elif menu == "📈 Interpolasi":
+    st.header("📈 Interpolasi & Regresi")
+    
+    st.markdown("""
+    <div class="concept-box">
+    <h4>🎯 Perbedaan Interpolasi vs Regresi</h4>
+    
+    **Interpolasi:**
+    - "Hubungkan titik-titik dengan kurva yang MELEWATI semua titik"
+    - Digunakan ketika data akurat dan sedikit
+    - Contoh: Menghitung suhu di jam 14:30 dari data jam 14:00 dan 15:00
+    
+    **Regresi:**
+    - "Cari pola/tren UMUM dari data yang berantakan"
+    - Digunakan ketika data banyak dan ada noise/error
+    - Contoh: Memprediksi harga rumah dari data historis yang bervariasi
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    tab1, tab2 = st.tabs(["📍 Interpolasi", "📊 Regresi"])
+    
+    with tab1:
+        st.subheader("📍 Interpolasi Polinomial")
+        
+        st.markdown("""
+        **Prinsip:** Cari polinomial derajat n-1 yang melewati n titik data.
+        
+        Jika ada 4 titik data, kita cari polinomial derajat 3: P(x) = ax³ + bx² + cx + d
+        """)
+        
+        # Input data
         col1, col2 = st.columns(2)
         
         with col1:
@@ -1105,398 +5583,1727 @@ elif menu == "📈 Interpolasi":
                 st.markdown("---")
                 st.subheader("🔮 Prediksi")
                 
-                x_pred = st.number_input(
-                    "Masukkan nilai x untuk prediksi:",
-                    value=float(np.mean(x_data_reg)),
-                    format="%.4f"
-                )
+                x_pred = st.number_input(
+                    "Masukkan nilai x untuk prediksi:",
+                    value=float(np.mean(x_data_reg)),
+                    format="%.4f"
+                )
+                
+                y_pred_value = m * x_pred + c
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Input (x)", f"{x_pred:.4f}")
+                with col2:
+                    st.metric("Prediksi (y)", f"{y_pred_value:.4f}")
+        
+        except ValueError as e:
+            st.error(f"❌ Error parsing data: {e}")
+            st.info("Pastikan data berupa angka yang dipisahkan koma.")
+
+# --- HALAMAN 6: INTEGRAL & PDB ---
+elif menu == "⚙️ Integral & PDB":
+    st.header("⚙️ Integral & Persamaan Diferensial")
+    
+    tab1, tab_data, tab_nd, tab2, tab_ode = st.tabs([
+        "📐 Integral Numerik",
+        "📈 Integral Data Tabulasi",
+        "🧊 Integral Multi-Dimensi",
+        "🔌 Simulasi Rangkaian RC",
+        "🧮 Solver PDB Umum"
+    ])
+    
+    with tab1:
+        st.subheader("📐 Integral Numerik")
+        
+        st.markdown("""
+        <div class="concept-box">
+        <h4>🎯 Konsep Feynman: "Jumlahan Kecil-Kecil"</h4>
+        
+        Bayangkan kita ingin tahu luas area di bawah kurva:
+        
+        1. Potong area menjadi banyak trapesium kecil
+        2. Hitung luas masing-masing trapesium: (tinggi_kiri + tinggi_kanan) / 2 × lebar
+        3. Jumlahkan semua luas trapesium
+        4. Semakin banyak trapesium → hasil semakin akurat
+        
+        **Rumus Trapesium:**
+        ∫ f(x)dx ≈ (Δx/2) × [f(x₀) + 2f(x₁) + 2f(x₂) + ... + 2f(xₙ₋₁) + f(xₙ)]
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Input fungsi
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            func_input_int = st.text_input(
+                "Masukkan fungsi f(x):",
+                value="sin(x) + 1",
+                key="func_integral",
+                help="Contoh: sin(x), x**2, exp(-x**2)"
+            )
+        
+        with col2:
+            st.markdown("**Contoh:**")
+            st.code("sin(x)")
+            st.code("x**2")
+            st.code("exp(-x)")
+        
+        f_int = parse_expression(func_input_int)
+        
+        if f_int is None:
+            st.warning("⚠️ Mohon perbaiki rumus fungsi.")
+            st.stop()
+        
+        metode_int = st.selectbox(
+            "Pilih Metode:",
+            [
+                "Trapesium (Komposit)",
+                "Simpson 1/3 (Komposit)",
+                "Romberg",
+                "Gauss-Legendre",
+                "Simpson Adaptif",
+                "Clenshaw-Curtis (Surrogate Chebyshev)",
+                "Studi Konvergensi (Grid Bersarang)"
+            ],
+            key="metode_integral"
+        )
+        
+        # Parameter integral
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            a_int = st.number_input("Batas Bawah (a):", value=0.0, format="%.4f")
+        
+        with col2:
+            b_int = st.number_input("Batas Atas (b):", value=np.pi, format="%.4f")
+        
+        with col3:
+            if metode_int == "Trapesium (Komposit)":
+                n_int = st.slider("Jumlah Segmen (n):", 4, 100, 10)
+            elif metode_int == "Simpson 1/3 (Komposit)":
+                n_int = st.slider("Jumlah Segmen (n, genap):", 4, 1000, 20, 2)
+            elif metode_int == "Gauss-Legendre":
+                n_gl = st.slider("Orde (jumlah titik):", 2, 200, 10)
+            elif metode_int == "Studi Konvergensi (Grid Bersarang)":
+                n_int = st.slider("Jumlah Segmen Awal (n):", 1, 100, 4)
+                levels_int = st.slider("Jumlah Level (n, 2n, 4n, ...):", 2, 22, 12)
+            else:
+                tol_int = st.number_input("Toleransi:", value=1e-10, format="%.2e", min_value=1e-14, key="tol_int")
+        
+        if st.button("🚀 Hitung Integral", type="primary"):
+            try:
+                if metode_int == "Trapesium (Komposit)":
+                    # Generate points
+                    x_points = np.linspace(a_int, b_int, n_int + 1)
+                    y_points = f_int(x_points)
+                    
+                    # Pastikan y_points adalah array
+                    if not isinstance(y_points, np.ndarray):
+                        y_points = np.array(y_points)
+                    
+                    # Trapezoidal rule
+                    dx = (b_int - a_int) / n_int
+                    integral_result = float(trapezoid_rule(f_int, a_int, b_int, n_int))
+                    
+                    # Plot
+                    fig = go.Figure()
+                    
+                    # Function curve
+                    x_smooth = np.linspace(a_int, b_int, 300)
+                    y_smooth = f_int(x_smooth)
+                    
+                    # Pastikan y_smooth adalah array
+                    if not isinstance(y_smooth, np.ndarray):
+                        y_smooth = np.array(y_smooth)
+                    
+                    fig.add_trace(go.Scatter(
+                        x=x_smooth, y=y_smooth,
+                        mode='lines',
+                        name='f(x)',
+                        line=dict(color='blue', width=3)
+                    ))
+                    
+                    # Trapezoids
+                    for i in range(n_int):
+                        fig.add_trace(go.Scatter(
+                            x=[x_points[i], x_points[i], x_points[i+1], x_points[i+1], x_points[i]],
+                            y=[0, float(y_points[i]), float(y_points[i+1]), 0, 0],
+                            fill='toself',
+                            fillcolor='rgba(0, 100, 200, 0.2)',
+                            line=dict(color='rgba(0, 100, 200, 0.5)', width=1),
+                            showlegend=False,
+                            hoverinfo='skip'
+                        ))
+                    
+                    fig.update_layout(
+                        title=f"Metode Trapesium dengan {n_int} Segmen",
+                        xaxis_title='x',
+                        yaxis_title='f(x)',
+                        hovermode='x unified',
+                        height=500
+                    )
+                    
+                    st.plotly_chart(fig, use_container_width=True)
+                    
+                    # Hasil
+                    st.markdown("---")
+                    st.subheader("📊 Hasil Perhitungan")
+                    
+                    col1, col2, col3 = st.columns(3)
+                    
+                    with col1:
+                        st.metric("Nilai Integral", f"{integral_result:.6f}")
+                    
+                    with col2:
+                        st.metric("Jumlah Segmen", n_int)
+                    
+                    with col3:
+                        st.metric("Lebar Segmen (Δx)", f"{dx:.6f}")
+                    
+                    # Info tambahan
+                    st.info("""
+                    💡 **Tips:**
+                    - Semakin banyak segmen → hasil semakin akurat
+                    - Metode Trapesium memiliki error O(h²)
+                    - Untuk fungsi yang sangat non-linear, gunakan lebih banyak segmen
+                    """)
+                elif metode_int == "Studi Konvergensi (Grid Bersarang)":
+                    result_ref, _, _, _ = integral_reference(func_input_int, a_int, b_int)
+                    
+                    t_start = time.perf_counter()
+                    df_study, slope = convergence_study(f_int, a_int, b_int, n_int, levels_int, result_ref)
+                    t_study = time.perf_counter() - t_start
+                    
+                    integral_result = df_study["Richardson"].iloc[-1]
+                    n_finest = int(df_study["n"].iloc[-1])
+                    
+                    # Plot log-log error vs n
+                    fig = go.Figure()
+                    
+                    fig.add_trace(go.Scatter(
+                        x=df_study["n"], y=df_study["Error"],
+                        mode='lines+markers',
+                        name=f'Trapesium (slope {slope:.2f})',
+                        line=dict(color='blue', width=2)
+                    ))
+                    
+                    fig.add_trace(go.Scatter(
+                        x=df_study["n"], y=df_study["Error Richardson"],
+                        mode='lines+markers',
+                        name='Richardson (4T₂ₙ - Tₙ)/3',
+                        line=dict(color='green', width=2)
+                    ))
+                    
+                    # Garis acuan O(h²) melalui titik pertama
+                    fig.add_trace(go.Scatter(
+                        x=df_study["n"], y=df_study["Error"].iloc[0] * (df_study["n"].iloc[0] / df_study["n"]) ** 2,
+                        mode='lines',
+                        name='Acuan O(h²)',
+                        line=dict(color='gray', dash='dot')
+                    ))
+                    
+                    fig.update_layout(
+                        title="Studi Konvergensi: Error vs n",
+                        xaxis_title='Jumlah Segmen (n)',
+                        yaxis_title='|Error|',
+                        xaxis_type='log',
+                        yaxis_type='log',
+                        height=500
+                    )
+                    
+                    st.plotly_chart(fig, use_container_width=True)
+                    
+                    st.subheader("📋 Tabel Konvergensi")
+                    st.dataframe(df_study.style.format({
+                        'h': '{:.3e}',
+                        'T(n)': '{:.12f}',
+                        'Richardson': '{:.12f}',
+                        'Error': '{:.3e}',
+                        'Error Richardson': '{:.3e}',
+                        'Orde Teramati': '{:.3f}'
+                    }, na_rep='-'), use_container_width=True)
+                    
+                    st.markdown("---")
+                    st.subheader("📊 Hasil Perhitungan")
+                    
+                    col1, col2, col3, col4 = st.columns(4)
+                    
+                    with col1:
+                        st.metric("Slope Log-Log", f"{slope:.3f}")
+                    
+                    with col2:
+                        st.metric("Evaluasi f(x) Total", f"{int(df_study['Evaluasi Kumulatif'].iloc[-1]):,}")
+                    
+                    with col3:
+                        st.metric(f"Evaluasi Run Tunggal n = {n_finest:,}", f"{n_finest + 1:,}")
+                    
+                    with col4:
+                        st.metric("Waktu", f"{t_study*1000:.2f} ms")
+                    
+                    st.info("""
+                    💡 **Interpretasi:**
+                    - Slope ≈ -2 berarti error trapesium turun 4× setiap n digandakan: O(h²)
+                    - Richardson menghapus suku h² sehingga error turun jauh lebih cepat: O(h⁴)
+                    - Slope yang lebih landai menandakan f tidak mulus (misal √x di x = 0)
+                    """)
+                
+                else:
+                    t_start = time.perf_counter()
+                    
+                    if metode_int == "Simpson 1/3 (Komposit)":
+                        integral_result, err_est, n_evals = simpson_rule(f_int, a_int, b_int, n_int)
+                        nodes = np.linspace(a_int, b_int, n_evals)
+                    elif metode_int == "Romberg":
+                        integral_result, err_est, n_evals, tabel_romberg = romberg_method(f_int, a_int, b_int, tol_int)
+                        nodes = np.linspace(a_int, b_int, n_evals)
+                    elif metode_int == "Gauss-Legendre":
+                        integral_result, err_est, n_evals, nodes = gauss_legendre_rule(f_int, a_int, b_int, n_gl)
+                    elif metode_int == "Clenshaw-Curtis (Surrogate Chebyshev)":
+                        surrogate_int = cached_surrogate(func_input_int, a_int, b_int, tol_int)
+                        integral_result, err_est = surrogate_integral(surrogate_int)
+                        n_evals = surrogate_int["n_evals"]
+                        nodes = (b_int - a_int) / 2 * np.cos(np.pi * np.arange(n_evals) / (n_evals - 1)) + (a_int + b_int) / 2
+                        if not surrogate_int["converged"]:
+                            st.warning("⚠️ Koefisien Chebyshev belum meluruh sampai toleransi (f tidak mulus?); estimasi error kasar")
+                    else:
+                        integral_result, err_est, n_evals, intervals, konvergen = adaptive_simpson(f_int, a_int, b_int, tol_int)
+                        nodes = np.unique(intervals)
+                        if not konvergen:
+                            st.warning("⚠️ Kedalaman maksimum tercapai; toleransi mungkin tidak terpenuhi (singularitas?)")
+                    
+                    t_quad = time.perf_counter() - t_start
+                    
+                    # Plot fungsi dan titik evaluasi
+                    fig = go.Figure()
+                    
+                    x_smooth = np.linspace(a_int, b_int, 300)
+                    if metode_int == "Clenshaw-Curtis (Surrogate Chebyshev)":
+                        y_smooth = surrogate_eval(surrogate_int, x_smooth)
+                    else:
+                        y_smooth = evaluate_array(f_int, x_smooth)
+                    
+                    fig.add_trace(go.Scatter(
+                        x=x_smooth, y=y_smooth,
+                        mode='lines',
+                        name='f(x)',
+                        line=dict(color='blue', width=3),
+                        fill='tozeroy',
+                        fillcolor='rgba(0, 100, 200, 0.15)'
+                    ))
+                    
+                    fig.add_trace(go.Scatter(
+                        x=nodes, y=evaluate_array(f_int, nodes),
+                        mode='markers',
+                        name='Titik Node' if metode_int != "Simpson Adaptif" else 'Batas Subinterval',
+                        marker=dict(size=5, color='red')
+                    ))
+                    
+                    fig.update_layout(
+                        title=f"{metode_int}: {n_evals} evaluasi f(x)",
+                        xaxis_title='x',
+                        yaxis_title='f(x)',
+                        hovermode='x unified',
+                        height=500
+                    )
+                    
+                    st.plotly_chart(fig, use_container_width=True)
+                    
+                    if metode_int == "Simpson Adaptif":
+                        lebar = intervals[:, 1] - intervals[:, 0]
+                        fig_w = go.Figure(go.Bar(x=(intervals[:, 0] + intervals[:, 1]) / 2, y=lebar, width=lebar))
+                        fig_w.update_layout(
+                            title=f"Lebar {len(intervals)} Subinterval Akhir (kecil = daerah sulit)",
+                            xaxis_title='x',
+                            yaxis_title='Lebar',
+                            yaxis_type='log',
+                            height=300
+                        )
+                        st.plotly_chart(fig_w, use_container_width=True)
+                    
+                    if metode_int == "Romberg":
+                        st.subheader("📋 Tabel Romberg (Richardson)")
+                        n_level = len(tabel_romberg)
+                        df_romberg = pd.DataFrame(
+                            [row + [np.nan] * (n_level - len(row)) for row in tabel_romberg],
+                            columns=[f"R(i,{j})" for j in range(n_level)]
+                        )
+                        df_romberg.insert(0, "Segmen", [2**i for i in range(n_level)])
+                        st.dataframe(df_romberg.style.format('{:.12f}', na_rep='', subset=df_romberg.columns[1:]), use_container_width=True)
+                    
+                    # Hasil
+                    st.markdown("---")
+                    st.subheader("📊 Hasil Perhitungan")
+                    
+                    col1, col2, col3, col4 = st.columns(4)
+                    
+                    with col1:
+                        st.metric("Nilai Integral", f"{integral_result:.12f}")
+                    
+                    with col2:
+                        st.metric("Estimasi Error", f"{err_est:.2e}")
+                    
+                    with col3:
+                        st.metric("Evaluasi f(x)", f"{n_evals:,}")
+                    
+                    with col4:
+                        st.metric("Waktu", f"{t_quad*1000:.2f} ms")
+                    
+                    # Perkiraan biaya trapesium seragam untuk error yang sama (error ∝ 1/n²)
+                    x_100 = np.linspace(a_int, b_int, 201)
+                    y_100 = evaluate_array(f_int, x_100)
+                    T_100 = np.trapezoid(y_100[::2], x_100[::2])
+                    T_200 = np.trapezoid(y_100, x_100)
+                    err_100 = abs(T_200 - T_100) * 4 / 3
+                    if err_est > 0 and err_100 > 0:
+                        n_trap = int(100 * np.sqrt(err_100 / err_est))
+                        st.info(f"💡 Trapesium seragam butuh ≈ {n_trap:,} evaluasi untuk error {err_est:.1e} (vs {n_evals:,} di sini).")
                 
-                y_pred_value = m * x_pred + c
+                # Perbandingan dengan metode lain (jika memungkinkan)
+                try:
+                    t_start = time.perf_counter()
+                    result_ref, error_ref, n_evals_ref, konvergen_ref = integral_reference(func_input_int, a_int, b_int)
+                    t_ref = time.perf_counter() - t_start
+                    
+                    st.markdown("---")
+                    st.subheader("🔬 Verifikasi dengan Referensi Gauss-Kronrod")
+                    
+                    col1, col2, col3 = st.columns(3)
+                    
+                    with col1:
+                        st.metric(f"Hasil {metode_int}", f"{integral_result:.8f}")
+                    
+                    with col2:
+                        st.metric("Hasil Referensi", f"{result_ref:.8f}")
+                    
+                    with col3:
+                        error_diff = abs(integral_result - result_ref)
+                        st.metric("Selisih", f"{error_diff:.2e}")
+                    
+                    if error_diff < 0.001:
+                        st.success("✅ Hasil sangat akurat!")
+                    elif error_diff < 0.01:
+                        st.info("✓ Hasil cukup akurat")
+                    else:
+                        st.warning("⚠️ Pertimbangkan menambah jumlah segmen (atau memperketat toleransi) untuk akurasi lebih baik")
+                    
+                    st.caption(
+                        f"Referensi: Gauss-Kronrod 7-15 adaptif, {n_evals_ref:,} evaluasi tervektorisasi, "
+                        f"estimasi error {error_ref:.1e}, {t_ref*1000:.2f} ms (di-cache per fungsi dan batas)"
+                    )
+                    if not konvergen_ref:
+                        st.warning("⚠️ Referensi Gauss-Kronrod belum konvergen (anggaran evaluasi habis); selisih di atas hanya indikatif")
+                    
+                    expr_ref_int = parse_sympy_expression(func_input_int)
+                    if expr_ref_int is not None:
+                        ref_int, dari_cache = precise_integral(expr_ref_int, a_int, b_int)
+                        show_true_error(integral_result, ref_int, dari_cache, "Integral Referensi (mpmath)")
                 
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric("Input (x)", f"{x_pred:.4f}")
-                with col2:
-                    st.metric("Prediksi (y)", f"{y_pred_value:.4f}")
-        
-        except ValueError as e:
-            st.error(f"❌ Error parsing data: {e}")
-            st.info("Pastikan data berupa angka yang dipisahkan koma.")
-
-# --- HALAMAN 6: INTEGRAL & PDB ---
-elif menu == "⚙️ Integral & PDB":
-    st.header("⚙️ Integral & Persamaan Diferensial")
-    
-    tab1, tab2 = st.tabs(["📐 Integral Numerik", "🔌 Simulasi Rangkaian RC"])
+                except Exception as e:
+                    st.warning(f"Tidak dapat melakukan verifikasi dengan referensi: {e}")
+            
+            except Exception as e:
+                st.error(f"❌ Error: {e}")
     
-    with tab1:
-        st.subheader("📐 Integral Numerik")
+    with tab_data:
+        st.subheader("📈 Integral Data Tabulasi")
         
         st.markdown("""
         <div class="concept-box">
-        <h4>🎯 Konsep Feynman: "Jumlahan Kecil-Kecil"</h4>
+        <h4>🎯 Konsep: Integral dari Data Pengukuran</h4>
         
-        Bayangkan kita ingin tahu luas area di bawah kurva:
+        Data osiloskop tidak datang sebagai rumus, tetapi sebagai pasangan (t, v) dengan
+        timestamp yang **tidak seragam**. Setiap metode harus memakai lebar interval masing-masing:
         
-        1. Potong area menjadi banyak trapesium kecil
-        2. Hitung luas masing-masing trapesium: (tinggi_kiri + tinggi_kanan) / 2 × lebar
-        3. Jumlahkan semua luas trapesium
-        4. Semakin banyak trapesium → hasil semakin akurat
+        - **Trapesium**: ½·(xᵢ₊₁ − xᵢ)·(yᵢ + yᵢ₊₁) per interval
+        - **Simpson non-seragam**: parabola melalui tiap 3 titik berurutan dengan h₀ ≠ h₁
+        - **Spline kubik**: integral eksak dari spline yang melalui semua titik
         
-        **Rumus Trapesium:**
-        ∫ f(x)dx ≈ (Δx/2) × [f(x₀) + 2f(x₁) + 2f(x₂) + ... + 2f(xₙ₋₁) + f(xₙ)]
+        File besar di-*memory-map* dan diproses per chunk, sehingga capture berukuran GB
+        bisa diintegralkan tanpa dimuat seluruhnya ke RAM.
         </div>
         """, unsafe_allow_html=True)
         
-        # Input fungsi
-        col1, col2 = st.columns([3, 1])
+        sumber_data = st.radio(
+            "Sumber Data:",
+            ["Data contoh (osiloskop sintetis)", "Upload file (.npy / .csv)", "File di direktori data server"],
+            horizontal=True,
+            key="sumber_data_int"
+        )
+        
+        col1, col2 = st.columns(2)
         
         with col1:
-            func_input_int = st.text_input(
-                "Masukkan fungsi f(x):",
-                value="sin(x) + 1",
-                key="func_integral",
-                help="Contoh: sin(x), x**2, exp(-x**2)"
-            )
+            if sumber_data == "Data contoh (osiloskop sintetis)":
+                n_data = st.select_slider(
+                    "Jumlah Titik:",
+                    options=[10**k for k in range(3, 9)],
+                    value=10**6,
+                    format_func=lambda v: f"{v:,}"
+                )
+                st.caption(f"Ukuran file: {n_data * 16 / 1024**2:,.1f} MB")
+            elif sumber_data == "Upload file (.npy / .csv)":
+                file_data = st.file_uploader(
+                    "File data (kolom x, y):",
+                    type=["npy", "csv", "txt"],
+                    key="file_data_int"
+                )
+            else:
+                nama_data = st.text_input(
+                    "File data (.npy berbentuk N×2, atau CSV dua kolom):",
+                    value="",
+                    key="path_data_int"
+                )
+                st.caption(f"File dibaca dari direktori data server: {DATA_DIR}")
         
         with col2:
-            st.markdown("**Contoh:**")
-            st.code("sin(x)")
-            st.code("x**2")
-            st.code("exp(-x)")
+            metode_data = st.selectbox(
+                "Pilih Metode:",
+                ["Trapesium", "Simpson (Non-Seragam)", "Spline Kubik"],
+                key="metode_data_int"
+            )
+            chunk_data = st.select_slider(
+                "Ukuran Chunk (titik):",
+                options=[10**k for k in range(3, 8)],
+                value=10**6,
+                format_func=lambda v: f"{v:,}",
+                key="chunk_data_int"
+            )
         
-        f_int = parse_expression(func_input_int)
+        if st.button("🚀 Integralkan Data", type="primary", key="btn_data_int"):
+            if sumber_data == "Upload file (.npy / .csv)" and file_data is None:
+                st.warning("⚠️ Mohon upload file data terlebih dahulu.")
+            else:
+                # Data contoh dan file upload ditulis ke direktori sementara milik run ini
+                dir_data = tempfile.mkdtemp(prefix="data_int_")
+                
+                try:
+                    exact_data = None
+                    
+                    if sumber_data == "Data contoh (osiloskop sintetis)":
+                        path_data = os.path.join(dir_data, f"capture_{int(n_data)}.npy")
+                        with st.spinner("Menulis data contoh ke disk..."):
+                            exact_data = create_sample_capture(path_data, int(n_data))
+                    elif sumber_data == "Upload file (.npy / .csv)":
+                        path_data = os.path.join(dir_data, os.path.basename(file_data.name))
+                        with open(path_data, "wb") as fh:
+                            fh.write(file_data.getbuffer())
+                    else:
+                        path_data = resolve_data_path(nama_data)
+                    
+                    if not os.path.isfile(path_data):
+                        raise ValueError(f"File tidak ditemukan: {path_data}")
+                    
+                    with st.spinner("Membuka data..."):
+                        x_data, y_data = open_tabulated_file(path_data, dir_data, int(chunk_data))
+                    
+                    method_key = {
+                        "Trapesium": "trapezoid",
+                        "Simpson (Non-Seragam)": "simpson",
+                        "Spline Kubik": "spline"
+                    }[metode_data]
+                    
+                    with st.spinner("Mengintegralkan per chunk..."):
+                        t_start = time.perf_counter()
+                        hasil_data, n_chunks_data, cum_x, cum_y = integrate_tabulated(
+                            x_data, y_data, method_key, int(chunk_data)
+                        )
+                        t_data = time.perf_counter() - t_start
+                    
+                    st.success("✅ Integral berhasil dihitung!")
+                    
+                    col1, col2, col3, col4 = st.columns(4)
+                    
+                    with col1:
+                        st.metric("Hasil Integral", f"{hasil_data:.10g}")
+                    
+                    with col2:
+                        st.metric("Jumlah Titik", f"{len(x_data):,}")
+                    
+                    with col3:
+                        st.metric("Jumlah Chunk", f"{n_chunks_data:,}")
+                    
+                    with col4:
+                        st.metric("Throughput", f"{len(x_data) / t_data / 1e6:,.1f} juta titik/s")
+                    
+                    if exact_data is not None:
+                        st.info(
+                            f"📏 Integral eksak data contoh: {exact_data:.10g} — "
+                            f"error {metode_data}: {abs(hasil_data - exact_data):.2e}"
+                        )
+                    
+                    # Plot data (di-decimate) dan integral kumulatif
+                    stride_plot = max(1, len(x_data) // 2000)
+                    
+                    fig = go.Figure()
+                    fig.add_trace(go.Scatter(
+                        x=np.asarray(x_data[::stride_plot]), y=np.asarray(y_data[::stride_plot]),
+                        mode='lines', name='Data y(x)', line=dict(color='blue', width=1)
+                    ))
+                    fig.add_trace(go.Scatter(
+                        x=cum_x, y=cum_y,
+                        mode='lines', name='Integral Kumulatif (Trapesium)',
+                        line=dict(color='red', width=2), yaxis='y2'
+                    ))
+                    fig.update_layout(
+                        title="Data dan Integral Kumulatif",
+                        xaxis_title="x",
+                        yaxis=dict(title="y"),
+                        yaxis2=dict(title="∫ y dx", overlaying='y', side='right'),
+                        hovermode='x unified',
+                        template='plotly_white'
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                    
+                    if stride_plot > 1:
+                        st.caption(f"Plot menampilkan setiap {stride_plot:,} titik; integral dihitung dari semua titik.")
+            
+                except Exception as e:
+                    st.error(f"❌ Error: {e}")
+                finally:
+                    # Lepaskan memmap sebelum direktori kerja dihapus
+                    x_data = y_data = None
+                    shutil.rmtree(dir_data, ignore_errors=True)
+    
+    with tab_nd:
+        st.subheader("🧊 Integral Multi-Dimensi")
         
-        if f_int is None:
+        st.markdown("""
+        <div class="concept-box">
+        <h4>🎯 Konsep: Dari Garis ke Kotak</h4>
+        
+        Integral 2D/3D pada kotak [a₁,b₁]×[a₂,b₂](×[a₃,b₃]) bisa didekati dengan dua cara:
+        
+        1. **Gauss tensor-product**: titik Gauss-Legendre di setiap sumbu, lalu semua kombinasinya (n² atau n³ titik).
+           Sangat akurat untuk fungsi mulus, tapi jumlah titik tumbuh eksponensial terhadap dimensi.
+        2. **(Quasi-)Monte Carlo**: rata-rata f di banyak titik sampel × volume kotak.
+           Titik Sobol/Halton tersebar lebih merata daripada titik acak, sehingga galat turun lebih cepat dari 1/√N.
+        
+        Sampel diproses per chunk dengan mean dan varians berjalan, jadi memori tetap konstan
+        berapa pun jumlah sampelnya.
+        </div>
+        """, unsafe_allow_html=True)
+        
+        dim_nd = st.radio("Dimensi:", [2, 3], horizontal=True, key="dim_nd")
+        variabel_nd = ("x", "y", "z")[:dim_nd]
+        
+        func_input_nd = st.text_input(
+            f"Masukkan fungsi f({', '.join(variabel_nd)}):",
+            value="exp(-(x**2 + y**2))" if dim_nd == 2 else "exp(-(x**2 + y**2 + z**2))",
+            key=f"func_nd_{dim_nd}",
+            help="Gunakan x, y" + (", z" if dim_nd == 3 else "") + " sebagai variabel"
+        )
+        
+        f_nd = parse_expression(func_input_nd, variabel_nd)
+        
+        if f_nd is None:
             st.warning("⚠️ Mohon perbaiki rumus fungsi.")
-            st.stop()
+        else:
+            cols_nd = st.columns(dim_nd)
+            bounds_nd = []
+            for k, var in enumerate(variabel_nd):
+                with cols_nd[k]:
+                    lo = st.number_input(f"Batas bawah {var}:", value=0.0, format="%.4f", key=f"lo_nd_{var}")
+                    hi = st.number_input(f"Batas atas {var}:", value=1.0, format="%.4f", key=f"hi_nd_{var}")
+                    bounds_nd.append((lo, hi))
+            
+            metode_nd = st.selectbox(
+                "Pilih Metode:",
+                [
+                    "Gauss Tensor-Product",
+                    "Quasi-Monte Carlo (Sobol)",
+                    "Quasi-Monte Carlo (Halton)",
+                    "Monte Carlo (Pseudo-Acak)"
+                ],
+                key="metode_nd"
+            )
+            
+            col1, col2 = st.columns(2)
+            if metode_nd == "Gauss Tensor-Product":
+                with col1:
+                    n_nd = st.slider("Orde Gauss per Dimensi (n):", 2, 100 if dim_nd == 2 else 60, 20)
+                with col2:
+                    st.metric("Total Titik Evaluasi", f"{n_nd**dim_nd:,}")
+            else:
+                with col1:
+                    n_samples_nd = st.select_slider(
+                        "Jumlah Sampel:",
+                        options=[10**k for k in range(4, 9)],
+                        value=10**6,
+                        format_func=lambda v: f"{v:,}"
+                    )
+                with col2:
+                    chunk_nd = st.select_slider(
+                        "Ukuran Chunk:",
+                        options=[2**k for k in range(12, 23, 2)],
+                        value=2**16,
+                        format_func=lambda v: f"{v:,}",
+                        help="Sampel diproses per chunk; memori hanya sebesar satu chunk"
+                    )
+            
+            if st.button("🚀 Hitung Integral", type="primary", key="btn_nd"):
+                try:
+                    if any(hi <= lo for lo, hi in bounds_nd):
+                        st.error("❌ Error: Batas atas harus lebih besar dari batas bawah di setiap dimensi")
+                    elif metode_nd == "Gauss Tensor-Product":
+                        t0 = time.perf_counter()
+                        hasil_nd, err_nd, evals_nd = tensor_gauss_integral(f_nd, bounds_nd, n_nd)
+                        t_nd = time.perf_counter() - t0
+                        
+                        st.success("✅ Integral berhasil dihitung!")
+                        
+                        col1, col2, col3, col4 = st.columns(4)
+                        with col1:
+                            st.metric("Hasil Integral", f"{hasil_nd:.10f}")
+                        with col2:
+                            st.metric("Estimasi Error", f"{err_nd:.2e}")
+                        with col3:
+                            st.metric("Evaluasi Fungsi", f"{evals_nd:,}")
+                        with col4:
+                            st.metric("Waktu", f"{t_nd*1000:.1f} ms")
+                        
+                        st.caption(f"Estimasi error = |Q(n={n_nd + 1}) − Q(n={n_nd})|")
+                    else:
+                        sampler_nd = {
+                            "Quasi-Monte Carlo (Sobol)": "sobol",
+                            "Quasi-Monte Carlo (Halton)": "halton",
+                            "Monte Carlo (Pseudo-Acak)": "random"
+                        }[metode_nd]
+                        
+                        progress_nd = st.progress(0.0)
+                        live_nd = st.empty()
+                        riwayat_nd = []
+                        t0 = time.perf_counter()
+                        
+                        for n_done, est, se in iter_monte_carlo_integral(
+                                f_nd, bounds_nd, n_samples_nd, chunk_nd, sampler_nd):
+                            riwayat_nd.append((n_done, est, se))
+                            progress_nd.progress(min(n_done / n_samples_nd, 1.0))
+                            live_nd.markdown(
+                                f"**N = {n_done:,}** &nbsp; | &nbsp; estimasi = `{est:.10f}` "
+                                f"&nbsp; | &nbsp; standard error = `{se:.2e}`"
+                            )
+                        
+                        t_nd = time.perf_counter() - t0
+                        n_done, est, se = riwayat_nd[-1]
+                        
+                        st.success("✅ Integral berhasil dihitung!")
+                        
+                        col1, col2, col3, col4 = st.columns(4)
+                        with col1:
+                            st.metric("Hasil Integral", f"{est:.10f}")
+                        with col2:
+                            st.metric("Standard Error", f"{se:.2e}")
+                        with col3:
+                            st.metric("Jumlah Sampel", f"{n_done:,}")
+                        with col4:
+                            st.metric("Sampel/detik", f"{n_done / t_nd:,.0f}")
+                        
+                        if sampler_nd != "random":
+                            st.caption(
+                                "Standard error QMC dihitung dari 8 scrambling independen: simpangan baku "
+                                "estimasi antar replikasi / √8 (rumus iid σ/√N tidak berlaku untuk QMC)."
+                            )
+                        
+                        # Plot konvergensi estimasi dengan pita ±2 SE
+                        df_nd = pd.DataFrame(riwayat_nd, columns=["N", "Estimasi", "SE"])
+                        
+                        fig = go.Figure()
+                        fig.add_trace(go.Scatter(
+                            x=df_nd["N"], y=df_nd["Estimasi"] + 2 * df_nd["SE"],
+                            mode='lines', line=dict(width=0), showlegend=False, hoverinfo='skip'
+                        ))
+                        fig.add_trace(go.Scatter(
+                            x=df_nd["N"], y=df_nd["Estimasi"] - 2 * df_nd["SE"],
+                            mode='lines', line=dict(width=0), fill='tonexty',
+                            fillcolor='rgba(99, 110, 250, 0.2)', name='±2 SE'
+                        ))
+                        fig.add_trace(go.Scatter(
+                            x=df_nd["N"], y=df_nd["Estimasi"],
+                            mode='lines+markers', name='Estimasi', line=dict(color='blue', width=2)
+                        ))
+                        fig.update_layout(
+                            title="Konvergensi Estimasi terhadap Jumlah Sampel",
+                            xaxis_title="Jumlah Sampel (N)",
+                            yaxis_title="Estimasi Integral",
+                            xaxis_type="log",
+                            template='plotly_white'
+                        )
+                        st.plotly_chart(fig, use_container_width=True)
+                
+                except Exception as e:
+                    st.error(f"❌ Error: {e}")
+    
+    with tab2:
+        st.subheader("🔌 Simulasi Rangkaian RC (PDB)")
         
-        # Parameter integral
-        col1, col2, col3 = st.columns(3)
+        st.markdown("""
+        <div class="concept-box">
+        <h4>⚡ Studi Kasus: Charging Capacitor</h4>
         
-        with col1:
-            a_int = st.number_input("Batas Bawah (a):", value=0.0, format="%.4f")
+        **Rangkaian RC** terdiri dari resistor (R) dan kapasitor (C) yang dihubungkan seri.
         
-        with col2:
-            b_int = st.number_input("Batas Atas (b):", value=np.pi, format="%.4f")
+        **Persamaan Diferensial:**
+        dVc/dt = (Vin - Vc) / (R×C)
         
-        with col3:
-            n_int = st.slider("Jumlah Segmen (n):", 4, 100, 10)
+        **Dimana:**
+        - Vc = Tegangan kapasitor (V)
+        - Vin = Tegangan input (V)
+        - R = Resistansi (Ω)
+        - C = Kapasitansi (F)
+        - τ = R×C = Time constant (detik)
+        
+        **Interpretasi:**
+        - τ = waktu yang dibutuhkan kapasitor untuk charge ~63% dari nilai akhir
+        - Setelah 5τ, kapasitor sudah ~99% terisi penuh
+        </div>
+        """, unsafe_allow_html=True)
+        
+        mode_rc = st.radio(
+            "Mode Simulasi:",
+            [
+                "Simulasi Tunggal",
+                "Analisis Frekuensi (Bode)",
+                "Sweep Parameter (R × C × h)",
+                "Sumber Gelombang (Streaming)"
+            ],
+            horizontal=True,
+            key="mode_rc"
+        )
+        
+        if mode_rc in ("Simulasi Tunggal", "Analisis Frekuensi (Bode)"):
+            st.markdown("---")
+            st.subheader("⚙️ Parameter Rangkaian")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                R = st.slider("Resistansi R (kΩ):", 1.0, 50.0, 10.0, 0.5) * 1000  # Convert to Ω
+            
+            with col2:
+                C = st.slider("Kapasitansi C (µF):", 10.0, 1000.0, 100.0, 10.0) * 1e-6  # Convert to F
+            
+            with col3:
+                Vin = st.number_input("Tegangan Input Vin (V):", value=5.0, min_value=0.1, format="%.2f")
+            
+            # Hitung time constant
+            tau = R * C
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.metric("Time Constant (τ)", f"{tau:.4f} s")
+            
+            with col2:
+                st.metric("Waktu untuk 99% charge (≈5τ)", f"{5*tau:.4f} s")
+        
+        if mode_rc == "Simulasi Tunggal":
+            # Parameter simulasi
+            st.markdown("---")
+            st.subheader("🎮 Parameter Simulasi")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                t_max_factor = st.slider("Durasi simulasi (dalam satuan τ):", 1.0, 10.0, 5.0, 0.5)
+                t_max = t_max_factor * tau
+            
+            with col2:
+                h = st.select_slider(
+                    "Time step (h):",
+                    options=[0.001, 0.005, 0.01, 0.05, 0.1],
+                    value=0.01
+                )
+            
+            if st.button("🚀 Jalankan Simulasi", type="primary"):
+                with st.spinner("Mensimulasikan..."):
+                    # Euler Method: dVc/dt = -Vc/τ + Vin/τ, dihitung sekaligus tanpa loop
+                    steps = int(t_max / h)
+                    t_start = time.perf_counter()
+                    t_vals, vc_vals, vc_exact, error_vals = linear_euler_trajectory(
+                        -1 / tau, Vin / tau, 0.0, h, steps
+                    )
+                    t_sim = time.perf_counter() - t_start
+                    
+                    # Solusi analitik untuk perbandingan
+                    t_analytical = np.linspace(0, t_max, 1000)
+                    vc_analytical = Vin * (1 - np.exp(-t_analytical / tau))
+                    
+                    # Untuk plot cukup ~5000 titik; error tetap dihitung di setiap langkah
+                    stride_plot = max(1, len(t_vals) // 5000)
+                    
+                    # Plot
+                    fig = go.Figure()
+                    
+                    # Simulasi Euler
+                    fig.add_trace(go.Scatter(
+                        x=t_vals[::stride_plot], y=vc_vals[::stride_plot],
+                        mode='lines',
+                        name='Euler Method (Numerik)',
+                        line=dict(color='blue', width=2)
+                    ))
+                    
+                    # Solusi analitik
+                    fig.add_trace(go.Scatter(
+                        x=t_analytical, y=vc_analytical,
+                        mode='lines',
+                        name='Solusi Analitik',
+                        line=dict(color='red', width=2, dash='dash')
+                    ))
+                    
+                    # Reference lines
+                    fig.add_hline(
+                        y=Vin,
+                        line_dash="dot",
+                        line_color="green",
+                        annotation_text=f"Vin = {Vin}V"
+                    )
+                    
+                    fig.add_hline(
+                        y=0.63 * Vin,
+                        line_dash="dot",
+                        line_color="orange",
+                        annotation_text="63% Vin"
+                    )
+                    
+                    fig.add_vline(
+                        x=tau,
+                        line_dash="dot",
+                        line_color="purple",
+                        annotation_text="τ"
+                    )
+                    
+                    fig.update_layout(
+                        title="Respon Tegangan Kapasitor vs Waktu",
+                        xaxis_title='Waktu (s)',
+                        yaxis_title='Tegangan Kapasitor Vc (V)',
+                        hovermode='x unified',
+                        height=500
+                    )
+                    
+                    st.plotly_chart(fig, use_container_width=True)
+                    
+                    # Analisis hasil
+                    st.markdown("---")
+                    st.subheader("📊 Analisis Hasil")
+                    
+                    # Hitung error
+                    max_error = np.max(error_vals)
+                    
+                    col1, col2, col3, col4 = st.columns(4)
+                    
+                    with col1:
+                        st.metric("Vc akhir (Simulasi)", f"{vc_vals[-1]:.4f} V")
+                    
+                    with col2:
+                        st.metric("Vc akhir (Teori)", f"{Vin:.4f} V")
+                    
+                    with col3:
+                        st.metric("Max Error", f"{max_error:.4f} V")
+                    
+                    with col4:
+                        st.metric("Waktu Komputasi", f"{t_sim*1000:.2f} ms", f"{steps:,} langkah", delta_color="off")
+                    
+                    # Error di setiap langkah
+                    fig_err = go.Figure()
+                    fig_err.add_trace(go.Scatter(
+                        x=t_vals[::stride_plot], y=error_vals[::stride_plot],
+                        mode='lines',
+                        name='|Euler − Analitik|',
+                        line=dict(color='red', width=2)
+                    ))
+                    fig_err.update_layout(
+                        title=f"Error Euler di Setiap Langkah (maks pada t = {t_vals[np.argmax(error_vals)]:.4f} s)",
+                        xaxis_title='Waktu (s)',
+                        yaxis_title='Error (V)',
+                        height=300
+                    )
+                    st.plotly_chart(fig_err, use_container_width=True)
+                    
+                    # Milestones
+                    st.markdown("---")
+                    st.subheader("🎯 Milestone Charging")
+                    
+                    milestones = [0.63, 0.86, 0.95, 0.98, 0.99]
+                    milestone_data = []
+                    
+                    # Event Vc = p·Vin dideteksi selama integrasi RK45; event 99% bersifat terminal
+                    events_rc = [
+                        (lambda t, y, p=percent: y[0] - p * Vin, percent == milestones[-1])
+                        for percent in milestones
+                    ]
+                    sol_rc, msg_rc = solve_ode(
+                        lambda t, y: (Vin - y) / tau,
+                        lambda t, y: np.array([[-1 / tau]]),
+                        (0, t_max), [0.0], "dopri5",
+                        rtol=1e-10, atol=1e-12 * Vin, events=events_rc
+                    )
+                    
+                    # Waktu crossing trajektori Euler: pencarian biner + interpolasi linear di dalam langkah
+                    euler_monoton = np.all(np.diff(vc_vals) >= 0)
+                    
+                    for j, percent in enumerate(milestones):
+                        target_voltage = percent * Vin
+                        if sol_rc is None or len(sol_rc["t_events"][j]) == 0:
+                            continue
+                        
+                        time_reached = sol_rc["t_events"][j][0]
+                        baris = {
+                            'Persentase': f"{percent*100:.0f}%",
+                            'Tegangan Target': f"{target_voltage:.3f} V",
+                            'Waktu Tercapai': f"{time_reached:.6f} s",
+                            'Dalam satuan τ': f"{time_reached/tau:.4f}τ",
+                            'Waktu Euler (h)': "—",
+                            'Selisih Euler': "—"
+                        }
+                        
+                        k = np.searchsorted(vc_vals, target_voltage) if euler_monoton else len(vc_vals)
+                        if 0 < k < len(vc_vals):
+                            frac = (target_voltage - vc_vals[k - 1]) / (vc_vals[k] - vc_vals[k - 1])
+                            t_euler = t_vals[k - 1] + frac * (t_vals[k] - t_vals[k - 1])
+                            baris['Waktu Euler (h)'] = f"{t_euler:.6f} s"
+                            baris['Selisih Euler'] = f"{t_euler - time_reached:+.2e} s"
+                        
+                        milestone_data.append(baris)
+                    
+                    df_milestones = pd.DataFrame(milestone_data)
+                    st.dataframe(df_milestones, use_container_width=True)
+                    
+                    if sol_rc is not None:
+                        st.caption(
+                            f"Waktu milestone dari deteksi event saat integrasi RK45 (dense output + brentq), "
+                            f"{sol_rc['n_steps']} langkah — {msg_rc}"
+                        )
+                    
+                    st.info("""
+                    💡 **Interpretasi:**
+                    - Pada t = τ: kapasitor terisi ~63%
+                    - Pada t = 2τ: kapasitor terisi ~86%
+                    - Pada t = 3τ: kapasitor terisi ~95%
+                    - Pada t = 5τ: kapasitor terisi ~99% (praktis penuh)
+                    
+                    **Metode Euler** adalah metode numerik paling sederhana untuk menyelesaikan PDB.
+                    Error berkurang dengan memperkecil time step (h).
+                    """)
         
-        if st.button("🚀 Hitung Integral", type="primary"):
-            try:
-                # Generate points
-                x_points = np.linspace(a_int, b_int, n_int + 1)
-                y_points = f_int(x_points)
-                
-                # Pastikan y_points adalah array
-                if not isinstance(y_points, np.ndarray):
-                    y_points = np.array(y_points)
-                
-                # Trapezoidal rule
-                dx = (b_int - a_int) / n_int
-                integral_result = 0.5 * dx * (y_points[0] + 2 * np.sum(y_points[1:-1]) + y_points[-1])
-                
-                # Plot
-                fig = go.Figure()
-                
-                # Function curve
-                x_smooth = np.linspace(a_int, b_int, 300)
-                y_smooth = f_int(x_smooth)
-                
-                # Pastikan y_smooth adalah array
-                if not isinstance(y_smooth, np.ndarray):
-                    y_smooth = np.array(y_smooth)
-                
-                fig.add_trace(go.Scatter(
-                    x=x_smooth, y=y_smooth,
-                    mode='lines',
-                    name='f(x)',
-                    line=dict(color='blue', width=3)
-                ))
-                
-                # Trapezoids
-                for i in range(n_int):
-                    fig.add_trace(go.Scatter(
-                        x=[x_points[i], x_points[i], x_points[i+1], x_points[i+1], x_points[i]],
-                        y=[0, float(y_points[i]), float(y_points[i+1]), 0, 0],
-                        fill='toself',
-                        fillcolor='rgba(0, 100, 200, 0.2)',
-                        line=dict(color='rgba(0, 100, 200, 0.5)', width=1),
-                        showlegend=False,
-                        hoverinfo='skip'
+        elif mode_rc == "Analisis Frekuensi (Bode)":
+            st.markdown("---")
+            st.subheader("📶 Analisis Frekuensi")
+            
+            st.markdown("""
+            <div class="concept-box">
+            <h4>🎛️ Konsep: RC sebagai Filter Low-Pass</h4>
+            
+            Untuk input sinus berfrekuensi f, tegangan kapasitor adalah input dikali fungsi transfer:
+            
+            **H(jω) = 1 / (1 + jωRC)**, dengan ω = 2πf
+            
+            - |H| ≈ 1 untuk f kecil (sinyal lolos), |H| → 0 untuk f besar (sinyal diredam)
+            - Frekuensi cutoff **f_c = 1/(2πRC)**: |H| = 1/√2 (−3 dB), fase −45°
+            
+            Respon frekuensi juga bisa diperoleh dari simulasi: FFT respon impuls (turunan respon step).
+            </div>
+            """, unsafe_allow_html=True)
+            
+            f_c_teori = 1 / (2 * np.pi * tau)
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                n_freq = st.select_slider(
+                    "Jumlah Titik Frekuensi:",
+                    options=[10**3, 10**4, 10**5, 10**6],
+                    value=10**5,
+                    format_func=lambda v: f"{v:,}",
+                    key="n_freq"
+                )
+            
+            with col2:
+                dekade = st.slider("Rentang (dekade di sekitar f_c):", 1, 6, 3, key="dekade_freq")
+            
+            if st.button("🚀 Analisis Frekuensi", type="primary", key="btn_bode"):
+                try:
+                    num_rc, den_rc = [1.0], [tau, 1.0]
+                    f_grid = np.geomspace(f_c_teori / 10**dekade, f_c_teori * 10**dekade, n_freq)
+                    
+                    t_start = time.perf_counter()
+                    H_grid = transfer_function_response(num_rc, den_rc, f_grid)
+                    t_eval = time.perf_counter() - t_start
+                    
+                    f_c_num = find_cutoff_frequency(num_rc, den_rc, f_grid, H_grid)
+                    
+                    mag_db = 20 * np.log10(np.abs(H_grid))
+                    fase = np.degrees(np.unwrap(np.angle(H_grid)))
+                    
+                    # Cross-check: FFT dari respon step Euler (h = τ/1000, durasi 50τ)
+                    h_fft = tau / 1000
+                    t_sim, vc_sim, _, _ = linear_euler_trajectory(-1 / tau, Vin / tau, 0.0, h_fft, 50000)
+                    f_fft, H_fft, impuls = fft_frequency_response(t_sim, vc_sim, Vin)
+                    
+                    rentang = (f_fft > 0) & (f_fft >= f_grid[0]) & (f_fft <= min(f_grid[-1], 10 * f_c_teori))
+                    H_fft_ref = transfer_function_response(num_rc, den_rc, f_fft[rentang])
+                    dev_db = np.max(np.abs(20 * np.log10(np.abs(H_fft[rentang]) / np.abs(H_fft_ref)))) if np.any(rentang) else np.nan
+                    
+                    st.success("✅ Analisis frekuensi selesai!")
+                    
+                    col1, col2, col3, col4 = st.columns(4)
+                    
+                    with col1:
+                        st.metric("f_c Numerik (brentq)", f"{f_c_num:.6f} Hz" if f_c_num else "—")
+                    
+                    with col2:
+                        st.metric("f_c Teori 1/(2πRC)", f"{f_c_teori:.6f} Hz")
+                    
+                    with col3:
+                        st.metric("Amplitudo Vc di f_c", f"{Vin * np.abs(transfer_function_response(num_rc, den_rc, f_c_teori)):.4f} V")
+                    
+                    with col4:
+                        st.metric("Evaluasi H", f"{t_eval*1000:.2f} ms", f"{n_freq:,} frekuensi", delta_color="off")
+                    
+                    if f_c_num:
+                        st.caption(f"Error relatif f_c: {abs(f_c_num - f_c_teori) / f_c_teori:.2e}")
+                    
+                    stride_plot = max(1, n_freq // 5000)
+                    stride_fft = max(1, int(np.sum(rentang)) // 300)
+                    
+                    # Plot magnitude
+                    fig_mag = go.Figure()
+                    fig_mag.add_trace(go.Scatter(
+                        x=f_grid[::stride_plot], y=mag_db[::stride_plot],
+                        mode='lines', name='|H| analitik', line=dict(color='blue', width=2)
+                    ))
+                    fig_mag.add_trace(go.Scatter(
+                        x=f_fft[rentang][::stride_fft], y=20 * np.log10(np.abs(H_fft[rentang][::stride_fft])),
+                        mode='markers', name='|H| dari FFT simulasi', marker=dict(color='orange', size=5)
+                    ))
+                    if f_c_num:
+                        fig_mag.add_vline(x=f_c_num, line_dash="dot", line_color="red", annotation_text="f_c")
+                    fig_mag.add_hline(y=-10 * np.log10(2), line_dash="dot", line_color="gray", annotation_text="−3 dB")
+                    fig_mag.update_layout(
+                        title="Bode Plot — Magnitude",
+                        xaxis_title='Frekuensi (Hz)',
+                        yaxis_title='|H| (dB)',
+                        xaxis_type='log',
+                        height=400
+                    )
+                    st.plotly_chart(fig_mag, use_container_width=True)
+                    
+                    # Plot fase
+                    fig_fase = go.Figure()
+                    fig_fase.add_trace(go.Scatter(
+                        x=f_grid[::stride_plot], y=fase[::stride_plot],
+                        mode='lines', name='Fase analitik', line=dict(color='green', width=2)
+                    ))
+                    fig_fase.add_trace(go.Scatter(
+                        x=f_fft[rentang][::stride_fft], y=np.degrees(np.angle(H_fft[rentang][::stride_fft])),
+                        mode='markers', name='Fase dari FFT simulasi', marker=dict(color='orange', size=5)
+                    ))
+                    fig_fase.add_hline(y=-45, line_dash="dot", line_color="gray", annotation_text="−45°")
+                    fig_fase.update_layout(
+                        title="Bode Plot — Fase",
+                        xaxis_title='Frekuensi (Hz)',
+                        yaxis_title='Fase (°)',
+                        xaxis_type='log',
+                        height=350
+                    )
+                    st.plotly_chart(fig_fase, use_container_width=True)
+                    
+                    # Respon impuls
+                    n_impuls = min(len(impuls), 10000)
+                    stride_imp = max(1, n_impuls // 2000)
+                    fig_imp = go.Figure()
+                    fig_imp.add_trace(go.Scatter(
+                        x=t_sim[:n_impuls:stride_imp], y=impuls[:n_impuls:stride_imp],
+                        mode='lines', name='Δvc/(Vin·Δt) simulasi', line=dict(color='blue', width=2)
                     ))
+                    fig_imp.add_trace(go.Scatter(
+                        x=t_sim[:n_impuls:stride_imp], y=np.exp(-t_sim[:n_impuls:stride_imp] / tau) / tau,
+                        mode='lines', name='(1/τ)·exp(−t/τ) analitik', line=dict(color='red', width=2, dash='dash')
+                    ))
+                    fig_imp.update_layout(
+                        title="Respon Impuls",
+                        xaxis_title='Waktu (s)',
+                        yaxis_title='h(t) (1/s)',
+                        height=350
+                    )
+                    st.plotly_chart(fig_imp, use_container_width=True)
+                    
+                    st.info(f"""
+                    💡 **Cross-check FFT:** respon step disimulasikan dengan Euler (h = τ/1000, 50τ), lalu
+                    FFT dari selisihnya dibandingkan dengan H(jω) analitik sampai 10·f_c.
+                    Deviasi magnitude maksimum: **{dev_db:.3e} dB**.
+                    """)
                 
-                fig.update_layout(
-                    title=f"Metode Trapesium dengan {n_int} Segmen",
-                    xaxis_title='x',
-                    yaxis_title='f(x)',
-                    hovermode='x unified',
-                    height=500
+                except Exception as e:
+                    st.error(f"❌ Error: {e}")
+        
+        elif mode_rc == "Sweep Parameter (R × C × h)":
+            st.markdown("---")
+            st.subheader("🗺️ Sweep Parameter (R × C × h)")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                R_range = st.slider("Rentang R (kΩ):", 1.0, 50.0, (1.0, 50.0), 0.5, key="R_range_sweep")
+                n_R_sweep = st.slider("Jumlah titik R:", 2, 100, 25, key="n_R_sweep")
+            
+            with col2:
+                C_range = st.slider("Rentang C (µF):", 10.0, 1000.0, (10.0, 1000.0), 10.0, key="C_range_sweep")
+                n_C_sweep = st.slider("Jumlah titik C:", 2, 100, 25, key="n_C_sweep")
+            
+            with col3:
+                h_sweep = st.multiselect(
+                    "Time step (h):",
+                    options=[0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1],
+                    default=[0.001, 0.01, 0.1],
+                    key="h_sweep"
+                )
+                Vin_sweep = st.number_input("Tegangan Input Vin (V):", value=5.0, min_value=0.1, format="%.2f", key="Vin_sweep")
+            
+            t_max_sweep = st.slider("Durasi simulasi (dalam satuan τ):", 1.0, 10.0, 5.0, 0.5, key="t_max_sweep")
+            
+            R_sweep = np.linspace(R_range[0], R_range[1], n_R_sweep) * 1000
+            C_sweep = np.linspace(C_range[0], C_range[1], n_C_sweep) * 1e-6
+            h_sweep = np.array(sorted(h_sweep))
+            
+            if h_sweep.size == 0:
+                st.warning("⚠️ Pilih minimal satu time step.")
+            else:
+                tau_grid = np.multiply.outer(R_sweep, C_sweep)
+                total_langkah = int(np.sum(np.maximum(1, (t_max_sweep * tau_grid[..., None] / h_sweep).astype(np.int64))))
+                st.caption(
+                    f"{tau_grid.size * h_sweep.size:,} kombinasi parameter, "
+                    f"total {total_langkah:,} langkah Euler dalam satu integrasi batch"
                 )
                 
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Hasil
-                st.markdown("---")
-                st.subheader("📊 Hasil Perhitungan")
+                if st.button("🚀 Jalankan Sweep", type="primary", key="btn_sweep"):
+                    if total_langkah > 1e9:
+                        st.error("❌ Error: Total langkah melebihi 10⁹. Kurangi jumlah titik atau hapus time step terkecil.")
+                    else:
+                        with st.spinner("Mensimulasikan semua kombinasi..."):
+                            t_start = time.perf_counter()
+                            sweep = rc_parameter_sweep(R_sweep, C_sweep, h_sweep, Vin_sweep, t_max_sweep)
+                            sweep["waktu"] = time.perf_counter() - t_start
+                            sweep["R"], sweep["C"], sweep["h"] = R_sweep, C_sweep, h_sweep
+                        st.session_state["rc_sweep"] = sweep
+            
+            if "rc_sweep" in st.session_state:
+                sweep = st.session_state["rc_sweep"]
                 
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
-                    st.metric("Nilai Integral", f"{integral_result:.6f}")
+                    st.metric("Kombinasi", f"{sweep['n_combo']:,}")
                 
                 with col2:
-                    st.metric("Jumlah Segmen", n_int)
+                    st.metric("Total Langkah", f"{sweep['total_steps']:,}")
                 
                 with col3:
-                    st.metric("Lebar Segmen (Δx)", f"{dx:.6f}")
+                    st.metric("Waktu Komputasi", f"{sweep['waktu']:.2f} s")
+                
+                h_tampil = st.select_slider(
+                    "Tampilkan heatmap untuk h:",
+                    options=list(sweep["h"]),
+                    key="h_tampil_sweep"
+                )
+                idx_h = list(sweep["h"]).index(h_tampil)
+                
+                sumbu_R = sweep["R"] / 1000
+                sumbu_C = sweep["C"] * 1e6
+                
+                peta = [
+                    ("log₁₀ Error Maksimum (V)", np.log10(np.maximum(sweep["max_error"][:, :, idx_h], 1e-16)), "Reds"),
+                    ("Vc Akhir (V)", sweep["vc_final"][:, :, idx_h], "Viridis"),
+                    ("Waktu 63% (s)", sweep["t_milestone"][0, :, :, idx_h], "Blues"),
+                    ("Waktu 99% (s)", sweep["t_milestone"][1, :, :, idx_h], "Blues"),
+                ]
+                
+                for baris in (peta[:2], peta[2:]):
+                    cols = st.columns(2)
+                    for col, (judul, Z, skala) in zip(cols, baris):
+                        with col:
+                            fig = go.Figure(go.Heatmap(
+                                x=sumbu_R, y=sumbu_C, z=Z.T,
+                                colorscale=skala,
+                                colorbar=dict(title="")
+                            ))
+                            fig.update_layout(
+                                title=f"{judul} — h = {h_tampil}",
+                                xaxis_title="R (kΩ)",
+                                yaxis_title="C (µF)",
+                                height=400
+                            )
+                            st.plotly_chart(fig, use_container_width=True)
+                
+                tidak_stabil = np.sum(~np.isfinite(sweep["max_error"][:, :, idx_h]) | (sweep["max_error"][:, :, idx_h] > Vin_sweep))
+                if tidak_stabil:
+                    st.warning(
+                        f"⚠️ {tidak_stabil} kombinasi tidak stabil atau berosilasi (h > τ): "
+                        "Euler eksplisit stabil hanya jika h < 2τ."
+                    )
                 
-                # Info tambahan
                 st.info("""
-                💡 **Tips:**
-                - Semakin banyak segmen → hasil semakin akurat
-                - Metode Trapesium memiliki error O(h²)
-                - Untuk fungsi yang sangat non-linear, gunakan lebih banyak segmen
+                💡 **Interpretasi:**
+                - Error Euler sebanding dengan h/τ: rangkaian dengan τ kecil (R dan C kecil) paling sensitif terhadap h
+                - Waktu 63% ≈ τ dan waktu 99% ≈ 4.6τ; penyimpangan dari nilai ini adalah error diskretisasi
+                - Sel kosong berarti milestone tidak tercapai dalam durasi simulasi
                 """)
-                
-                # Perbandingan dengan metode lain (jika memungkinkan)
+        
+        else:
+            st.markdown("---")
+            st.subheader("〰️ Sumber Gelombang (Streaming)")
+            
+            st.markdown("""
+            <div class="concept-box">
+            <h4>🔁 Konsep: Jutaan Periode tanpa Kehabisan Memori</h4>
+            
+            Input periodik (square, PWM, sinus, piecewise-linear) disimulasikan per **chunk** periode.
+            Tepi gelombang selalu jatuh tepat di titik grid sehingga tidak ada langkah yang melompati tepi.
+            Karena rangkaian RC linear, setiap langkah memakai **diskretisasi eksak** (first-order hold):
+            
+            **V_{j+1} = a_j·V_j + c_j**, dengan a_j = exp(−h_j/τ)
+            
+            Hanya statistik ringkas (ripple, rata-rata) dan envelope min/max yang disimpan.
+            </div>
+            """, unsafe_allow_html=True)
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                bentuk_gel = st.selectbox(
+                    "Bentuk Gelombang:",
+                    ["Square", "PWM", "Sinus", "Piecewise-Linear (PWL)"],
+                    key="bentuk_gel"
+                )
+                f_gel = st.number_input("Frekuensi (Hz):", value=1000.0, min_value=1e-3, format="%.3f", key="f_gel")
+            
+            with col2:
+                v_high_gel = st.number_input("Tegangan Tinggi / Puncak (V):", value=5.0, format="%.2f", key="v_high_gel")
+                v_low_gel = st.number_input("Tegangan Rendah / Lembah (V):", value=0.0, format="%.2f", key="v_low_gel")
+                if bentuk_gel == "PWM":
+                    duty_gel = st.slider("Duty Cycle:", 0.01, 0.99, 0.3, 0.01, key="duty_gel")
+                elif bentuk_gel == "Piecewise-Linear (PWL)":
+                    pwl_gel = st.text_input(
+                        "Titik PWL (fraksi periode:tegangan):",
+                        value="0:0, 0.2:5, 0.5:5, 0.7:0, 1:0",
+                        key="pwl_gel",
+                        help="Fraksi periode dari 0 sampai 1, naik, dengan tegangan di titik awal dan akhir sama"
+                    )
+            
+            with col3:
+                R_gel = st.slider("Resistansi R (kΩ):", 0.1, 50.0, 1.0, 0.1, key="R_gel") * 1000
+                C_gel = st.slider("Kapasitansi C (µF):", 0.1, 1000.0, 10.0, 0.1, key="C_gel") * 1e-6
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                n_periode_gel = st.select_slider(
+                    "Jumlah Periode:",
+                    options=[10**k for k in range(1, 8)],
+                    value=10**4,
+                    format_func=lambda v: f"{v:,}",
+                    key="n_periode_gel"
+                )
+            
+            with col2:
+                langkah_gel = st.select_slider(
+                    "Langkah per Periode:",
+                    options=[20, 50, 100, 200, 500, 1000],
+                    value=200,
+                    key="langkah_gel"
+                )
+            
+            with col3:
+                chunk_gel = st.select_slider(
+                    "Ukuran Chunk (langkah):",
+                    options=[10**k for k in range(4, 8)],
+                    value=10**6,
+                    format_func=lambda v: f"{v:,}",
+                    key="chunk_gel"
+                )
+            
+            tau_gel = R_gel * C_gel
+            periode_gel = 1 / f_gel
+            st.caption(
+                f"τ = {tau_gel:.4g} s, periode T = {periode_gel:.4g} s (T/τ = {periode_gel/tau_gel:.3g}), "
+                f"total {n_periode_gel * langkah_gel:,} langkah"
+            )
+            
+            if st.button("🚀 Jalankan Simulasi Streaming", type="primary", key="btn_gel"):
                 try:
-                    from scipy import integrate
+                    kind = {"Square": "square", "PWM": "pwm", "Sinus": "sine", "Piecewise-Linear (PWL)": "pwl"}[bentuk_gel]
+                    pwl_points = None
+                    if kind == "pwl":
+                        pwl_points = [[float(v) for v in p.split(":")] for p in pwl_gel.split(",") if p.strip()]
+                        pts = np.array(pwl_points)
+                        if pts[0, 0] != 0 or pts[-1, 0] != 1 or np.any(np.diff(pts[:, 0]) < 0):
+                            raise ValueError("Fraksi PWL harus naik dari 0 sampai 1")
                     
-                    # Wrapper untuk scipy.integrate.quad yang hanya menerima scalar
-                    def f_scalar(x_val):
-                        result = f_int(x_val)
-                        if isinstance(result, np.ndarray):
-                            return float(result[0] if len(result) > 0 else result)
-                        return float(result)
+                    t_grid, uL, uR = waveform_template(
+                        kind, periode_gel, langkah_gel, v_high_gel, v_low_gel,
+                        duty=duty_gel if kind == "pwm" else 0.5, pwl_points=pwl_points
+                    )
                     
-                    result_scipy, error = integrate.quad(f_scalar, a_int, b_int)
+                    progress_gel = st.progress(0.0)
+                    live_gel = st.empty()
+                    t_env, env_min, env_max = [], [], []
+                    t_start = time.perf_counter()
                     
-                    st.markdown("---")
-                    st.subheader("🔬 Verifikasi dengan SciPy")
+                    for ringkas in iter_waveform_simulation(
+                            t_grid, uL, uR, tau_gel, n_periode_gel, chunk_steps=chunk_gel):
+                        t_env.append(ringkas["t_env"])
+                        env_min.append(ringkas["env_min"])
+                        env_max.append(ringkas["env_max"])
+                        
+                        elapsed = time.perf_counter() - t_start
+                        progress_gel.progress(ringkas["periods_done"] / n_periode_gel)
+                        live_gel.markdown(
+                            f"**Periode {ringkas['periods_done']:,} / {n_periode_gel:,}** &nbsp; | &nbsp; "
+                            f"ripple = `{ringkas['ripple']:.4e} V` &nbsp; | &nbsp; rata-rata = `{ringkas['mean']:.6f} V` "
+                            f"&nbsp; | &nbsp; {ringkas['steps_done'] / max(elapsed, 1e-9) / 1e6:,.1f} juta langkah/s"
+                        )
                     
-                    col1, col2, col3 = st.columns(3)
+                    t_total = time.perf_counter() - t_start
+                    
+                    st.success("✅ Simulasi streaming selesai!")
+                    
+                    col1, col2, col3, col4 = st.columns(4)
                     
                     with col1:
-                        st.metric("Hasil Trapesium", f"{integral_result:.8f}")
+                        st.metric("Total Langkah", f"{ringkas['steps_done']:,}")
                     
                     with col2:
-                        st.metric("Hasil SciPy (Referensi)", f"{result_scipy:.8f}")
+                        st.metric("Throughput", f"{ringkas['steps_done'] / t_total / 1e6:,.1f} juta langkah/s")
                     
                     with col3:
-                        error_diff = abs(integral_result - result_scipy)
-                        st.metric("Selisih", f"{error_diff:.2e}")
+                        st.metric("Ripple Akhir (p-p)", f"{ringkas['ripple']:.4e} V")
                     
-                    if error_diff < 0.001:
-                        st.success("✅ Hasil sangat akurat!")
-                    elif error_diff < 0.01:
-                        st.info("✓ Hasil cukup akurat")
-                    else:
-                        st.warning("⚠️ Pertimbangkan menambah jumlah segmen untuk akurasi lebih baik")
+                    with col4:
+                        st.metric("Rata-rata Vc Akhir", f"{ringkas['mean']:.6f} V")
+                    
+                    # Jumlah periode hingga awal periode berada dalam 1% ripple dari titik tetap
+                    A_gel = ringkas["A"]
+                    jarak_awal = abs(ringkas["v_star"])
+                    batas = 0.01 * max(ringkas["ripple"], 1e-12)
+                    if jarak_awal > batas and 0 < A_gel < 1:
+                        n_ss = int(np.ceil(np.log(batas / jarak_awal) / np.log(A_gel)))
+                        st.info(f"📈 Steady state (awal periode dalam 1% ripple dari nilai akhir) tercapai setelah ±{n_ss:,} periode ({n_ss * periode_gel:.4g} s).")
+                    
+                    # Envelope seluruh simulasi
+                    fig = go.Figure()
+                    t_env = np.concatenate(t_env)
+                    fig.add_trace(go.Scatter(
+                        x=t_env, y=np.concatenate(env_max),
+                        mode='lines', name='Vc maks', line=dict(color='blue', width=1)
+                    ))
+                    fig.add_trace(go.Scatter(
+                        x=t_env, y=np.concatenate(env_min),
+                        mode='lines', name='Vc min', line=dict(color='blue', width=1),
+                        fill='tonexty', fillcolor='rgba(0, 0, 255, 0.15)'
+                    ))
+                    fig.update_layout(
+                        title="Envelope Tegangan Kapasitor (min/max per kelompok periode)",
+                        xaxis_title='Waktu (s)',
+                        yaxis_title='Vc (V)',
+                        hovermode='x unified',
+                        height=400
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                    
+                    # Periode terakhir resolusi penuh
+                    fig_last = go.Figure()
+                    t_last = t_grid + (n_periode_gel - 1) * periode_gel
+                    fig_last.add_trace(go.Scatter(
+                        x=np.repeat(t_last, 2)[1:-1], y=np.column_stack([uL, uR]).ravel(),
+                        mode='lines', name='Input u(t)', line=dict(color='gray', width=1, dash='dash')
+                    ))
+                    fig_last.add_trace(go.Scatter(
+                        x=t_last, y=ringkas["last_period"],
+                        mode='lines', name='Vc(t)', line=dict(color='red', width=2)
+                    ))
+                    fig_last.update_layout(
+                        title="Periode Terakhir (Resolusi Penuh)",
+                        xaxis_title='Waktu (s)',
+                        yaxis_title='Tegangan (V)',
+                        hovermode='x unified',
+                        height=400
+                    )
+                    st.plotly_chart(fig_last, use_container_width=True)
                 
                 except Exception as e:
-                    st.warning(f"Tidak dapat melakukan verifikasi dengan SciPy: {e}")
-            
-            except Exception as e:
-                st.error(f"❌ Error: {e}")
+                    st.error(f"❌ Error: {e}")
     
-    with tab2:
-        st.subheader("🔌 Simulasi Rangkaian RC (PDB)")
+    with tab_ode:
+        st.subheader("🧮 Solver PDB Umum")
         
         st.markdown("""
         <div class="concept-box">
-        <h4>⚡ Studi Kasus: Charging Capacitor</h4>
-        
-        **Rangkaian RC** terdiri dari resistor (R) dan kapasitor (C) yang dihubungkan seri.
-        
-        **Persamaan Diferensial:**
-        dVc/dt = (Vin - Vc) / (R×C)
+        <h4>🎯 Konsep: Satu Engine untuk Semua Rangkaian</h4>
         
-        **Dimana:**
-        - Vc = Tegangan kapasitor (V)
-        - Vin = Tegangan input (V)
-        - R = Resistansi (Ω)
-        - C = Kapasitansi (F)
-        - τ = R×C = Time constant (detik)
+        Setiap rangkaian dapat ditulis sebagai sistem orde satu **dy/dt = f(t, y)**.
+        PDB orde dua (misalnya RLC) diubah menjadi vektor state [Vc, iL].
         
-        **Interpretasi:**
-        - τ = waktu yang dibutuhkan kapasitor untuk charge ~63% dari nilai akhir
-        - Setelah 5τ, kapasitor sudah ~99% terisi penuh
+        - **Euler / Heun / RK4**: langkah tetap h, orde 1 / 2 / 4
+        - **Dormand-Prince RK45**: memilih h sendiri dari selisih solusi orde 4 dan 5; langkah ditolak jika error > toleransi
+        - **Backward Euler / BDF2**: implisit, menyelesaikan sistem nonlinear (Newton) tiap langkah.
+          Stabil untuk rangkaian **kaku (stiff)** dengan time constant yang sangat berbeda
         </div>
         """, unsafe_allow_html=True)
         
-        st.markdown("---")
-        st.subheader("⚙️ Parameter Rangkaian")
+        preset_ode = {
+            "RC Charging (orde 1)": ("(5 - vc)/(10e3*100e-6)", "vc", "0", 0.0, 5.0, 0.01),
+            "RLC Seri (orde 2 → sistem orde 1)": ("iL/100e-6\n(5 - 10*iL - vc)/10e-3", "vc, iL", "0, 0", 0.0, 0.02, 1e-5),
+            "Osilator Van der Pol (μ = 5)": ("y2\n5*(1 - y1**2)*y2 - y1", "y1, y2", "2, 0", 0.0, 30.0, 0.01),
+            "Rangkaian Kaku (τ₁ = 1 ms, τ₂ = 1 s)": ("(5 - v1)/1e-3 - (v1 - v2)/1e-3\n(v1 - v2)/1.0", "v1, v2", "0, 0", 0.0, 5.0, 0.05),
+            "Kustom": ("-2*y + sin(t)", "y", "1", 0.0, 10.0, 0.01),
+        }
         
-        col1, col2, col3 = st.columns(3)
+        nama_preset = st.selectbox("Contoh Sistem:", list(preset_ode.keys()), key="preset_ode")
+        eq_default, state_default, y0_default, t0_default, t1_default, h_default = preset_ode[nama_preset]
+        
+        col1, col2 = st.columns([3, 1])
         
         with col1:
-            R = st.slider("Resistansi R (kΩ):", 1.0, 50.0, 10.0, 0.5) * 1000  # Convert to Ω
+            eq_ode = st.text_area(
+                "dy/dt = f(t, y) (satu persamaan per baris):",
+                value=eq_default,
+                height=100,
+                key=f"eq_ode_{nama_preset}"
+            )
+            state_ode = st.text_input("Variabel state (pisahkan dengan koma):", value=state_default, key=f"state_ode_{nama_preset}")
+            y0_ode_input = st.text_input("Nilai awal y(t₀) (pisahkan dengan koma):", value=y0_default, key=f"y0_ode_{nama_preset}")
         
         with col2:
-            C = st.slider("Kapasitansi C (µF):", 10.0, 1000.0, 100.0, 10.0) * 1e-6  # Convert to F
+            t0_ode = st.number_input("t₀:", value=t0_default, format="%.4f", key=f"t0_ode_{nama_preset}")
+            t1_ode = st.number_input("t akhir:", value=t1_default, format="%.4f", key=f"t1_ode_{nama_preset}")
         
-        with col3:
-            Vin = st.number_input("Tegangan Input Vin (V):", value=5.0, min_value=0.1, format="%.2f")
-        
-        # Hitung time constant
-        tau = R * C
+        variabel_ode = tuple(v.strip() for v in state_ode.split(',') if v.strip())
+        baris_ode = [s.strip() for s in eq_ode.strip().splitlines() if s.strip()]
         
-        col1, col2 = st.columns(2)
+        col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.metric("Time Constant (τ)", f"{tau:.4f} s")
+            metode_ode = st.selectbox("Metode:", list(ODE_METHODS.keys()), index=3, key="metode_ode")
         
         with col2:
-            st.metric("Waktu untuk 99% charge (≈5τ)", f"{5*tau:.4f} s")
+            h_ode = st.number_input(
+                "Langkah h (metode langkah tetap):",
+                value=h_default,
+                min_value=1e-7,
+                format="%.2e",
+                key=f"h_ode_{nama_preset}"
+            )
         
-        # Parameter simulasi
-        st.markdown("---")
-        st.subheader("🎮 Parameter Simulasi")
+        with col3:
+            rtol_ode = st.number_input("Toleransi relatif (RK45):", value=1e-6, min_value=1e-13, format="%.1e", key="rtol_ode")
+            atol_ode = st.number_input("Toleransi absolut (RK45):", value=1e-9, min_value=1e-15, format="%.1e", key="atol_ode")
         
-        col1, col2 = st.columns(2)
+        col1, col2 = st.columns([3, 1])
         
         with col1:
-            t_max_factor = st.slider("Durasi simulasi (dalam satuan τ):", 1.0, 10.0, 5.0, 0.5)
-            t_max = t_max_factor * tau
+            event_ode = st.text_area(
+                "Event g(t, y) = 0 (opsional, satu per baris):",
+                value="",
+                height=70,
+                key="event_ode",
+                help="Contoh: vc - 0.99*5 untuk waktu Vc mencapai 99% dari 5 V"
+            )
         
         with col2:
-            h = st.select_slider(
-                "Time step (h):",
-                options=[0.001, 0.005, 0.01, 0.05, 0.1],
-                value=0.01
-            )
+            terminal_ode = st.checkbox("Berhenti pada event pertama (terminal)", value=False, key="terminal_ode")
+            bandingkan_ode = st.checkbox("Bandingkan semua metode", value=False, key="bandingkan_ode")
+            referensi_ode = st.checkbox("Galat sebenarnya (referensi mpmath)", value=True, key="referensi_ode")
         
-        if st.button("🚀 Jalankan Simulasi", type="primary"):
-            with st.spinner("Mensimulasikan..."):
-                # Euler Method
-                steps = int(t_max / h)
-                t_vals = np.zeros(steps + 1)
-                vc_vals = np.zeros(steps + 1)
-                
-                vc = 0  # Initial condition
-                t = 0
-                
-                for i in range(steps):
-                    t_vals[i] = t
-                    vc_vals[i] = vc
-                    
-                    # Euler update
-                    dvc_dt = (Vin - vc) / tau
-                    vc = vc + dvc_dt * h
-                    t = t + h
-                
-                t_vals[-1] = t
-                vc_vals[-1] = vc
-                
-                # Solusi analitik untuk perbandingan
-                t_analytical = np.linspace(0, t_max, 1000)
-                vc_analytical = Vin * (1 - np.exp(-t_analytical / tau))
-                
-                # Plot
-                fig = go.Figure()
-                
-                # Simulasi Euler
-                fig.add_trace(go.Scatter(
-                    x=t_vals, y=vc_vals,
-                    mode='lines',
-                    name='Euler Method (Numerik)',
-                    line=dict(color='blue', width=2)
-                ))
-                
-                # Solusi analitik
-                fig.add_trace(go.Scatter(
-                    x=t_analytical, y=vc_analytical,
-                    mode='lines',
-                    name='Solusi Analitik',
-                    line=dict(color='red', width=2, dash='dash')
-                ))
-                
-                # Reference lines
-                fig.add_hline(
-                    y=Vin,
-                    line_dash="dot",
-                    line_color="green",
-                    annotation_text=f"Vin = {Vin}V"
-                )
-                
-                fig.add_hline(
-                    y=0.63 * Vin,
-                    line_dash="dot",
-                    line_color="orange",
-                    annotation_text="63% Vin"
-                )
-                
-                fig.add_vline(
-                    x=tau,
-                    line_dash="dot",
-                    line_color="purple",
-                    annotation_text="τ"
-                )
-                
-                fig.update_layout(
-                    title="Respon Tegangan Kapasitor vs Waktu",
-                    xaxis_title='Waktu (s)',
-                    yaxis_title='Tegangan Kapasitor Vc (V)',
-                    hovermode='x unified',
-                    height=500
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Analisis hasil
-                st.markdown("---")
-                st.subheader("📊 Analisis Hasil")
-                
-                # Hitung error
-                vc_analytical_at_points = Vin * (1 - np.exp(-t_vals / tau))
-                max_error = np.max(np.abs(vc_vals - vc_analytical_at_points))
-                
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    st.metric("Vc akhir (Simulasi)", f"{vc_vals[-1]:.4f} V")
-                
-                with col2:
-                    st.metric("Vc akhir (Teori)", f"{Vin:.4f} V")
+        baris_event_ode = [s.strip() for s in event_ode.strip().splitlines() if s.strip()]
+        
+        if st.button("🚀 Selesaikan PDB", type="primary", key="btn_ode"):
+            ekspresi_ode = [parse_sympy_expression(s, ("t", *variabel_ode)) for s in baris_ode]
+            ekspresi_event = [parse_sympy_expression(s, ("t", *variabel_ode)) for s in baris_event_ode]
+            
+            try:
+                y0_ode = np.array([float(v.strip()) for v in y0_ode_input.split(',')])
+            except ValueError as e:
+                y0_ode = None
+                st.error(f"❌ Error parsing nilai awal: {e}")
+            
+            if len(baris_ode) != len(variabel_ode):
+                st.error(f"❌ Jumlah persamaan ({len(baris_ode)}) harus sama dengan jumlah variabel state ({len(variabel_ode)})!")
+            elif any(e is None for e in ekspresi_ode + ekspresi_event):
+                st.warning("⚠️ Mohon perbaiki rumus persamaan sebelum melanjutkan.")
+            elif y0_ode is not None and len(y0_ode) != len(variabel_ode):
+                st.error("❌ Jumlah nilai awal harus sama dengan jumlah variabel state!")
+            elif y0_ode is not None:
+                f_ode, J_ode = build_ode_system(ekspresi_ode, variabel_ode)
+                events_ode = []
+                for expr in ekspresi_event:
+                    g_num = sp.lambdify((sp.Symbol("t"), *sp.symbols(variabel_ode)), expr, 'numpy')
+                    events_ode.append((lambda t, y, g_num=g_num: float(g_num(t, *y)), terminal_ode))
                 
-                with col3:
-                    st.metric("Max Error", f"{max_error:.4f} V")
+                daftar_metode = list(ODE_METHODS.keys()) if bandingkan_ode else [metode_ode]
+                hasil_ode = {}
+                ringkasan_ode = []
                 
-                # Milestones
-                st.markdown("---")
-                st.subheader("🎯 Milestone Charging")
-                
-                milestones = [0.63, 0.86, 0.95, 0.98, 0.99]
-                milestone_data = []
-                
-                for percent in milestones:
-                    target_voltage = percent * Vin
-                    # Find time when this voltage is reached
-                    idx = np.argmax(vc_vals >= target_voltage)
-                    if idx > 0:
-                        time_reached = t_vals[idx]
-                        milestone_data.append({
-                            'Persentase': f"{percent*100:.0f}%",
-                            'Tegangan Target': f"{target_voltage:.3f} V",
-                            'Waktu Tercapai': f"{time_reached:.4f} s",
-                            'Dalam satuan τ': f"{time_reached/tau:.2f}τ"
-                        })
+                with st.spinner("Mengintegrasikan..."):
+                    for nama in daftar_metode:
+                        t_start = time.perf_counter()
+                        with np.errstate(over='ignore', invalid='ignore'):
+                            sol, msg = solve_ode(
+                                f_ode, J_ode, (t0_ode, t1_ode), y0_ode, ODE_METHODS[nama],
+                                h=h_ode, rtol=rtol_ode, atol=atol_ode, events=events_ode
+                            )
+                        t_run = time.perf_counter() - t_start
+                        hasil_ode[nama] = (sol, msg)
+                        
+                        if sol is not None:
+                            ringkasan_ode.append({
+                                "Metode": nama,
+                                "Status": msg,
+                                "Langkah": sol["n_steps"],
+                                "Langkah Ditolak": sol["n_rejected"],
+                                "Evaluasi f": sol["n_fev"],
+                                "Evaluasi Jacobian": sol["n_jev"],
+                                "Waktu (ms)": t_run * 1000,
+                                **{f"{v}(t akhir)": sol["y"][-1, k] for k, v in enumerate(variabel_ode)},
+                            })
                 
-                df_milestones = pd.DataFrame(milestone_data)
-                st.dataframe(df_milestones, use_container_width=True)
+                sol, msg = hasil_ode[metode_ode]
+                ref_ode = None
                 
-                st.info("""
-                💡 **Interpretasi:**
-                - Pada t = τ: kapasitor terisi ~63%
-                - Pada t = 2τ: kapasitor terisi ~86%
-                - Pada t = 3τ: kapasitor terisi ~95%
-                - Pada t = 5τ: kapasitor terisi ~99% (praktis penuh)
+                if sol is None:
+                    st.error(msg)
+                else:
+                    if msg.startswith("✅"):
+                        st.success(msg)
+                    else:
+                        st.warning(msg)
+                    
+                    col1, col2, col3, col4 = st.columns(4)
+                    
+                    with col1:
+                        st.metric("Langkah Diterima", f"{sol['n_steps']:,}")
+                    
+                    with col2:
+                        st.metric("Langkah Ditolak", f"{sol['n_rejected']:,}")
+                    
+                    with col3:
+                        st.metric("Evaluasi f", f"{sol['n_fev']:,}")
+                    
+                    with col4:
+                        if len(sol["h"]):
+                            st.metric("Rentang h", f"{sol['h'].min():.1e} – {sol['h'].max():.1e}")
+                    
+                    # Galat sebenarnya nilai akhir terhadap referensi mpmath (deret Taylor)
+                    if referensi_ode:
+                        try:
+                            with st.spinner("Menghitung referensi presisi tinggi (mpmath.odefun, hanya sekali per masalah)..."):
+                                ref_ode, dari_cache = precise_ode_end(
+                                    ekspresi_ode, variabel_ode, (t0_ode, sol["t"][-1]), y0_ode
+                                )
+                            galat_ode = [true_error(sol["y"][-1, k], ref_ode[k]) for k in range(len(variabel_ode))]
+                            df_ref_ode = pd.DataFrame({
+                                "State": variabel_ode,
+                                f"Numerik (t = {sol['t'][-1]:.6g})": sol["y"][-1],
+                                "Referensi (mpmath)": [mpmath.nstr(r, 15) for r in ref_ode],
+                                "Galat Absolut": [g[0] for g in galat_ode],
+                                "Galat Relatif (%)": [g[1] for g in galat_ode],
+                            })
+                            st.dataframe(df_ref_ode.style.format({
+                                f"Numerik (t = {sol['t'][-1]:.6g})": "{:.10g}",
+                                "Galat Absolut": "{:.3e}",
+                                "Galat Relatif (%)": "{:.3e}",
+                            }), use_container_width=True)
+                            st.caption(f"Referensi {'dari cache disk' if dari_cache else 'dihitung dan disimpan ke cache disk'}")
+                        except (ValueError, TypeError, ZeroDivisionError) as e:
+                            ref_ode = None
+                            st.caption(f"Referensi presisi tinggi tidak tersedia: {e}")
+                    
+                    # Plot solusi setiap state
+                    stride_plot = max(1, len(sol["t"]) // 5000)
+                    adaptif = ODE_METHODS[metode_ode] == "dopri5"
+                    
+                    fig = go.Figure()
+                    for k, v in enumerate(variabel_ode):
+                        fig.add_trace(go.Scatter(
+                            x=sol["t"][::stride_plot], y=sol["y"][::stride_plot, k],
+                            mode='lines+markers' if adaptif and len(sol["t"]) < 500 else 'lines',
+                            name=v,
+                            marker=dict(size=4)
+                        ))
+                    fig.update_layout(
+                        title=f"Solusi PDB ({metode_ode})",
+                        xaxis_title='t',
+                        yaxis_title='y(t)',
+                        hovermode='x unified',
+                        height=450
+                    )
+                    
+                    for t_ev in np.concatenate(sol["t_events"]) if events_ode else []:
+                        fig.add_vline(x=t_ev, line_dash="dot", line_color="orange")
+                    
+                    st.plotly_chart(fig, use_container_width=True)
+                    
+                    if events_ode:
+                        st.subheader("🎯 Event Terdeteksi")
+                        data_event = [
+                            {"Event": baris_event_ode[i], "t": t_ev,
+                             **{v: y_ev[k] for k, v in enumerate(variabel_ode)}}
+                            for i in range(len(events_ode))
+                            for t_ev, y_ev in zip(sol["t_events"][i], sol["y_events"][i])
+                        ]
+                        if data_event:
+                            df_event = pd.DataFrame(data_event).sort_values("t")
+                            st.dataframe(
+                                df_event.style.format({"t": "{:.10g}", **{v: "{:.6g}" for v in variabel_ode}}),
+                                use_container_width=True
+                            )
+                        else:
+                            st.info("Tidak ada event yang terjadi dalam rentang integrasi.")
+                    
+                    if adaptif and len(sol["h"]):
+                        fig_h = go.Figure()
+                        fig_h.add_trace(go.Scatter(
+                            x=sol["t"][1:], y=sol["h"],
+                            mode='lines+markers',
+                            name='h',
+                            line=dict(color='purple', width=2),
+                            marker=dict(size=3)
+                        ))
+                        fig_h.update_layout(
+                            title="Ukuran Langkah Adaptif",
+                            xaxis_title='t',
+                            yaxis_title='h',
+                            yaxis_type='log',
+                            height=300
+                        )
+                        st.plotly_chart(fig_h, use_container_width=True)
                 
-                **Metode Euler** adalah metode numerik paling sederhana untuk menyelesaikan PDB.
-                Error berkurang dengan memperkecil time step (h).
-                """)
+                if bandingkan_ode:
+                    st.subheader("📋 Perbandingan Metode")
+                    
+                    for nama, (sol_k, msg_k) in hasil_ode.items():
+                        if sol_k is None:
+                            st.error(f"{nama}: {msg_k}")
+                    
+                    df_ode = pd.DataFrame(ringkasan_ode)
+                    if ref_ode is not None:
+                        # Galat hanya bermakna untuk run yang berakhir di t yang sama dengan referensi
+                        df_ode["Galat Maks vs Referensi"] = [
+                            max(true_error(sol_k["y"][-1, k], ref_ode[k])[0] for k in range(len(variabel_ode)))
+                            if sol_k["t"][-1] == sol["t"][-1] else np.nan
+                            for sol_k, _ in hasil_ode.values() if sol_k is not None
+                        ]
+                    st.dataframe(
+                        df_ode.style.format({
+                            "Waktu (ms)": "{:.2f}",
+                            "Galat Maks vs Referensi": "{:.3e}",
+                            **{f"{v}(t akhir)": "{:.6g}" for v in variabel_ode},
+                        }),
+                        use_container_width=True
+                    )
+                    st.caption(
+                        "Metode eksplisit pada rangkaian kaku membutuhkan h lebih kecil dari time constant tercepat "
+                        "agar stabil; metode implisit tetap stabil dengan h besar."
+                    )
 
 # --- FOOTER ---
 st.sidebar.markdown("---")